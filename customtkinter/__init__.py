@@ -1,83 +1,106 @@
 __version__ = "4.6.3"
 
-import os
-import sys
-from tkinter.constants import *
-from tkinter import StringVar, IntVar, DoubleVar, BooleanVar
-
-# import manager classes
-from .settings import Settings
-from .appearance_mode_tracker import AppearanceModeTracker
-from .theme_manager import ThemeManager
-from .scaling_tracker import ScalingTracker
-from .font_manager import FontManager
-from .draw_engine import DrawEngine
-
-AppearanceModeTracker.init_appearance_mode()
-
-# load default blue theme
-try:
-    ThemeManager.load_theme("blue")
-except FileNotFoundError as err:
-    raise FileNotFoundError(f"{err}\n\nThe .json theme file for CustomTkinter could not be found.\n" +
-                            f"If packaging with pyinstaller was used, have a look at the wiki:\n" +
-                            f"https://github.com/TomSchimansky/CustomTkinter/wiki/Packaging#windows-pyinstaller-auto-py-to-exe")
-
-FontManager.init_font_manager()
-
-# determine draw method based on current platform
-if sys.platform == "darwin":
-    DrawEngine.preferred_drawing_method = "polygon_shapes"
-else:
-    DrawEngine.preferred_drawing_method = "font_shapes"
-
-if sys.platform.startswith("win") and sys.getwindowsversion().build < 9000:  # No automatic scaling on Windows < 8.1
-    ScalingTracker.deactivate_automatic_dpi_awareness = True
-
-# load Roboto fonts (used on Windows/Linux)
-script_directory = os.path.dirname(os.path.abspath(__file__))
-FontManager.load_font(os.path.join(script_directory, "assets", "fonts", "Roboto", "Roboto-Regular.ttf"))
-FontManager.load_font(os.path.join(script_directory, "assets", "fonts", "Roboto", "Roboto-Medium.ttf"))
-
-# load font necessary for rendering the widgets (used on Windows/Linux)
-if FontManager.load_font(os.path.join(script_directory, "assets", "fonts", "CustomTkinter_shapes_font.otf")) is False:
-    # change draw method if font loading failed
-    if DrawEngine.preferred_drawing_method == "font_shapes":
-        sys.stderr.write("customtkinter.__init__ warning: " +
-                         "Preferred drawing method 'font_shapes' can not be used because the font file could not be loaded.\n" +
-                         "Using 'circle_shapes' instead. The rendering quality will be bad!")
-        DrawEngine.preferred_drawing_method = "circle_shapes"
-
-# import widgets
-from .widgets.widget_base_class import CTkBaseClass
-from .widgets.ctk_button import CTkButton
-from .widgets.ctk_checkbox import CTkCheckBox
-from .widgets.ctk_entry import CTkEntry
-from .widgets.ctk_slider import CTkSlider
-from .widgets.ctk_frame import CTkFrame
-from .widgets.ctk_progressbar import CTkProgressBar
-from .widgets.ctk_label import CTkLabel
-from .widgets.ctk_radiobutton import CTkRadioButton
-from .widgets.ctk_canvas import CTkCanvas
-from .widgets.ctk_switch import CTkSwitch
-from .widgets.ctk_optionmenu import CTkOptionMenu
-from .widgets.ctk_combobox import CTkComboBox
-from .widgets.ctk_scrollbar import CTkScrollbar
-from .widgets.ctk_textbox import CTkTextbox
-
-# import windows
-from .windows.ctk_tk import CTk
-from .windows.ctk_toplevel import CTkToplevel
-from .windows.ctk_input_dialog import CTkInputDialog
+import importlib
+
+# public names and the modules they are defined in, the modules are imported on first access of a name (PEP 562),
+# so that 'import customtkinter' only defines names and the initialisation runs when the first window is created
+_lazy_imports = {
+    # tkinter variables
+    "StringVar": "tkinter",
+    "IntVar": "tkinter",
+    "DoubleVar": "tkinter",
+    "BooleanVar": "tkinter",
+
+    # manager classes
+    "Settings": ".settings",
+    "AppearanceModeTracker": ".appearance_mode_tracker",
+    "AppearanceModeListener": ".appearance_mode_listener",
+    "GSettingsAppearanceModeListener": ".appearance_mode_listener",
+    "DarkdetectAppearanceModeListener": ".appearance_mode_listener",
+    "ManualAppearanceModeListener": ".appearance_mode_listener",
+    "ThemeManager": ".theme_manager",
+    "ColorManager": ".color_manager",
+    "ScalingTracker": ".scaling_tracker",
+    "FontManager": ".font_manager",
+    "DrawEngine": ".draw_engine",
+    "TrackerStatistics": ".tracker_statistics",
+
+    # widgets
+    "CTkBaseClass": ".widgets.widget_base_class",
+    "CTkButton": ".widgets.ctk_button",
+    "CTkCheckBox": ".widgets.ctk_checkbox",
+    "CTkEntry": ".widgets.ctk_entry",
+    "CTkSlider": ".widgets.ctk_slider",
+    "CTkFrame": ".widgets.ctk_frame",
+    "CTkProgressBar": ".widgets.ctk_progressbar",
+    "CTkLabel": ".widgets.ctk_label",
+    "CTkRadioButton": ".widgets.ctk_radiobutton",
+    "CTkCanvas": ".widgets.ctk_canvas",
+    "CTkSwitch": ".widgets.ctk_switch",
+    "CTkOptionMenu": ".widgets.ctk_optionmenu",
+    "CTkComboBox": ".widgets.ctk_combobox",
+    "CTkScrollbar": ".widgets.ctk_scrollbar",
+    "CTkTextbox": ".widgets.ctk_textbox",
+    "CTkHighlighter": ".widgets.ctk_highlighter",
+    "CTkRegexHighlighter": ".widgets.ctk_highlighter",
+    "CTkListView": ".widgets.ctk_list_view",
+    "CTkTable": ".widgets.ctk_table",
+    "CTkSurface": ".widgets.ctk_surface",
+    "CTkVirtualButton": ".widgets.ctk_virtual_widgets",
+    "CTkVirtualLabel": ".widgets.ctk_virtual_widgets",
+    "CTkVirtualCheckBox": ".widgets.ctk_virtual_widgets",
+    "CTkVirtualSwitch": ".widgets.ctk_virtual_widgets",
+
+    # windows
+    "CTk": ".windows.ctk_tk",
+    "CTkToplevel": ".windows.ctk_toplevel",
+    "CTkInputDialog": ".windows.ctk_input_dialog",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_imports:
+        value = getattr(importlib.import_module(_lazy_imports[name], __name__), name)
+
+    elif name == "__all__":  # used by 'from customtkinter import *'
+        import tkinter.constants
+        value = [n for n in globals() if not n.startswith("_") and n != "importlib"] + list(_lazy_imports) + \
+                [n for n in dir(tkinter.constants) if not n.startswith("_")]
+
+    elif not name.startswith("_"):
+        try:
+            value = importlib.import_module(f".{name}", __name__)  # submodules like customtkinter.widgets
+        except ModuleNotFoundError as err:
+            if err.name != f"{__name__}.{name}":
+                raise
+            import tkinter.constants  # tkinter constants like customtkinter.END
+            if not hasattr(tkinter.constants, name):
+                raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+            value = getattr(tkinter.constants, name)
+
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value  # following accesses don't call __getattr__ anymore
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
 
 
 def set_appearance_mode(mode_string: str):
     """ possible values: light, dark, system """
+    from .appearance_mode_tracker import AppearanceModeTracker
     AppearanceModeTracker.set_appearance_mode(mode_string)
 
 
 def get_appearance_mode() -> str:
     """ get current state of the appearance mode (light or dark) """
+    from .appearance_mode_tracker import AppearanceModeTracker
+    from .initialization import initialize
+    initialize()  # detects the system appearance mode if no window was created yet
+
     if AppearanceModeTracker.appearance_mode == 0:
         return "Light"
     elif AppearanceModeTracker.appearance_mode == 1:
@@ -86,24 +109,53 @@ def get_appearance_mode() -> str:
 
 def set_default_color_theme(color_string: str):
     """ set color theme or load custom theme file by passing the path """
-    ThemeManager.load_theme(color_string)
+    from .theme_manager import ThemeManager
+    ThemeManager.set_default_theme(color_string)
 
 
 def set_widget_scaling(scaling_value: float):
     """ set scaling for the widget dimensions """
+    from .scaling_tracker import ScalingTracker
     ScalingTracker.set_widget_scaling(scaling_value)
 
 
 def set_spacing_scaling(scaling_value: float):
     """ set scaling for geometry manager calls (place, pack, grid)"""
+    from .scaling_tracker import ScalingTracker
     ScalingTracker.set_spacing_scaling(scaling_value)
 
 
 def set_window_scaling(scaling_value: float):
     """ set scaling for window dimensions """
+    from .scaling_tracker import ScalingTracker
     ScalingTracker.set_window_scaling(scaling_value)
 
 
 def deactivate_automatic_dpi_awareness():
     """ deactivate DPI awareness of current process (windll.shcore.SetProcessDpiAwareness(0)) """
+    from .scaling_tracker import ScalingTracker
     ScalingTracker.deactivate_automatic_dpi_awareness = False
+
+
+def batch(master):
+    """ with customtkinter.batch(root): all draws of the CTk widgets inside master are done once at the end of the block """
+    from .widgets.widget_base_class import CTkBaseClass
+    return CTkBaseClass.batch_master(master)
+
+
+def get_tracker_stats() -> dict:
+    """ dispatch times and failures of the appearance mode and scaling callbacks, grouped by widget class """
+    from .tracker_statistics import TrackerStatistics
+    return TrackerStatistics.get_statistics()
+
+
+def reset_tracker_stats():
+    """ reset all statistics collected by get_tracker_stats() """
+    from .tracker_statistics import TrackerStatistics
+    TrackerStatistics.reset()
+
+
+def set_tracker_log_hook(log_hook):
+    """ log_hook gets called with a dict for every failed callback and every finished dispatch pass, None removes it """
+    from .tracker_statistics import TrackerStatistics
+    TrackerStatistics.log_hook = log_hook
@@ -0,0 +1,144 @@
+import abc
+import sys
+import shutil
+import threading
+import subprocess
+from typing import Callable, Union
+
+
+class AppearanceModeListener(abc.ABC):
+    """ Base class of push-based backends for system appearance mode detection.
+        A listener runs in a daemon thread and calls the callback with "Light" or "Dark"
+        whenever the system reports a change. The callback is called from the listener thread,
+        so it must not touch any tkinter objects. """
+
+    def __init__(self):
+        self.thread: Union[threading.Thread, None] = None
+        self.running = False
+        self.callback: Union[Callable[[str], None], None] = None
+
+    def start(self, callback: Callable[[str], None]):
+        self.running = True
+        self.callback = callback
+
+        # a thread which is still alive after stop() is used again instead of starting a second one
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run_thread, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.running = False
+
+    def is_alive(self) -> bool:
+        return self.running and self.thread is not None and self.thread.is_alive()
+
+    def report_mode(self, mode_string: str):
+        if self.running and self.callback is not None:
+            self.callback(mode_string)
+
+    def run_thread(self):
+        try:
+            self.listen()
+        except Exception as err:
+            sys.stderr.write(f"customtkinter.AppearanceModeListener warning: listener stopped, falling back to polling ({err})\n")
+        finally:
+            self.running = False
+
+    @abc.abstractmethod
+    def listen(self):
+        """ blocking listen loop, reports changes with report_mode() """
+
+
+class GSettingsAppearanceModeListener(AppearanceModeListener):
+    """ Linux backend, reads the output of 'gsettings monitor' for the freedesktop color-scheme and
+        the older gtk-theme key, so only one subprocess runs for the whole lifetime of the app.
+        color-scheme decides the mode, gtk-theme is only used while color-scheme is 'default' or missing. """
+
+    monitored_keys = ("color-scheme", "gtk-theme")
+
+    def __init__(self):
+        super().__init__()
+        self.process: Union[subprocess.Popen, None] = None
+        self.key_values = {}  # last values of the monitored keys
+
+    @staticmethod
+    def is_available() -> bool:
+        return sys.platform.startswith("linux") and shutil.which("gsettings") is not None
+
+    def stop(self):
+        super().stop()
+        if self.process is not None:
+            self.process.terminate()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=1)  # the thread ends with the process, so start() doesn't find it alive
+
+    @staticmethod
+    def read_key(key: str) -> Union[str, None]:
+        try:
+            return subprocess.run(("gsettings", "get", "org.gnome.desktop.interface", key),
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                  universal_newlines=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None  # color-scheme doesn't exist before GNOME 42
+
+    def get_mode(self) -> str:
+        color_scheme = (self.key_values.get("color-scheme") or "").lower()
+        if "prefer-dark" in color_scheme:
+            return "Dark"
+        elif "prefer-light" in color_scheme:
+            return "Light"
+        return "Dark" if "-dark" in (self.key_values.get("gtk-theme") or "").lower() else "Light"
+
+    def listen(self):
+        self.key_values = {key: self.read_key(key) for key in self.monitored_keys}
+
+        self.process = subprocess.Popen(("gsettings", "monitor", "org.gnome.desktop.interface"),
+                                        stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL,
+                                        universal_newlines=True)
+        with self.process:
+            for line in self.process.stdout:
+                if not self.running:
+                    break
+
+                # output lines have the format: "<key>: '<value>'"
+                key, _, value = line.strip().partition(": ")
+                if key in self.monitored_keys:
+                    self.key_values[key] = value
+                    self.report_mode(self.get_mode())
+
+
+class DarkdetectAppearanceModeListener(AppearanceModeListener):
+    """ backend for darkdetect.listener(), which is available in darkdetect >= 0.6.
+        darkdetect.listener() blocks forever, so the thread can't be stopped: stop() only mutes
+        the reports and start() after stop() continues to use the same thread. """
+
+    @staticmethod
+    def is_available() -> bool:
+        try:
+            import darkdetect
+            return hasattr(darkdetect, "listener")
+        except ImportError:
+            return False
+
+    def listen(self):
+        import darkdetect
+        darkdetect.listener(self.report_mode)
+
+
+class ManualAppearanceModeListener(AppearanceModeListener):
+    """ local stand-in backend without any system access, changes get reported by calling report(),
+        used for testing and by applications with their own appearance detection """
+
+    def start(self, callback: Callable[[str], None]):
+        self.running = True
+        self.callback = callback
+
+    def is_alive(self) -> bool:
+        return self.running
+
+    def listen(self):
+        pass  # no thread, changes get reported by report()
+
+    def report(self, mode_string: str):
+        self.report_mode("Dark" if mode_string.lower() == "dark" else "Light")
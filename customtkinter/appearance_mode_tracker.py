@@ -1,19 +1,10 @@
 import sys
 import tkinter
-from distutils.version import StrictVersion as Version
-from typing import Callable
+from typing import Callable, Union
 
-try:
-    import darkdetect
-
-    if Version(darkdetect.__version__) < Version("0.3.1"):
-        sys.stderr.write("WARNING: You have to upgrade the darkdetect library: pip3 install --upgrade darkdetect\n")
-        if sys.platform != "darwin":
-            exit()
-except ImportError as err:
-    raise err
-except Exception:
-    sys.stderr.write("customtkinter.appearance_mode_tracker warning: failed to import darkdetect")
+from .appearance_mode_listener import AppearanceModeListener, GSettingsAppearanceModeListener, DarkdetectAppearanceModeListener
+from .tracker_statistics import TrackerStatistics
+from .version_utils import parse_version
 
 
 class AppearanceModeTracker:
@@ -23,9 +14,25 @@ class AppearanceModeTracker:
     update_loop_running = False
     update_loop_interval = 500  # milliseconds
 
+    darkdetect = None  # imported on the first detection, so that importing customtkinter stays fast
+
+    # optional push-based backend for system appearance changes, polling of darkdetect.theme() is the fallback
+    listener: Union[AppearanceModeListener, None] = None
+    listener_enabled = True  # create default listener for the current platform if no listener is set
+    listener_reported_mode: Union[int, None] = None  # written by the listener thread, applied on the tkinter thread
+    listener_update_loop_interval = 100  # milliseconds, only reads listener_reported_mode, no system call
+
     appearance_mode_set_by = "system"
     appearance_mode = 0  # Light (standard)
 
+    # widgets that are not viewable (withdrawn windows, hidden frames) get redrawn on their next <Map> event
+    lazy_update_enabled = True
+    stale_callbacks = {}  # contains widgets as keys and their callbacks which still have to be called with the current mode
+    stale_widgets = {}  # contains master paths as keys and dicts with the paths of their stale children and the children as values
+    mapped_widget_paths = set()  # paths of widgets that got mapped since the last update_stale_callbacks() call
+    map_event_bindings = {}  # contains tkinter.Tk objects as keys and the funcid of the <Map> binding on the 'all' tag
+    stale_update_scheduled = False
+
     @classmethod
     def init_appearance_mode(cls):
         if cls.appearance_mode_set_by == "system":
@@ -45,24 +52,91 @@ class AppearanceModeTracker:
                 cls.app_list.append(app)
 
                 if not cls.update_loop_running:
-                    app.after(cls.update_loop_interval, cls.update)
+                    cls.start_listener()
+                    app.after(cls.get_update_loop_interval(), cls.update)
                     cls.update_loop_running = True
 
     @classmethod
     def remove(cls, callback: Callable):
+        cls.discard_stale_widget(getattr(callback, "__self__", None))
+
         try:
             cls.callback_list.remove(callback)
         except ValueError:
             return
 
     @staticmethod
-    def detect_appearance_mode() -> int:
-        try:
-            if darkdetect.theme() == "Dark":
-                return 1  # Dark
-            else:
-                return 0  # Light
-        except NameError:
+    def create_default_listener() -> Union[AppearanceModeListener, None]:
+        if GSettingsAppearanceModeListener.is_available():
+            return GSettingsAppearanceModeListener()
+        elif sys.platform.startswith("win") and DarkdetectAppearanceModeListener.is_available():
+            return DarkdetectAppearanceModeListener()
+        else:
+            return None  # macOS listener of darkdetect needs pyobjc, use polling instead
+
+    @classmethod
+    def start_listener(cls):
+        if cls.listener is None and cls.listener_enabled:
+            cls.listener = cls.create_default_listener()
+
+        if cls.listener is not None and not cls.listener.is_alive():
+            cls.listener.start(cls.listener_callback)
+
+    @classmethod
+    def set_listener(cls, listener: Union[AppearanceModeListener, None]):
+        """ replace the backend for system appearance changes, None deactivates the listener and uses polling """
+
+        if cls.listener is not None:
+            cls.listener.stop()
+
+        cls.listener = listener
+        cls.listener_enabled = listener is not None
+        cls.listener_reported_mode = None
+
+        if cls.update_loop_running:
+            cls.start_listener()
+
+    @classmethod
+    def listener_callback(cls, mode_string: str):
+        # called from the listener thread, so only a single attribute gets written here
+        cls.listener_reported_mode = 1 if mode_string == "Dark" else 0
+
+    @classmethod
+    def listener_is_active(cls) -> bool:
+        return cls.listener is not None and cls.listener.is_alive()
+
+    @classmethod
+    def get_update_loop_interval(cls) -> int:
+        return cls.listener_update_loop_interval if cls.listener_is_active() else cls.update_loop_interval
+
+    @classmethod
+    def import_darkdetect(cls):
+        if cls.darkdetect is None:
+            try:
+                import darkdetect
+
+                if parse_version(darkdetect.__version__) < parse_version("0.3.1"):
+                    sys.stderr.write("WARNING: You have to upgrade the darkdetect library: pip3 install --upgrade darkdetect\n")
+                    if sys.platform != "darwin":
+                        exit()
+                cls.darkdetect = darkdetect
+            except ImportError as err:
+                raise err
+            except Exception:
+                sys.stderr.write("customtkinter.appearance_mode_tracker warning: failed to import darkdetect")
+                cls.darkdetect = False
+
+        return cls.darkdetect
+
+    @classmethod
+    def detect_appearance_mode(cls) -> int:
+        darkdetect = cls.import_darkdetect()
+        if darkdetect is False:
+            return 0  # Light
+
+        if darkdetect.theme() == "Dark":
+            return 1  # Dark
+        else:
             return 0  # Light
 
     @classmethod
@@ -74,26 +148,153 @@ class AppearanceModeTracker:
 
         return current_widget
 
+    @classmethod
+    def get_mode_string(cls) -> str:
+        return "Dark" if cls.appearance_mode == 1 else "Light"
+
+    @classmethod
+    def dispatch(cls, callback: Callable, mode_string: str):
+        TrackerStatistics.dispatch("appearance_mode", callback, mode_string)
+
     @classmethod
     def update_callbacks(cls):
-        if cls.appearance_mode == 0:
-            for callback in cls.callback_list:
-                try:
-                    callback("Light")
-                except Exception:
-                    continue
+        TrackerStatistics.begin_pass("appearance_mode")
+        mode_string = cls.get_mode_string()
+
+        # callback_list is in creation order, so masters are redrawn before their children, no geometry queries needed
+        for callback in list(cls.callback_list):  # callbacks can destroy widgets and remove themselves from the list
+            widget = getattr(callback, "__self__", None)
+
+            # windows and other callbacks get called directly, widgets only if they are viewable
+            if not cls.lazy_update_enabled or not isinstance(widget, tkinter.Widget):
+                cls.dispatch(callback, mode_string)
+                continue
+
+            try:
+                viewable = widget.winfo_viewable()
+            except tkinter.TclError:
+                continue  # widget is already destroyed
 
-        elif cls.appearance_mode == 1:
-            for callback in cls.callback_list:
-                try:
-                    callback("Dark")
-                except Exception:
-                    continue
+            if viewable:
+                cls.discard_stale_widget(widget)
+                cls.dispatch(callback, mode_string)
+            else:
+                cls.add_stale_callback(widget, callback)
+
+        TrackerStatistics.end_pass("appearance_mode")
+
+    @classmethod
+    def add_stale_callback(cls, widget, callback: Callable):
+        cls.index_stale_callback(widget, callback)
+
+        app = cls.get_tk_root_of_widget(widget)
+        if app not in cls.map_event_bindings:
+            cls.map_event_bindings[app] = app.bind_all("<Map>", cls.map_event, add="+")
+
+    @classmethod
+    def index_stale_callback(cls, widget, callback: Callable):
+        """ stale widgets are grouped by the path of their master, so a <Map> burst only checks the master paths """
+        cls.stale_callbacks[widget] = callback
+        cls.stale_widgets.setdefault(str(widget.master), {})[str(widget)] = widget
+
+    @classmethod
+    def discard_stale_widget(cls, widget) -> Union[Callable, None]:
+        """ removes widget from the stale widgets and returns its callback, or None if it was not stale """
+
+        callback = cls.stale_callbacks.pop(widget, None)
+        if callback is not None:
+            master_path = str(widget.master)
+            cls.stale_widgets[master_path].pop(str(widget), None)
+            if not cls.stale_widgets[master_path]:
+                del cls.stale_widgets[master_path]
+        return callback
+
+    @classmethod
+    def remove_map_event_bindings(cls):
+        # only remove the own binding from the 'all' tag, so that <Map> bindings of the user stay intact
+        for app, funcid in cls.map_event_bindings.items():
+            try:
+                script = app.tk.call("bind", "all", "<Map>")
+                script = "\n".join(line for line in script.split("\n") if funcid not in line)
+                app.tk.call("bind", "all", "<Map>", script)
+                app.deletecommand(funcid)
+            except tkinter.TclError:
+                continue  # app is already destroyed
+
+        cls.map_event_bindings = {}
+
+    @classmethod
+    def map_event(cls, event):
+        if cls.stale_callbacks and not isinstance(event.widget, str):
+            cls.mapped_widget_paths.add(str(event.widget))
+
+            # collect all <Map> events of the current event loop cycle and update stale widgets only once
+            if not cls.stale_update_scheduled:
+                cls.stale_update_scheduled = True
+                event.widget.after_idle(cls.update_stale_callbacks)
+
+    @staticmethod
+    def path_is_inside(widget_path: str, mapped_widget_paths: set) -> bool:
+        """ checks if widget_path or one of its ancestor paths is in mapped_widget_paths """
+
+        if "." in mapped_widget_paths or widget_path in mapped_widget_paths:
+            return True
+
+        separator_index = widget_path.find(".", 1)
+        while separator_index != -1:
+            if widget_path[:separator_index] in mapped_widget_paths:
+                return True
+            separator_index = widget_path.find(".", separator_index + 1)
+
+        return False
+
+    @classmethod
+    def update_stale_callbacks(cls):
+        mapped_widget_paths = cls.mapped_widget_paths
+        cls.mapped_widget_paths = set()
+        cls.stale_update_scheduled = False
+        mode_string = cls.get_mode_string()
+        TrackerStatistics.begin_pass("appearance_mode")
+
+        # a stale widget is inside a mapped widget if its master is, or if it got mapped itself
+        mapped_widgets = {}
+        for master_path, widgets in cls.stale_widgets.items():
+            if cls.path_is_inside(master_path, mapped_widget_paths):
+                mapped_widgets.update(widgets)
+        for widget_path in mapped_widget_paths:
+            widget = cls.stale_widgets.get(widget_path[:widget_path.rfind(".")] or ".", {}).get(widget_path)
+            if widget is not None:
+                mapped_widgets[widget_path] = widget
+
+        for widget in mapped_widgets.values():
+            try:
+                viewable = widget.winfo_viewable()
+            except tkinter.TclError:
+                cls.discard_stale_widget(widget)  # widget is already destroyed
+                continue
+
+            # callbacks of previous widgets can destroy this widget, so only call it if it's still stale
+            if viewable:
+                callback = cls.discard_stale_widget(widget)
+                if callback is not None:
+                    cls.dispatch(callback, mode_string)
+
+        TrackerStatistics.end_pass("appearance_mode")
+
+        if not cls.stale_callbacks:
+            cls.remove_map_event_bindings()
 
     @classmethod
     def update(cls):
         if cls.appearance_mode_set_by == "system":
-            new_appearance_mode = cls.detect_appearance_mode()
+            if cls.listener_is_active():
+                # listener reports changes, so nothing has to be detected if nothing was reported
+                if cls.listener_reported_mode is not None:
+                    new_appearance_mode = cls.listener_reported_mode
+                else:
+                    new_appearance_mode = cls.appearance_mode
+            else:
+                new_appearance_mode = cls.detect_appearance_mode()
 
             if new_appearance_mode != cls.appearance_mode:
                 cls.appearance_mode = new_appearance_mode
@@ -102,13 +303,16 @@ class AppearanceModeTracker:
         # find an existing tkinter.Tk object for the next call of .after()
         for app in cls.app_list:
             try:
-                app.after(cls.update_loop_interval, cls.update)
+                app.after(cls.get_update_loop_interval(), cls.update)
                 return
             except Exception:
                 continue
 
         cls.update_loop_running = False
 
+        if cls.listener is not None:
+            cls.listener.stop()
+
     @classmethod
     def get_mode(cls) -> int:
         return cls.appearance_mode
@@ -133,3 +337,13 @@ class AppearanceModeTracker:
 
         elif mode_string.lower() == "system":
             cls.appearance_mode_set_by = "system"
+
+            # apply current system mode immediately, the listener only reports changes and not the initial state
+            if cls.listener_is_active() and cls.listener_reported_mode is not None:
+                new_appearance_mode = cls.listener_reported_mode
+            else:
+                new_appearance_mode = cls.detect_appearance_mode()
+
+            if new_appearance_mode != cls.appearance_mode:
+                cls.appearance_mode = new_appearance_mode
+                cls.update_callbacks()
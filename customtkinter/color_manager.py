@@ -0,0 +1,87 @@
+import os
+import json
+import functools
+from typing import Union, Tuple
+
+
+class ColorManager:
+    """ Normalises hex colors (#rgb, #rrggbb, #rrrgggbbb, #rrrrggggbbbb) and tkinter color names
+        to rgb tuples without a tkinter round-trip. Color names get resolved through the bundled
+        X11 color table (assets/colors/x11_colors.json), which is loaded on first use.
+        Conversions, blends and multiplications are memoised in bounded lru caches. """
+
+    x11_colors: Union[dict, None] = None  # contains lowercase color names without spaces as keys and rgb lists as values
+    cache_size = 4096
+
+    @classmethod
+    def load_x11_colors(cls) -> dict:
+        if cls.x11_colors is None:
+            script_directory = os.path.dirname(os.path.abspath(__file__))
+            with open(os.path.join(script_directory, "assets", "colors", "x11_colors.json"), "r") as f:
+                cls.x11_colors = json.load(f)
+        return cls.x11_colors
+
+    @staticmethod
+    @functools.lru_cache(maxsize=cache_size)
+    def to_rgb(color: str) -> Tuple[int, int, int]:
+        """ returns (r, g, b) with values from 0 to 255, raises ValueError for unknown colors """
+
+        if color.startswith("#"):
+            hex_digits = color[1:]
+            if len(hex_digits) not in (3, 6, 9, 12):
+                raise ValueError(f"invalid hex color: {color}")
+
+            digits_per_channel = len(hex_digits) // 3
+            max_channel_value = 16 ** digits_per_channel - 1
+            try:
+                return tuple(round(int(hex_digits[i:i + digits_per_channel], 16) * 255 / max_channel_value)
+                             for i in range(0, len(hex_digits), digits_per_channel))
+            except ValueError:
+                raise ValueError(f"invalid hex color: {color}")
+
+        else:
+            rgb_color = ColorManager.load_x11_colors().get(color.replace(" ", "").lower())
+            if rgb_color is not None:
+                return tuple(rgb_color)
+            elif len(color) == 6:
+                return ColorManager.to_rgb("#" + color)  # hex color without leading #, as accepted by ThemeManager.hex2rgb
+            else:
+                raise ValueError(f"unknown color name: {color}")
+
+    @staticmethod
+    def rgb2hex(rgb_color: tuple) -> str:
+        return "#{:02x}{:02x}{:02x}".format(round(rgb_color[0]), round(rgb_color[1]), round(rgb_color[2]))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=cache_size)
+    def to_hex(color: str) -> str:
+        """ normalised #rrggbb form of a hex color or color name """
+        return ColorManager.rgb2hex(ColorManager.to_rgb(color))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=cache_size)
+    def linear_blend(color_1: str, color_2: str, blend_factor: float) -> str:
+        """ blend_factor of 0 results in color_1 and blend_factor of 1 results in color_2 """
+
+        rgb_1 = ColorManager.to_rgb(color_1)
+        rgb_2 = ColorManager.to_rgb(color_2)
+
+        return ColorManager.rgb2hex((rgb_1[0] + (rgb_2[0] - rgb_1[0]) * blend_factor,
+                                     rgb_1[1] + (rgb_2[1] - rgb_1[1]) * blend_factor,
+                                     rgb_1[2] + (rgb_2[2] - rgb_1[2]) * blend_factor))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=cache_size)
+    def multiply(color: str, factor: float) -> str:
+        rgb_color = ColorManager.to_rgb(color)
+
+        return ColorManager.rgb2hex((min(255, rgb_color[0] * factor),
+                                     min(255, rgb_color[1] * factor),
+                                     min(255, rgb_color[2] * factor)))
+
+    @classmethod
+    def clear_cache(cls):
+        cls.to_rgb.cache_clear()
+        cls.to_hex.cache_clear()
+        cls.linear_blend.cache_clear()
+        cls.multiply.cache_clear()
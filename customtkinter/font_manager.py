@@ -1,19 +1,36 @@
 import sys
 import os
+import re
+import copy
+import json
+import ctypes
+import ctypes.util
 import shutil
+import hashlib
+import weakref
+import tkinter
+import tkinter.font
 from typing import Union
 
 
 class FontManager:
 
     linux_font_path = "~/.fonts/"
+    linux_font_marker_file = ".customtkinter_fonts.json"  # records the installed font files, stored in linux_font_path
+    linux_private_loading = True  # load fonts only for the current process through fontconfig if possible
+    fontconfig = None  # ctypes library of fontconfig, False if it's not available
+
+    # named fonts shared by all widgets of a window (CTk or CTkToplevel, which can have different scaling factors),
+    # contains windows as keys and dicts with font descriptions as keys and [named font, size, scaling] lists as values
+    shared_fonts = weakref.WeakKeyDictionary()
+    shared_fonts_counter = 0
 
     @classmethod
     def init_font_manager(cls):
         # Linux
         if sys.platform.startswith("linux"):
             try:
-                if not os.path.isdir(os.path.expanduser(cls.linux_font_path)):
+                if not cls.linux_private_loading and not os.path.isdir(os.path.expanduser(cls.linux_font_path)):
                     os.mkdir(os.path.expanduser(cls.linux_font_path))
                 return True
             except Exception as err:
@@ -54,8 +71,11 @@ class FontManager:
 
         # Linux
         elif sys.platform.startswith("linux"):
+            if cls.linux_private_loading and cls.linux_load_font_private(font_path):
+                return True
+
             try:
-                shutil.copy(font_path, os.path.expanduser(cls.linux_font_path))
+                cls.linux_install_font(font_path)
                 return True
             except Exception as err:
                 sys.stderr.write("FontManager error: " + str(err) + "\n")
@@ -64,3 +84,184 @@ class FontManager:
         # macOS and others
         else:
             return False
+
+    @classmethod
+    def linux_load_font_private(cls, font_path: str) -> bool:
+        """ adds the font to the fontconfig configuration of the current process only, so nothing has to
+            be copied to ~/.fonts, returns False if fontconfig is not available """
+
+        if cls.fontconfig is None:
+            try:
+                cls.fontconfig = ctypes.CDLL("libfontconfig.so.1")
+            except OSError:
+                library_name = ctypes.util.find_library("fontconfig")  # slower, runs ldconfig
+                try:
+                    cls.fontconfig = ctypes.CDLL(library_name) if library_name is not None else False
+                except OSError:
+                    cls.fontconfig = False
+
+        if cls.fontconfig is False:
+            return False
+
+        try:
+            return bool(cls.fontconfig.FcConfigAppFontAddFile(None, os.fsencode(os.path.abspath(font_path))))
+        except Exception:
+            return False
+
+    @classmethod
+    def linux_install_font(cls, font_path: str):
+        """ copies the font to ~/.fonts only if the installed file differs from font_path. Size and modification
+            times of both files are recorded in a marker file, so that unchanged files are not read again. """
+
+        font_directory = os.path.expanduser(cls.linux_font_path)
+        target_path = os.path.join(font_directory, os.path.basename(font_path))
+        marker_path = os.path.join(font_directory, cls.linux_font_marker_file)
+
+        try:
+            with open(marker_path, "r") as f:
+                marker = json.load(f)
+        except (OSError, ValueError):
+            marker = {}
+
+        source_stat = os.stat(font_path)
+        source_state = [source_stat.st_size, source_stat.st_mtime_ns]
+        try:
+            target_stat = os.stat(target_path)
+            target_state = [target_stat.st_size, target_stat.st_mtime_ns]
+        except OSError:
+            target_state = None
+
+        entry = marker.get(os.path.basename(font_path))
+        if entry is not None and target_state is not None and entry["source"] == source_state and entry["target"] == target_state:
+            return  # nothing changed since the last installation
+
+        source_hash = cls.get_file_hash(font_path)
+        if target_state is None or target_state[0] != source_state[0] or cls.get_file_hash(target_path) != source_hash:
+            os.makedirs(font_directory, exist_ok=True)
+            shutil.copy(font_path, target_path)
+            target_stat = os.stat(target_path)
+            target_state = [target_stat.st_size, target_stat.st_mtime_ns]
+
+        marker[os.path.basename(font_path)] = {"source": source_state, "target": target_state, "sha256": source_hash}
+        with open(marker_path, "w") as f:
+            json.dump(marker, f, indent=2)
+
+    @staticmethod
+    def get_file_hash(file_path: str) -> str:
+        with open(file_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    @staticmethod
+    def get_window(widget: tkinter.Misc) -> tkinter.Misc:
+        while not isinstance(widget, (tkinter.Tk, tkinter.Toplevel)):
+            widget = widget.master
+        return widget
+
+    @staticmethod
+    def get_description(widget: tkinter.Misc, font) -> Union[tuple, None]:
+        if type(font) == tuple or type(font) == list:
+            return tuple(font)
+        elif type(font) == str:
+            return tuple(widget.tk.splitlist(font))
+        else:
+            return None
+
+    @classmethod
+    def get_scaled_font(cls, widget: tkinter.Misc, font, scaling: float):
+        """ returns font with negative (pixel) sizes multiplied by scaling. Tuple, list and string fonts are converted
+            to one named font per window and description, which is shared by all widgets of the window and gets
+            its new size from update_window_scaling(), so widgets don't have to be configured again """
+
+        if isinstance(font, tkinter.font.Font):
+            if scaling == 1 or font.cget("size") >= 0:
+                return font  # used as it is, so that later configure calls on the font object are shown
+            scaled_font = copy.copy(font)
+            scaled_font.config(size=int(font.cget("size") * scaling))
+            return scaled_font
+
+        description = cls.get_description(widget, font)
+        if description is None:
+            return font
+
+        window_fonts = cls.shared_fonts.setdefault(cls.get_window(widget), {})
+        entry = window_fonts.get(description)
+        if entry is None:
+            entry = cls.create_named_font(widget, description, scaling)
+            if entry is None:
+                return cls.scale_font_description(font, scaling)  # description with unusual format
+            window_fonts[description] = entry
+        elif entry[2] != scaling:
+            cls.set_entry_scaling(entry, scaling)
+        return entry[0]
+
+    @classmethod
+    def is_shared_font(cls, widget: tkinter.Misc, font) -> bool:
+        """ True if font is shared named font of the window of widget, which follows scaling changes by itself """
+
+        description = cls.get_description(widget, font)
+        return description is not None and description in cls.shared_fonts.get(cls.get_window(widget), {})
+
+    @classmethod
+    def update_window_scaling(cls, window: tkinter.Misc, scaling: float):
+        """ sets the sizes of the shared fonts of window, called before the widgets of window get the new scaling """
+
+        for entry in cls.shared_fonts.get(window, {}).values():
+            if entry[2] != scaling:
+                cls.set_entry_scaling(entry, scaling)
+
+    @staticmethod
+    def set_entry_scaling(entry: list, scaling: float):
+        font, size, _ = entry
+        if size is not None and size < 0:
+            font.configure(size=int(size * scaling))
+        entry[2] = scaling
+
+    @classmethod
+    def remove_window(cls, window: tkinter.Misc):
+        cls.shared_fonts.pop(window, None)
+
+    @classmethod
+    def create_named_font(cls, widget: tkinter.Misc, description: tuple, scaling: float) -> Union[list, None]:
+        """ description has the format (family, size, *styles), returns None for other formats """
+
+        if len(description) == 0:
+            return None
+
+        font_options = {"family": description[0]}
+        size = None
+
+        if len(description) > 1:
+            try:
+                size = int(description[1])
+            except (TypeError, ValueError):
+                return None
+            font_options["size"] = int(size * scaling) if size < 0 else size
+
+        for style in description[2:]:
+            if style in ("bold", "normal"):
+                font_options["weight"] = style
+            elif style in ("italic", "roman"):
+                font_options["slant"] = style
+            elif style == "underline":
+                font_options["underline"] = True
+            elif style == "overstrike":
+                font_options["overstrike"] = True
+            else:
+                return None
+
+        cls.shared_fonts_counter += 1
+        return [tkinter.font.Font(root=widget, name=f"ctk_font_{cls.shared_fonts_counter}", **font_options), size, scaling]
+
+    @staticmethod
+    def scale_font_description(font, scaling: float):
+        if type(font) == tuple or type(font) == list:
+            font_list = list(font)
+            for i in range(len(font_list)):
+                if (type(font_list[i]) == int or type(font_list[i]) == float) and font_list[i] < 0:
+                    font_list[i] = int(font_list[i] * scaling)
+            return tuple(font_list)
+
+        else:
+            for negative_number in re.findall(r" -\d* ", font):
+                font = font.replace(negative_number, f" {int(int(negative_number) * scaling)} ")
+            return font
@@ -0,0 +1,47 @@
+import os
+import sys
+
+from .appearance_mode_tracker import AppearanceModeTracker
+from .scaling_tracker import ScalingTracker
+from .font_manager import FontManager
+from .draw_engine import DrawEngine
+
+initialized = False
+
+
+def initialize():
+    """ Runs the initialisation that is needed before the first window or widget gets created: appearance mode
+        detection, font loading and the choice of the draw method. It's called by CTk, CTkToplevel and
+        CTkBaseClass and runs only once, so that 'import customtkinter' itself stays cheap. """
+
+    global initialized
+    if initialized:
+        return
+    initialized = True
+
+    AppearanceModeTracker.init_appearance_mode()
+    FontManager.init_font_manager()
+
+    # determine draw method based on current platform, if it was not set by the user already
+    if DrawEngine.preferred_drawing_method is None:
+        if sys.platform == "darwin":
+            DrawEngine.preferred_drawing_method = "polygon_shapes"
+        else:
+            DrawEngine.preferred_drawing_method = "font_shapes"
+
+    if sys.platform.startswith("win") and sys.getwindowsversion().build < 9000:  # No automatic scaling on Windows < 8.1
+        ScalingTracker.deactivate_automatic_dpi_awareness = True
+
+    # load Roboto fonts (used on Windows/Linux)
+    script_directory = os.path.dirname(os.path.abspath(__file__))
+    FontManager.load_font(os.path.join(script_directory, "assets", "fonts", "Roboto", "Roboto-Regular.ttf"))
+    FontManager.load_font(os.path.join(script_directory, "assets", "fonts", "Roboto", "Roboto-Medium.ttf"))
+
+    # load font necessary for rendering the widgets (used on Windows/Linux)
+    if FontManager.load_font(os.path.join(script_directory, "assets", "fonts", "CustomTkinter_shapes_font.otf")) is False:
+        # change draw method if font loading failed
+        if DrawEngine.preferred_drawing_method == "font_shapes":
+            sys.stderr.write("customtkinter.__init__ warning: " +
+                             "Preferred drawing method 'font_shapes' can not be used because the font file could not be loaded.\n" +
+                             "Using 'circle_shapes' instead. The rendering quality will be bad!")
+            DrawEngine.preferred_drawing_method = "circle_shapes"
@@ -2,6 +2,9 @@ import tkinter
 import sys
 from typing import Callable
 
+from .font_manager import FontManager
+from .tracker_statistics import TrackerStatistics
+
 
 class ScalingTracker:
     deactivate_automatic_dpi_awareness = False
@@ -56,30 +59,49 @@ class ScalingTracker:
 
         return current_widget
 
+    @classmethod
+    def dispatch(cls, set_scaling_callback: Callable, window):
+        if not cls.deactivate_automatic_dpi_awareness:
+            TrackerStatistics.dispatch("scaling", set_scaling_callback,
+                                       cls.window_dpi_scaling_dict[window] * cls.widget_scaling,
+                                       cls.window_dpi_scaling_dict[window] * cls.spacing_scaling,
+                                       cls.window_dpi_scaling_dict[window] * cls.window_scaling,
+                                       raise_exceptions=True)
+        else:
+            TrackerStatistics.dispatch("scaling", set_scaling_callback,
+                                       cls.widget_scaling,
+                                       cls.spacing_scaling,
+                                       cls.window_scaling,
+                                       raise_exceptions=True)
+
+    @classmethod
+    def update_window_fonts(cls, window):
+        # the shared named fonts of the window get their new size once, before the widgets are scaled
+        if not cls.deactivate_automatic_dpi_awareness:
+            FontManager.update_window_scaling(window, cls.window_dpi_scaling_dict[window] * cls.widget_scaling)
+        else:
+            FontManager.update_window_scaling(window, cls.widget_scaling)
+
     @classmethod
     def update_scaling_callbacks_all(cls):
-        for window, callback_list in cls.window_widgets_dict.items():
-            for set_scaling_callback in callback_list:
-                if not cls.deactivate_automatic_dpi_awareness:
-                    set_scaling_callback(cls.window_dpi_scaling_dict[window] * cls.widget_scaling,
-                                         cls.window_dpi_scaling_dict[window] * cls.spacing_scaling,
-                                         cls.window_dpi_scaling_dict[window] * cls.window_scaling)
-                else:
-                    set_scaling_callback(cls.widget_scaling,
-                                         cls.spacing_scaling,
-                                         cls.window_scaling)
+        TrackerStatistics.begin_pass("scaling")
+        try:
+            for window, callback_list in cls.window_widgets_dict.items():
+                cls.update_window_fonts(window)
+                for set_scaling_callback in callback_list:
+                    cls.dispatch(set_scaling_callback, window)
+        finally:
+            TrackerStatistics.end_pass("scaling")
 
     @classmethod
     def update_scaling_callbacks_for_window(cls, window):
-        for set_scaling_callback in cls.window_widgets_dict[window]:
-            if not cls.deactivate_automatic_dpi_awareness:
-                set_scaling_callback(cls.window_dpi_scaling_dict[window] * cls.widget_scaling,
-                                     cls.window_dpi_scaling_dict[window] * cls.spacing_scaling,
-                                     cls.window_dpi_scaling_dict[window] * cls.window_scaling)
-            else:
-                set_scaling_callback(cls.widget_scaling,
-                                     cls.spacing_scaling,
-                                     cls.window_scaling)
+        TrackerStatistics.begin_pass("scaling")
+        try:
+            cls.update_window_fonts(window)
+            for set_scaling_callback in cls.window_widgets_dict[window]:
+                cls.dispatch(set_scaling_callback, window)
+        finally:
+            TrackerStatistics.end_pass("scaling")
 
     @classmethod
     def add_widget(cls, widget_callback: Callable, widget):
@@ -111,6 +133,7 @@ class ScalingTracker:
             del cls.window_widgets_dict[window]
         except:
             pass
+        FontManager.remove_window(window)
 
     @classmethod
     def add_window(cls, window_callback, window):
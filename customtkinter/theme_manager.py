@@ -1,30 +1,344 @@
 import sys
 import os
 import json
+import marshal
+import hashlib
+from typing import Union, Tuple
 
+from .color_manager import ColorManager
+from .tracker_statistics import TrackerStatistics
 
-class ThemeManager:
 
-    theme = {}  # contains all the theme data
+class ThemeManagerType(type):
+    """ metaclass of ThemeManager, so that ThemeManager.theme can load the theme on first access """
+
+    @property
+    def theme(cls) -> dict:
+        cls.ensure_theme_loaded()
+        return cls.theme_data
+
+    @theme.setter
+    def theme(cls, theme_data: dict):
+        cls.theme_data = theme_data
+
+
+class ThemeManager(metaclass=ThemeManagerType):
+
+    theme_data = {}  # contains all the theme data, ThemeManager.theme loads the theme when it's read for the first time
     built_in_themes = ["blue", "green", "dark-blue", "sweetkind"]
+    theme_name_or_path = "blue"  # theme that gets loaded when the theme data is needed for the first time
+
+    callback_list = []  # set_theme methods of all widgets, which get called with the old theme when a new theme is loaded
+
+    # compiled themes are stored as marshal files in the user cache directory, the .json files and their directories
+    # are never written to. Set cache_enabled to False or the environment variable CUSTOMTKINTER_THEME_CACHE=0 to disable it.
+    cache_enabled = os.environ.get("CUSTOMTKINTER_THEME_CACHE", "1") != "0"
+    cache_directory: Union[str, None] = None  # platform specific user cache directory if None
+    cache_format_version = 3
+
+    # keys every theme must contain after it was merged with the themes it extends
+    theme_schema = {"color": ("window_bg_color", "button", "button_hover", "button_border", "checkbox_border", "checkmark",
+                              "entry", "entry_border", "entry_placeholder_text", "frame_border", "frame_low", "frame_high",
+                              "label", "text", "text_disabled", "text_button_disabled", "progressbar", "progressbar_progress",
+                              "progressbar_border", "slider", "slider_progress", "slider_button", "slider_button_hover",
+                              "switch", "switch_progress", "switch_button", "switch_button_hover", "optionmenu_button",
+                              "optionmenu_button_hover", "combobox_border", "combobox_button_hover", "dropdown_color",
+                              "dropdown_hover", "dropdown_text", "scrollbar_button", "scrollbar_button_hover"),
+                    "text": ("font", "size"),
+                    "shape": ("button_corner_radius", "button_border_width", "checkbox_corner_radius", "checkbox_border_width",
+                              "radiobutton_corner_radius", "radiobutton_border_width_unchecked", "radiobutton_border_width_checked",
+                              "entry_border_width", "frame_corner_radius", "frame_border_width", "label_corner_radius",
+                              "progressbar_border_width", "progressbar_corner_radius", "slider_border_width", "slider_corner_radius",
+                              "slider_button_length", "slider_button_corner_radius", "switch_border_width", "switch_corner_radius",
+                              "switch_button_corner_radius", "switch_button_length", "scrollbar_corner_radius",
+                              "scrollbar_border_spacing")}
+
+    @classmethod
+    def set_default_theme(cls, theme_name_or_path: str):
+        """ loads the theme immediately if a theme is already in use, otherwise only when it's needed for the first time,
+            a theme file that doesn't exist raises FileNotFoundError immediately in both cases """
+
+        if cls.theme_data:
+            cls.load_theme(theme_name_or_path)
+        else:
+            theme_path = cls.get_theme_path(theme_name_or_path)
+            if not os.path.isfile(theme_path):
+                raise cls.theme_not_found_error(FileNotFoundError(f"No such file: '{theme_path}'"))
+            cls.theme_name_or_path = theme_name_or_path
+
+    @staticmethod
+    def theme_not_found_error(err: FileNotFoundError) -> FileNotFoundError:
+        return FileNotFoundError(f"{err}\n\nThe .json theme file for CustomTkinter could not be found.\n" +
+                                 f"If packaging with pyinstaller was used, have a look at the wiki:\n" +
+                                 f"https://github.com/TomSchimansky/CustomTkinter/wiki/Packaging#windows-pyinstaller-auto-py-to-exe")
+
+    @classmethod
+    def ensure_theme_loaded(cls):
+        if not cls.theme_data:
+            try:
+                cls.load_theme(cls.theme_name_or_path)
+            except FileNotFoundError as err:
+                raise cls.theme_not_found_error(err)
 
     @classmethod
     def load_theme(cls, theme_name_or_path: str):
-        script_directory = os.path.dirname(os.path.abspath(__file__))
+        old_theme = cls.theme_data
+
+        cls.theme_data, _ = cls.read_theme_file(cls.get_theme_path(theme_name_or_path))
+        cls.theme_name_or_path = theme_name_or_path
+        cls.compile_theme()
+
+        if old_theme:
+            cls.update_theme_callbacks(old_theme)
+
+    @classmethod
+    def get_theme_path(cls, theme_name_or_path: str, relative_to: str = None) -> str:
+        """ path of a built-in theme or a theme file, relative paths in the "extends" entry
+            of a theme are relative to the directory of the extending theme file """
 
         if theme_name_or_path in cls.built_in_themes:
-            with open(os.path.join(script_directory, "assets", "themes", f"{theme_name_or_path}.json"), "r") as f:
-                cls.theme = json.load(f)
+            script_directory = os.path.dirname(os.path.abspath(__file__))
+            return os.path.join(script_directory, "assets", "themes", f"{theme_name_or_path}.json")
+        elif relative_to is not None:
+            return os.path.join(os.path.dirname(relative_to), theme_name_or_path)
         else:
-            with open(theme_name_or_path, "r") as f:
-                cls.theme = json.load(f)
+            return theme_name_or_path
+
+    @staticmethod
+    def get_platform_name() -> str:
+        """ key of the platform specific values in the "text" section of the theme """
 
         if sys.platform == "darwin":
-            cls.theme["text"] = cls.theme["text"]["macOS"]
+            return "macOS"
         elif sys.platform.startswith("win"):
-            cls.theme["text"] = cls.theme["text"]["Windows"]
+            return "Windows"
         else:
-            cls.theme["text"] = cls.theme["text"]["Linux"]
+            return "Linux"
+
+    @classmethod
+    def read_theme_file(cls, theme_path: str, extending_paths: tuple = ()) -> Tuple[dict, list]:
+        """ returns the validated and platform resolved theme data of a .json theme file and the list of
+            source files it was built from (the file itself and all themes it extends). The result is cached
+            and reused as long as modification time or content of these source files don't change. """
+
+        theme_path = os.path.abspath(theme_path)
+        if theme_path in extending_paths:
+            raise ValueError(f"theme file {theme_path} extends itself: {' -> '.join(extending_paths + (theme_path,))}")
+
+        cache_path = cls.get_cache_path(theme_path)
+        cache_data = cls.read_cache_file(cache_path) if cls.cache_enabled else None
+
+        if cache_data is not None:
+            checked_sources = cls.check_sources(cache_data["sources"])
+            if checked_sources is not None:
+                if checked_sources != cache_data["sources"]:  # files were touched (for example by a reinstall) but content is unchanged
+                    cls.write_cache_file(cache_path, dict(cache_data, sources=checked_sources))
+                return cache_data["theme"], checked_sources
+
+        theme, sources = cls.compile_theme_file(theme_path, extending_paths)
+
+        if cls.cache_enabled:
+            cls.write_cache_file(cache_path, {"format_version": cls.cache_format_version,
+                                              "sources": sources,
+                                              "theme": theme})
+        return theme, sources
+
+    @staticmethod
+    def check_sources(sources: list) -> Union[list, None]:
+        """ returns sources with updated modification times, or None if the content of a source file changed """
+
+        checked_sources = []
+        for source_path, source_mtime, source_size, source_hash in sources:
+            try:
+                source_stat = os.stat(source_path)
+                if source_stat.st_mtime_ns != source_mtime or source_stat.st_size != source_size:
+                    with open(source_path, "rb") as f:
+                        if hashlib.sha256(f.read()).hexdigest() != source_hash:
+                            return None
+            except OSError:
+                return None
+            checked_sources.append([source_path, source_stat.st_mtime_ns, source_stat.st_size, source_hash])
+
+        return checked_sources
+
+    @classmethod
+    def compile_theme_file(cls, theme_path: str, extending_paths: tuple = ()) -> Tuple[dict, list]:
+        """ merges the theme file into the theme it extends and resolves the platform specific text values """
+
+        source_stat = os.stat(theme_path)
+        with open(theme_path, "rb") as f:
+            source = f.read()
+        sources = [[theme_path, source_stat.st_mtime_ns, source_stat.st_size, hashlib.sha256(source).hexdigest()]]
+
+        theme_data = json.loads(source)
+        platform_name = cls.get_platform_name()
+
+        if "extends" in theme_data:
+            base_theme_path = cls.get_theme_path(theme_data.pop("extends"), relative_to=theme_path)
+            theme, base_sources = cls.read_theme_file(base_theme_path, extending_paths + (theme_path,))
+            sources += base_sources
+        else:
+            theme = {}
+
+        # a delta theme only contains the values that differ from the theme it extends
+        for section, values in theme_data.items():
+            if section == "text":
+                values = values.get(platform_name, {})
+            if type(values) is dict:
+                theme.setdefault(section, {}).update(values)
+            else:
+                theme[section] = values
+
+        cls.validate_theme(theme, theme_path)
+
+        # color pairs are stored as tuples, so that compile_theme() only has to intern them
+        for key, color in theme["color"].items():
+            if type(color) is list:
+                theme["color"][key] = tuple(color)
+
+        return theme, sources
+
+    @classmethod
+    def validate_theme(cls, theme: dict, theme_path: str):
+        """ raises a ValueError with all keys of theme_schema that are missing in the merged theme """
+
+        missing_keys = []
+        for section, keys in cls.theme_schema.items():
+            section_name = f"text.{cls.get_platform_name()}" if section == "text" else section
+            for key in keys:
+                if key not in theme.get(section, {}):
+                    missing_keys.append(f"{section_name}.{key}")
+
+        if missing_keys:
+            raise ValueError(f"theme file {theme_path} is missing the following keys: {', '.join(missing_keys)}")
+
+    @classmethod
+    def get_cache_directory(cls) -> str:
+        if cls.cache_directory is not None:
+            return cls.cache_directory
+        elif sys.platform.startswith("win"):
+            base_directory = os.environ.get("LOCALAPPDATA") or os.path.expanduser(os.path.join("~", "AppData", "Local"))
+        elif sys.platform == "darwin":
+            base_directory = os.path.expanduser(os.path.join("~", "Library", "Caches"))
+        else:
+            base_directory = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache"))
+        return os.path.join(base_directory, "customtkinter", "themes")
+
+    @classmethod
+    def get_cache_path(cls, theme_path: str) -> str:
+        # the hash of the path keeps themes with the same file name in different directories apart
+        theme_path = os.path.abspath(theme_path)
+        theme_name = os.path.splitext(os.path.basename(theme_path))[0]
+        path_hash = hashlib.sha256(theme_path.encode("utf-8", "surrogateescape")).hexdigest()[:16]
+        return os.path.join(cls.get_cache_directory(),
+                            f"{theme_name}-{path_hash}.{cls.get_platform_name()}.{sys.implementation.cache_tag}.marshal")
+
+    @classmethod
+    def read_cache_file(cls, cache_path: str) -> Union[dict, None]:
+        try:
+            with open(cache_path, "rb") as f:
+                cache_data = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if type(cache_data) is not dict or cache_data.get("format_version") != cls.cache_format_version:
+            return None
+        return cache_data
+
+    @staticmethod
+    def write_cache_file(cache_path: str, cache_data: dict):
+        # the cache is optional, so read-only installations just parse the .json file on every start
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temporary_path, "wb") as f:
+                marshal.dump(cache_data, f)
+            os.replace(temporary_path, cache_path)  # atomic, so that concurrent processes never read half written files
+        except OSError:
+            pass
+
+    @classmethod
+    def compile_theme(cls):
+        """ equal color pairs of the theme share one tuple object, compile_theme_file() already converted the lists to tuples """
+
+        interned_colors = {}  # only lives for one theme, so colors of replaced themes are not kept
+
+        for key, color in cls.theme_data["color"].items():
+            if type(color) is tuple:
+                cls.theme_data["color"][key] = interned_colors.setdefault(color, color)
+
+    @classmethod
+    def add(cls, callback):
+        cls.callback_list.append(callback)
+
+    @classmethod
+    def remove(cls, callback):
+        try:
+            cls.callback_list.remove(callback)
+        except ValueError:
+            return
+
+    @classmethod
+    def update_theme_callbacks(cls, old_theme: dict):
+        """ re-resolves the theme values of all widgets, every widget redraws itself once """
+
+        TrackerStatistics.begin_pass("theme")
+        try:
+            for callback in list(cls.callback_list):  # callbacks can destroy widgets and remove themselves from the list
+                TrackerStatistics.dispatch("theme", callback, old_theme)
+        finally:
+            TrackerStatistics.end_pass("theme")
+
+    @classmethod
+    def get_theme_value(cls, section: str, key: str, theme: dict = None):
+        """ value of the current or the given theme, the "font" key of the "text" section
+            returns the (font, size) tuple that is used by the widgets """
+
+        if theme is None:
+            theme = cls.theme
+
+        if section == "text" and key == "font":
+            return theme["text"]["font"], theme["text"]["size"]
+        else:
+            return theme[section][key]
+
+    @classmethod
+    def bind_theme_value(cls, theme_bindings: dict, attribute_name: str, value, section: str, key: str):
+        """ returns the theme value for "default_theme" and remembers the theme key of the attribute
+            in theme_bindings, so that the attribute can follow later theme changes """
+
+        if value == "default_theme":
+            theme_bindings[attribute_name] = (section, key)
+            return cls.get_theme_value(section, key)
+        else:
+            return value
+
+    @classmethod
+    def update_theme_bindings(cls, widget, theme_bindings: dict, old_theme: dict) -> dict:
+        """ sets every bound attribute of widget to the value of the current theme, attributes which
+            were configured to a different value in the meantime are kept and their binding is dropped.
+            Returns the changed attribute names with their theme section as value. """
+
+        changed_attributes = {}
+
+        for attribute_name, (section, key) in list(theme_bindings.items()):
+            current_value = getattr(widget, attribute_name)
+
+            try:
+                old_value = cls.get_theme_value(section, key, old_theme)
+            except KeyError:
+                old_value = current_value
+
+            if current_value != old_value:
+                del theme_bindings[attribute_name]  # attribute was configured by the user
+                continue
+
+            new_value = cls.get_theme_value(section, key)
+            if new_value != current_value:
+                setattr(widget, attribute_name, new_value)
+                changed_attributes[attribute_name] = section
+
+        return changed_attributes
 
     @staticmethod
     def single_color(color, appearance_mode: int) -> str:
@@ -32,57 +346,52 @@ class ThemeManager:
             tuple color with (light_color, dark_color). The functions then returns
             always a single color string """
 
-        if type(color) == tuple or type(color) == list:
+        if isinstance(color, (tuple, list)):
             return color[appearance_mode]
         else:
             return color
 
     @staticmethod
     def rgb2hex(rgb_color: tuple) -> str:
-        return "#{:02x}{:02x}{:02x}".format(round(rgb_color[0]), round(rgb_color[1]), round(rgb_color[2]))
+        return ColorManager.rgb2hex(rgb_color)
 
     @staticmethod
     def hex2rgb(hex_color: str) -> tuple:
-        return tuple(int(hex_color.strip("#")[i:i+2], 16) for i in (0, 2, 4))
+        """ works with hex colors and color names, results are cached by the ColorManager """
+        return ColorManager.to_rgb(hex_color)
 
     @classmethod
     def linear_blend(cls, color_1: str, color_2: str, blend_factor: float) -> str:
-        """ Blends two hex colors linear, where blend_factor of 0
+        """ Blends two hex colors or color names linear, where blend_factor of 0
             results in color_1 and blend_factor of 1 results in color_2. """
 
         if color_1 is None or color_2 is None:
             return None
 
-        rgb_1 = cls.hex2rgb(color_1)
-        rgb_2 = cls.hex2rgb(color_2)
-
-        new_rgb = (rgb_1[0] + (rgb_2[0] - rgb_1[0]) * blend_factor,
-                   rgb_1[1] + (rgb_2[1] - rgb_1[1]) * blend_factor,
-                   rgb_1[2] + (rgb_2[2] - rgb_1[2]) * blend_factor)
-
-        return cls.rgb2hex(new_rgb)
+        return ColorManager.linear_blend(color_1, color_2, blend_factor)
 
     @classmethod
-    def get_minimal_darker(cls, color: str) -> str:
-        if color.startswith("#"):
+    def get_minimal_darker(cls, color: str) -> Union[str, None]:
+        """ returns None for None, "transparent" and other colors which can't be resolved """
+
+        try:
             color_rgb = cls.hex2rgb(color)
-            if color_rgb[0] > 0:
-                return cls.rgb2hex((color_rgb[0] - 1, color_rgb[1], color_rgb[2]))
-            elif color_rgb[1] > 0:
-                return cls.rgb2hex((color_rgb[0], color_rgb[1] - 1, color_rgb[2]))
-            elif color_rgb[2] > 0:
-                return cls.rgb2hex((color_rgb[0], color_rgb[1], color_rgb[2] - 1))
-            else:
-                return cls.rgb2hex((color_rgb[0] + 1, color_rgb[1], color_rgb[2] - 1))  # otherwise slightly lighter
+        except (ValueError, AttributeError):
+            return None
+
+        if color_rgb[0] > 0:
+            return cls.rgb2hex((color_rgb[0] - 1, color_rgb[1], color_rgb[2]))
+        elif color_rgb[1] > 0:
+            return cls.rgb2hex((color_rgb[0], color_rgb[1] - 1, color_rgb[2]))
+        elif color_rgb[2] > 0:
+            return cls.rgb2hex((color_rgb[0], color_rgb[1], color_rgb[2] - 1))
+        else:
+            return cls.rgb2hex((color_rgb[0] + 1, color_rgb[1], color_rgb[2] - 1))  # otherwise slightly lighter
 
     @classmethod
     def multiply_hex_color(cls, hex_color: str, factor: float = 1.0) -> str:
         try:
-            rgb_color = ThemeManager.hex2rgb(hex_color)
-            dark_rgb_color = (min(255, rgb_color[0] * factor),
-                              min(255, rgb_color[1] * factor),
-                              min(255, rgb_color[2] * factor))
-            return ThemeManager.rgb2hex(dark_rgb_color)
+            return ColorManager.multiply(hex_color, factor)
         except Exception as err:
             # sys.stderr.write("ERROR (CTkColorManager): failed to darken the following color: " + str(hex_color) + " " + str(err))
             return hex_color
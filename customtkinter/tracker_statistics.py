@@ -0,0 +1,146 @@
+import time
+import heapq
+import itertools
+from typing import Callable, Union
+
+
+class TrackerStatistics:
+    """ Collects dispatch times and failures of the AppearanceModeTracker and ScalingTracker callbacks,
+        grouped by tracker and widget class. Available through customtkinter.get_tracker_stats(),
+        the optional log_hook gets called with a dict for every failure and every finished dispatch pass. """
+
+    enabled = True
+    log_hook: Union[Callable[[dict], None], None] = None
+    slowest_callbacks_count = 10
+
+    class_statistics = {}  # contains tracker names as keys and dicts of widget class names and their statistics as elements
+    pass_statistics = {}  # contains tracker names as keys and the statistics of the dispatch passes as elements
+    slowest_callbacks = []  # min-heap of (duration, counter, info dict) with the slowest callbacks
+    slowest_callbacks_counter = itertools.count()
+
+    current_pass = None  # statistics of the currently running dispatch pass
+
+    @classmethod
+    def begin_pass(cls, tracker_name: str):
+        if cls.enabled and cls.current_pass is None:
+            cls.current_pass = {"tracker": tracker_name, "start_time": time.perf_counter(), "callbacks": 0, "failures": 0}
+
+    @classmethod
+    def end_pass(cls, tracker_name: str):
+        if cls.current_pass is None or cls.current_pass["tracker"] != tracker_name:
+            return
+
+        current_pass, cls.current_pass = cls.current_pass, None
+        duration = time.perf_counter() - current_pass["start_time"]
+
+        statistics = cls.pass_statistics.setdefault(tracker_name, {"passes": 0, "total_time": 0.0, "max_time": 0.0})
+        statistics["passes"] += 1
+        statistics["total_time"] += duration
+        statistics["max_time"] = max(statistics["max_time"], duration)
+
+        cls.log({"event": "pass",
+                 "tracker": tracker_name,
+                 "callbacks": current_pass["callbacks"],
+                 "failures": current_pass["failures"],
+                 "duration": duration})
+
+    @classmethod
+    def dispatch(cls, tracker_name: str, callback: Callable, *args, raise_exceptions: bool = False):
+        """ calls callback with args and records the dispatch time, exceptions are only
+            raised again if raise_exceptions is True, otherwise they get recorded only """
+
+        if not cls.enabled:
+            try:
+                callback(*args)
+            except Exception:
+                if raise_exceptions:
+                    raise
+            return
+
+        exception = None
+        start_time = time.perf_counter()
+        try:
+            callback(*args)
+        except Exception as err:
+            exception = err
+        duration = time.perf_counter() - start_time
+
+        cls.record(tracker_name, callback, duration, exception)
+
+        if exception is not None and raise_exceptions:
+            raise exception
+
+    @classmethod
+    def record(cls, tracker_name: str, callback: Callable, duration: float, exception: Union[Exception, None] = None):
+        widget = getattr(callback, "__self__", None)
+        class_name = type(widget).__name__ if widget is not None else getattr(callback, "__qualname__", repr(callback))
+
+        tracker_statistics = cls.class_statistics.setdefault(tracker_name, {})
+        statistics = tracker_statistics.get(class_name)
+        if statistics is None:
+            statistics = {"count": 0, "total_time": 0.0, "max_time": 0.0, "failures": 0, "last_exception": None}
+            tracker_statistics[class_name] = statistics
+
+        statistics["count"] += 1
+        statistics["total_time"] += duration
+        if duration > statistics["max_time"]:
+            statistics["max_time"] = duration
+
+        if cls.current_pass is not None:
+            cls.current_pass["callbacks"] += 1
+
+        # keep only the slowest callbacks, info dict is only created if the callback is one of them
+        if len(cls.slowest_callbacks) < cls.slowest_callbacks_count or duration > cls.slowest_callbacks[0][0]:
+            info = {"tracker": tracker_name,
+                    "widget_class": class_name,
+                    "widget": str(widget) if widget is not None else None,
+                    "callback": getattr(callback, "__name__", repr(callback)),
+                    "duration": duration}
+            if len(cls.slowest_callbacks) < cls.slowest_callbacks_count:
+                heapq.heappush(cls.slowest_callbacks, (duration, next(cls.slowest_callbacks_counter), info))
+            else:
+                heapq.heapreplace(cls.slowest_callbacks, (duration, next(cls.slowest_callbacks_counter), info))
+
+        if exception is not None:
+            statistics["failures"] += 1
+            statistics["last_exception"] = repr(exception)  # the traceback would keep the frames and widgets alive
+            if cls.current_pass is not None:
+                cls.current_pass["failures"] += 1
+
+            cls.log({"event": "failure",
+                     "tracker": tracker_name,
+                     "widget_class": class_name,
+                     "widget": str(widget) if widget is not None else None,
+                     "exception": exception,
+                     "duration": duration})
+
+    @classmethod
+    def log(cls, entry: dict):
+        if cls.log_hook is not None:
+            try:
+                cls.log_hook(entry)
+            except Exception:
+                pass  # a broken log hook must not break the dispatch of the trackers
+
+    @classmethod
+    def get_statistics(cls) -> dict:
+        statistics = {}
+
+        for tracker_name in set(cls.class_statistics) | set(cls.pass_statistics):
+            classes = {}
+            for class_name, class_statistics in cls.class_statistics.get(tracker_name, {}).items():
+                classes[class_name] = dict(class_statistics,
+                                           mean_time=class_statistics["total_time"] / class_statistics["count"])
+
+            statistics[tracker_name] = dict(cls.pass_statistics.get(tracker_name, {"passes": 0, "total_time": 0.0, "max_time": 0.0}),
+                                            classes=classes)
+
+        statistics["slowest_callbacks"] = [dict(info) for _, _, info in sorted(cls.slowest_callbacks, reverse=True)]
+        return statistics
+
+    @classmethod
+    def reset(cls):
+        cls.class_statistics = {}
+        cls.pass_statistics = {}
+        cls.slowest_callbacks = []
+        cls.current_pass = None
@@ -0,0 +1,51 @@
+import re
+import tkinter
+import functools
+from typing import Tuple, Union
+
+tcl_patchlevel: Union[str, None] = None  # cached result of 'info patchlevel'
+
+
+@functools.lru_cache(maxsize=64)
+def parse_version(version_string: str) -> Tuple[int, ...]:
+    """ converts a version string like '8.6.12' or '0.6.0rc1' to a tuple of integers, which can be compared
+        with <, >= etc., suffixes like 'rc1' or 'b2' are ignored. Replaces distutils.version.StrictVersion. """
+
+    version_numbers = []
+    for part in version_string.split("."):
+        match = re.match(r"\d+", part)
+        if match is None:
+            break
+        version_numbers.append(int(match.group()))
+        if match.end() < len(part):
+            break  # part has a suffix, following parts belong to the suffix
+    return tuple(version_numbers)
+
+
+def get_tcl_patchlevel(tk_app=None) -> Union[str, None]:
+    """ patchlevel of Tcl/Tk, read from tk_app or the default root, None if no interpreter exists yet,
+        no interpreter gets created for it. The result is cached, so that it's read only once. """
+
+    global tcl_patchlevel
+    if tcl_patchlevel is None:
+        if tk_app is None:
+            tk_app = getattr(tkinter, "_default_root", None)
+        if tk_app is not None:
+            tcl_patchlevel = str(tk_app.tk.call("info", "patchlevel"))
+    return tcl_patchlevel
+
+
+def tk_version_at_least(version_string: str, tk_app=None) -> Union[bool, None]:
+    """ compares the Tk version with version_string, major and minor version come from tkinter.TkVersion,
+        the patchlevel is only read if they are equal. Returns None if the patchlevel is needed but no interpreter
+        exists yet, so that the check can be repeated when the first window is created. """
+
+    required_version = parse_version(version_string)
+    tk_version = parse_version(str(tkinter.TkVersion))
+    if tk_version[:2] != required_version[:2]:
+        return tk_version[:2] > required_version[:2]
+
+    patchlevel = get_tcl_patchlevel(tk_app)
+    if patchlevel is None:
+        return None
+    return parse_version(patchlevel) >= required_version
@@ -31,32 +31,37 @@ class CTkButton(CTkBaseClass):
                  compound: str = "left",
                  state: str = "normal",
                  command: Callable = None,
+                 canvas_text: bool = None,
                  **kwargs):
 
         # transfer basic functionality (bg_color, size, _appearance_mode, scaling) to CTkBaseClass
         super().__init__(*args, bg_color=bg_color, width=width, height=height, **kwargs)
 
         # color
-        self.fg_color = ThemeManager.theme["color"]["button"] if fg_color == "default_theme" else fg_color
-        self.hover_color = ThemeManager.theme["color"]["button_hover"] if hover_color == "default_theme" else hover_color
-        self.border_color = ThemeManager.theme["color"]["button_border"] if border_color == "default_theme" else border_color
-        self.text_color = ThemeManager.theme["color"]["text"] if text_color == "default_theme" else text_color
-        self.text_color_disabled = ThemeManager.theme["color"]["text_button_disabled"] if text_color_disabled == "default_theme" else text_color_disabled
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "button")
+        self.hover_color = self.bind_theme_value("hover_color", hover_color, "color", "button_hover")
+        self.border_color = self.bind_theme_value("border_color", border_color, "color", "button_border")
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
+        self.text_color_disabled = self.bind_theme_value("text_color_disabled", text_color_disabled, "color", "text_button_disabled")
 
         # shape
-        self.corner_radius = ThemeManager.theme["shape"]["button_corner_radius"] if corner_radius == "default_theme" else corner_radius
-        self.border_width = ThemeManager.theme["shape"]["button_border_width"] if border_width == "default_theme" else border_width
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "button_corner_radius")
+        self.border_width = self.bind_theme_value("border_width", border_width, "shape", "button_border_width")
 
         # text, font, image
         self.image = image
         self.image_label = None
         self.text = text
         self.text_label = None
-        self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
+        self.text_font = self.bind_theme_value("text_font", text_font, "text", "font")
+
+        # canvas text mode: text and image are items on the canvas instead of tkinter.Label widgets
+        self.canvas_text = Settings.canvas_text_rendering if canvas_text is None else canvas_text
 
         # callback and hover functionality
         self.command = command
         self.textvariable = textvariable
+        self.add_textvariable_trace()
         self.state = state
         self.hover = hover
         self.compound = compound
@@ -83,9 +88,8 @@ class CTkButton(CTkBaseClass):
         self.canvas.bind("<Button-1>", self.clicked)
         self.bind('<Configure>', self.update_dimensions_event)
 
-        # configure cursor and initial draw
+        # configure cursor
         self.set_cursor()
-        self.draw()
 
     def set_scaling(self, *args, **kwargs):
         super().set_scaling(*args, **kwargs)
@@ -133,6 +137,10 @@ class CTkButton(CTkBaseClass):
                                        outline=ThemeManager.single_color(self.fg_color, self._appearance_mode),
                                        fill=ThemeManager.single_color(self.fg_color, self._appearance_mode))
 
+        if self.canvas_text:
+            self.draw_canvas_text_and_image(no_color_updates is False or requires_recoloring)
+            return
+
         # create text label if text given
         if self.text is not None and self.text != "":
 
@@ -235,6 +243,63 @@ class CTkButton(CTkBaseClass):
                                      padx=max(self.apply_widget_scaling(self.corner_radius), self.apply_widget_scaling(self.border_width)),
                                      pady=(self.apply_widget_scaling(self.border_width), 2))
 
+    def draw_canvas_text_and_image(self, update_colors: bool):
+        """ canvas text mode: creates, moves and colors the text and image items, which are centered
+            on the button and placed next to each other according to compound """
+
+        text = self.textvariable.get() if self.textvariable is not None else self.text
+        width, height = self.apply_widget_scaling(self._current_width), self.apply_widget_scaling(self._current_height)
+
+        if text is not None and text != "":
+            if not self.canvas.find_withtag("text_parts"):
+                self.canvas.create_text(0, 0, tags="text_parts")
+                update_colors = True
+            self.canvas.itemconfigure("text_parts", text=text, font=self.apply_font_scaling(self.text_font))
+            text_x_1, text_y_1, text_x_2, text_y_2 = self.canvas.bbox("text_parts")
+            text_width, text_height = text_x_2 - text_x_1, text_y_2 - text_y_1
+        else:
+            self.canvas.delete("text_parts")
+            text_width, text_height = 0, 0
+
+        if self.image is not None:
+            if not self.canvas.find_withtag("image_parts"):
+                self.canvas.create_image(0, 0, tags="image_parts")
+            self.canvas.itemconfigure("image_parts", image=self.image)
+            image_width, image_height = self.image.width(), self.image.height()
+        else:
+            self.canvas.delete("image_parts")
+            image_width, image_height = 0, 0
+
+        gap = 4 if text_width > 0 and image_width > 0 else 0  # same as the padx of 2 on both labels
+
+        if self.compound in (tkinter.LEFT, tkinter.RIGHT):
+            x = round((width - image_width - gap - text_width) / 2)
+            if self.compound == tkinter.LEFT:
+                image_position, text_position = (x, height / 2), (x + image_width + gap, height / 2)
+            else:
+                text_position, image_position = (x, height / 2), (x + text_width + gap, height / 2)
+            self.canvas.itemconfigure("text_parts", anchor=tkinter.W)
+            self.canvas.itemconfigure("image_parts", anchor=tkinter.W)
+        else:
+            y = round((height - image_height - gap - text_height) / 2)
+            if self.compound == tkinter.TOP:
+                image_position, text_position = (width / 2, y), (width / 2, y + image_height + gap)
+            else:
+                text_position, image_position = (width / 2, y), (width / 2, y + text_height + gap)
+            self.canvas.itemconfigure("text_parts", anchor=tkinter.N)
+            self.canvas.itemconfigure("image_parts", anchor=tkinter.N)
+
+        self.canvas.coords("text_parts", *text_position)
+        self.canvas.coords("image_parts", *image_position)
+        self.canvas.tag_raise("image_parts")
+        self.canvas.tag_raise("text_parts")
+
+        if update_colors:
+            if self.state == tkinter.DISABLED:
+                self.canvas.itemconfigure("text_parts", fill=ThemeManager.single_color(self.text_color_disabled, self._appearance_mode))
+            else:
+                self.canvas.itemconfigure("text_parts", fill=ThemeManager.single_color(self.text_color, self._appearance_mode))
+
     def configure(self, require_redraw=False, **kwargs):
         if "text" in kwargs:
             self.text = kwargs.pop("text")
@@ -245,7 +310,9 @@ class CTkButton(CTkBaseClass):
 
         if "text_font" in kwargs:
             self.text_font = kwargs.pop("text_font")
-            if self.text_label is not None:
+            if self.canvas_text:
+                require_redraw = True
+            elif self.text_label is not None:
                 self.text_label.configure(font=self.apply_font_scaling(self.text_font))
 
         if "state" in kwargs:
@@ -285,8 +352,12 @@ class CTkButton(CTkBaseClass):
             self.command = kwargs.pop("command")
 
         if "textvariable" in kwargs:
+            self.remove_textvariable_trace()
             self.textvariable = kwargs.pop("textvariable")
-            if self.text_label is not None:
+            self.add_textvariable_trace()
+            if self.canvas_text:
+                require_redraw = True
+            elif self.text_label is not None:
                 self.text_label.configure(textvariable=self.textvariable)
 
         if "width" in kwargs:
@@ -38,19 +38,19 @@ class CTkComboBox(CTkBaseClass):
         super().__init__(*args, bg_color=bg_color, width=width, height=height, **kwargs)
 
         # color variables
-        self.fg_color = ThemeManager.theme["color"]["entry"] if fg_color == "default_theme" else fg_color
-        self.border_color = ThemeManager.theme["color"]["combobox_border"] if border_color == "default_theme" else border_color
-        self.button_color = ThemeManager.theme["color"]["combobox_border"] if button_color == "default_theme" else button_color
-        self.button_hover_color = ThemeManager.theme["color"]["combobox_button_hover"] if button_hover_color == "default_theme" else button_hover_color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "entry")
+        self.border_color = self.bind_theme_value("border_color", border_color, "color", "combobox_border")
+        self.button_color = self.bind_theme_value("button_color", button_color, "color", "combobox_border")
+        self.button_hover_color = self.bind_theme_value("button_hover_color", button_hover_color, "color", "combobox_button_hover")
 
         # shape
-        self.corner_radius = ThemeManager.theme["shape"]["button_corner_radius"] if corner_radius == "default_theme" else corner_radius
-        self.border_width = ThemeManager.theme["shape"]["entry_border_width"] if border_width == "default_theme" else border_width
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "button_corner_radius")
+        self.border_width = self.bind_theme_value("border_width", border_width, "shape", "entry_border_width")
 
         # text and font
-        self.text_color = ThemeManager.theme["color"]["text"] if text_color == "default_theme" else text_color
-        self.text_color_disabled = ThemeManager.theme["color"]["text_button_disabled"] if text_color_disabled == "default_theme" else text_color_disabled
-        self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
+        self.text_color_disabled = self.bind_theme_value("text_color_disabled", text_color_disabled, "color", "text_button_disabled")
+        self.text_font = self.bind_theme_value("text_font", text_font, "text", "font")
 
         # callback and hover functionality
         self.command = command
@@ -99,8 +99,6 @@ class CTkComboBox(CTkBaseClass):
         else:
             self.entry.insert(0, "CTkComboBox")
 
-        self.draw()  # initial draw
-
         # event bindings
         self.canvas.tag_bind("right_parts", "<Enter>", self.on_enter)
         self.canvas.tag_bind("dropdown_arrow", "<Enter>", self.on_enter)
@@ -118,7 +116,8 @@ class CTkComboBox(CTkBaseClass):
 
         # change entry font size and grid padding
         left_section_width = self._current_width - self._current_height
-        self.entry.configure(font=self.apply_font_scaling(self.text_font))
+        if not self.font_follows_scaling(self.text_font):
+            self.entry.configure(font=self.apply_font_scaling(self.text_font))
         self.entry.grid(row=0, column=0, rowspan=1, columnspan=1, sticky="ew",
                         padx=(max(self.apply_widget_scaling(self.corner_radius), self.apply_widget_scaling(3)),
                               max(self.apply_widget_scaling(self._current_width - left_section_width + 3), self.apply_widget_scaling(3))))
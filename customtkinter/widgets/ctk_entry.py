@@ -34,15 +34,15 @@ class CTkEntry(CTkBaseClass):
         self.grid_columnconfigure(0, weight=1)
 
         # color
-        self.fg_color = ThemeManager.theme["color"]["entry"] if fg_color == "default_theme" else fg_color
-        self.text_color = ThemeManager.theme["color"]["text"] if text_color == "default_theme" else text_color
-        self.placeholder_text_color = ThemeManager.theme["color"]["entry_placeholder_text"] if placeholder_text_color == "default_theme" else placeholder_text_color
-        self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
-        self.border_color = ThemeManager.theme["color"]["entry_border"] if border_color == "default_theme" else border_color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "entry")
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
+        self.placeholder_text_color = self.bind_theme_value("placeholder_text_color", placeholder_text_color, "color", "entry_placeholder_text")
+        self.text_font = self.bind_theme_value("text_font", text_font, "text", "font")
+        self.border_color = self.bind_theme_value("border_color", border_color, "color", "entry_border")
 
         # shape
-        self.corner_radius = ThemeManager.theme["shape"]["button_corner_radius"] if corner_radius == "default_theme" else corner_radius
-        self.border_width = ThemeManager.theme["shape"]["entry_border_width"] if border_width == "default_theme" else border_width
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "button_corner_radius")
+        self.border_width = self.bind_theme_value("border_width", border_width, "shape", "entry_border_width")
 
         # placeholder text
         self.placeholder_text = placeholder_text
@@ -78,12 +78,12 @@ class CTkEntry(CTkBaseClass):
         self.entry.bind('<FocusIn>', self.entry_focus_in)
 
         self.activate_placeholder()
-        self.draw()
 
     def set_scaling(self, *args, **kwargs):
         super().set_scaling( *args, **kwargs)
 
-        self.entry.configure(font=self.apply_font_scaling(self.text_font))
+        if not self.font_follows_scaling(self.text_font):
+            self.entry.configure(font=self.apply_font_scaling(self.text_font))
         self.entry.grid(column=0, row=0, sticky="we",
                         padx=self.apply_widget_scaling(self.corner_radius) if self.corner_radius >= 6 else self.apply_widget_scaling(6))
 
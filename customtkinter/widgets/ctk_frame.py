@@ -20,23 +20,17 @@ class CTkFrame(CTkBaseClass):
         super().__init__(*args, bg_color=bg_color, width=width, height=height, **kwargs)
 
         # color
-        self.border_color = ThemeManager.theme["color"]["frame_border"] if border_color == "default_theme" else border_color
+        self.border_color = self.bind_theme_value("border_color", border_color, "color", "frame_border")
 
         # determine fg_color of frame
-        if fg_color == "default_theme":
-            if isinstance(self.master, CTkFrame):
-                if self.master.fg_color == ThemeManager.theme["color"]["frame_low"]:
-                    self.fg_color = ThemeManager.theme["color"]["frame_high"]
-                else:
-                    self.fg_color = ThemeManager.theme["color"]["frame_low"]
-            else:
-                self.fg_color = ThemeManager.theme["color"]["frame_low"]
+        if isinstance(self.master, CTkFrame) and self.master.fg_color == ThemeManager.get_theme_value("color", "frame_low"):
+            self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "frame_high")
         else:
-            self.fg_color = fg_color
+            self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "frame_low")
 
         # shape
-        self.corner_radius = ThemeManager.theme["shape"]["frame_corner_radius"] if corner_radius == "default_theme" else corner_radius
-        self.border_width = ThemeManager.theme["shape"]["frame_border_width"] if border_width == "default_theme" else border_width
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "frame_corner_radius")
+        self.border_width = self.bind_theme_value("border_width", border_width, "shape", "frame_border_width")
 
         self.canvas = CTkCanvas(master=self,
                                 highlightthickness=0,
@@ -49,8 +43,6 @@ class CTkFrame(CTkBaseClass):
 
         self.bind('<Configure>', self.update_dimensions_event)
 
-        self.draw()
-
     def winfo_children(self):
         """ winfo_children of CTkFrame without self.canvas widget,
         because it's not a child but part of the CTkFrame itself """
@@ -76,7 +68,6 @@ class CTkFrame(CTkBaseClass):
         self.draw()
 
     def draw(self, no_color_updates=False):
-
         requires_recoloring = self.draw_engine.draw_rounded_rect_with_border(self.apply_widget_scaling(self._current_width),
                                                                              self.apply_widget_scaling(self._current_height),
                                                                              self.apply_widget_scaling(self.corner_radius),
@@ -106,10 +97,8 @@ class CTkFrame(CTkBaseClass):
             self.fg_color = kwargs.pop("fg_color")
             require_redraw = True
 
-            # check if CTk widgets are children of the frame and change their bg_color to new frame fg_color
-            for child in self.winfo_children():
-                if isinstance(child, CTkBaseClass):
-                    child.configure(bg_color=self.fg_color)
+            # change bg_color of the CTk widgets inside the frame which take their bg_color from it
+            CTkBaseClass.propagate_master_color(self)
 
         if "border_color" in kwargs:
             self.border_color = kwargs.pop("border_color")
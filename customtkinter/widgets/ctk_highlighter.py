@@ -0,0 +1,31 @@
+import re
+from typing import Dict, Iterable, Tuple, Union
+
+
+class CTkHighlighter:
+    """ Base class for syntax highlighters of CTkTextbox. A highlighter lexes single lines: highlight_line(text) returns
+        (tag, start_column, end_column) tuples for one line without line end. tag_colors maps the tags to foreground
+        colors, a color can be a (light, dark) tuple, which is changed with the appearance mode. """
+
+    def __init__(self, tag_colors: Dict[str, Union[str, Tuple[str, str]]] = None):
+        self.tag_colors = {} if tag_colors is None else dict(tag_colors)
+
+    def highlight_line(self, text: str) -> Iterable[Tuple[str, int, int]]:
+        return ()
+
+
+class CTkRegexHighlighter(CTkHighlighter):
+    """ Highlighter with one regular expression per tag, for example:
+        CTkRegexHighlighter({"comment": r"#.*", "key": r"^\\s*[\\w.]+(?=\\s*=)"}, {"comment": ("gray40", "gray60"), ...}) """
+
+    def __init__(self, patterns: Dict[str, str], tag_colors: Dict[str, Union[str, Tuple[str, str]]] = None):
+        super().__init__(tag_colors)
+
+        # all patterns are combined in one expression with a named group per tag, so a line is only searched once
+        self.tags = list(patterns)
+        self.regex = re.compile("|".join(f"(?P<tag{i}>{pattern})" for i, pattern in enumerate(patterns.values())))
+
+    def highlight_line(self, text: str) -> Iterable[Tuple[str, int, int]]:
+        for match in self.regex.finditer(text):
+            if match.end() > match.start():
+                yield self.tags[int(match.lastgroup[3:])], match.start(), match.end()
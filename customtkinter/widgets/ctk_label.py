@@ -3,11 +3,16 @@ import tkinter
 
 from .ctk_canvas import CTkCanvas
 from ..theme_manager import ThemeManager
+from ..settings import Settings
 from ..draw_engine import DrawEngine
 from .widget_base_class import CTkBaseClass
 
 
 class CTkLabel(CTkBaseClass):
+    # tkinter.Label options which are passed to the text item in canvas text mode, wraplength is the width of a text item
+    canvas_text_item_options = ("justify", "underline", "state", "activefill", "disabledfill", "angle")
+    canvas_text_item_renamed_options = {"wraplength": "width"}
+
     def __init__(self, *args,
                  bg_color=None,
                  fg_color="default_theme",
@@ -16,8 +21,10 @@ class CTkLabel(CTkBaseClass):
                  width=140,
                  height=28,
                  text="CTkLabel",
+                 textvariable: tkinter.Variable = None,
                  text_font="default_theme",
                  anchor="center",  # label anchor: center, n, e, s, w
+                 canvas_text=None,  # draw text as canvas item instead of tkinter.Label, default is Settings.canvas_text_rendering
                  **kwargs):
 
         # transfer basic functionality (bg_color, size, _appearance_mode, scaling) to CTkBaseClass
@@ -27,18 +34,19 @@ class CTkLabel(CTkBaseClass):
             super().__init__(*args, bg_color=bg_color, width=width, height=height)
 
         # color
-        self.fg_color = ThemeManager.theme["color"]["label"] if fg_color == "default_theme" else fg_color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "label")
         if self.fg_color is None:
             self.fg_color = self.bg_color
-        self.text_color = ThemeManager.theme["color"]["text"] if text_color == "default_theme" else text_color
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
 
         # shape
-        self.corner_radius = ThemeManager.theme["shape"]["label_corner_radius"] if corner_radius == "default_theme" else corner_radius
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "label_corner_radius")
 
         # text
         self.anchor = anchor
         self.text = text
-        self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
+        self.textvariable = textvariable
+        self.text_font = self.bind_theme_value("text_font", text_font, "text", "font")
 
         # configure grid system (1x1)
         self.grid_rowconfigure(0, weight=1)
@@ -51,28 +59,57 @@ class CTkLabel(CTkBaseClass):
         self.canvas.grid(row=0, column=0, sticky="nswe")
         self.draw_engine = DrawEngine(self.canvas)
 
-        self.text_label = tkinter.Label(master=self,
-                                        highlightthickness=0,
-                                        bd=0,
-                                        anchor=self.anchor,
-                                        text=self.text,
-                                        font=self.apply_font_scaling(self.text_font),
-                                        **kwargs)
-        text_label_grid_sticky = self.anchor if self.anchor != "center" else ""
-        self.text_label.grid(row=0, column=0, padx=self.apply_widget_scaling(self.corner_radius),
-                             sticky=text_label_grid_sticky)
+        # canvas text mode: text is an item on the canvas, the remaining kwargs which exist for text items are its options
+        self.canvas_text = Settings.canvas_text_rendering if canvas_text is None else canvas_text
+        self.text_item_options = {}
+
+        if self.canvas_text:
+            self.text_label = None
+            self.configure_text_item(kwargs)
+            self.add_textvariable_trace()
+        else:
+            self.text_label = tkinter.Label(master=self,
+                                            highlightthickness=0,
+                                            bd=0,
+                                            anchor=self.anchor,
+                                            text=self.text,
+                                            textvariable=self.textvariable,
+                                            font=self.apply_font_scaling(self.text_font),
+                                            **kwargs)
+            text_label_grid_sticky = self.anchor if self.anchor != "center" else ""
+            self.text_label.grid(row=0, column=0, padx=self.apply_widget_scaling(self.corner_radius),
+                                 sticky=text_label_grid_sticky)
 
         self.bind('<Configure>', self.update_dimensions_event)
-        self.draw()
+
+    def configure_text_item(self, label_options: dict):
+        """ canvas text mode: keeps the tkinter.Label options that exist for text items and applies them to the
+            text item, cursor is set on the canvas and options without a text item equivalent (padx, relief, ...) are ignored """
+
+        if "cursor" in label_options:
+            self.canvas.configure(cursor=label_options["cursor"])
+
+        item_options = {}
+        for option, value in label_options.items():
+            if option in self.canvas_text_item_options:
+                item_options[option] = value
+            elif option in self.canvas_text_item_renamed_options:
+                item_options[self.canvas_text_item_renamed_options[option]] = value
+
+        self.text_item_options.update(item_options)
+        if item_options and self.canvas.find_withtag("text_parts"):
+            self.canvas.itemconfigure("text_parts", **item_options)
 
     def set_scaling(self, *args, **kwargs):
         super().set_scaling(*args, **kwargs)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
-        self.text_label.configure(font=self.apply_font_scaling(self.text_font))
-        text_label_grid_sticky = self.anchor if self.anchor != "center" else ""
-        self.text_label.grid(row=0, column=0, padx=self.apply_widget_scaling(self.corner_radius),
-                             sticky=text_label_grid_sticky)
+        if self.text_label is not None:
+            if not self.font_follows_scaling(self.text_font):
+                self.text_label.configure(font=self.apply_font_scaling(self.text_font))
+            text_label_grid_sticky = self.anchor if self.anchor != "center" else ""
+            self.text_label.grid(row=0, column=0, padx=self.apply_widget_scaling(self.corner_radius),
+                                 sticky=text_label_grid_sticky)
 
         self.draw()
 
@@ -95,18 +132,45 @@ class CTkLabel(CTkBaseClass):
                                        fill=ThemeManager.single_color(self.fg_color, self._appearance_mode),
                                        outline=ThemeManager.single_color(self.fg_color, self._appearance_mode))
 
-                self.text_label.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode),
-                                          bg=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+                if self.text_label is not None:
+                    self.text_label.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode),
+                                              bg=ThemeManager.single_color(self.fg_color, self._appearance_mode))
             else:
                 self.canvas.itemconfig("inner_parts",
                                        fill=ThemeManager.single_color(self.bg_color, self._appearance_mode),
                                        outline=ThemeManager.single_color(self.bg_color, self._appearance_mode))
 
-                self.text_label.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode),
-                                          bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+                if self.text_label is not None:
+                    self.text_label.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode),
+                                              bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
 
             self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
 
+        if self.canvas_text:
+            self.draw_canvas_text(no_color_updates is False or requires_recoloring)
+
+    def draw_canvas_text(self, update_colors: bool):
+        """ canvas text mode: creates and places the text item according to anchor, with corner_radius as padding """
+
+        if not self.canvas.find_withtag("text_parts"):
+            self.canvas.create_text(0, 0, tags="text_parts", **self.text_item_options)
+            update_colors = True
+
+        width, height = self.apply_widget_scaling(self._current_width), self.apply_widget_scaling(self._current_height)
+        padding = self.apply_widget_scaling(self.corner_radius)
+
+        anchor = "" if self.anchor == tkinter.CENTER else self.anchor
+        x = padding if "w" in anchor else width - padding if "e" in anchor else width / 2
+        y = 0 if "n" in anchor else height if "s" in anchor else height / 2
+
+        text = self.textvariable.get() if self.textvariable is not None else self.text
+        self.canvas.itemconfigure("text_parts", text=text, font=self.apply_font_scaling(self.text_font), anchor=self.anchor)
+        self.canvas.coords("text_parts", x, y)
+        self.canvas.tag_raise("text_parts")
+
+        if update_colors:
+            self.canvas.itemconfigure("text_parts", fill=ThemeManager.single_color(self.text_color, self._appearance_mode))
+
     def config(self, **kwargs):
         sys.stderr.write("Warning: Use .configure() instead of .config()")
         self.configure(**kwargs)
@@ -114,18 +178,36 @@ class CTkLabel(CTkBaseClass):
     def configure(self, require_redraw=False, **kwargs):
         if "anchor" in kwargs:
             self.anchor = kwargs.pop("anchor")
-            text_label_grid_sticky = self.anchor if self.anchor != "center" else ""
-            self.text_label.grid(row=0, column=0, padx=self.apply_widget_scaling(self.corner_radius),
-                                 sticky=text_label_grid_sticky)
+            if self.canvas_text:
+                require_redraw = True
+            else:
+                text_label_grid_sticky = self.anchor if self.anchor != "center" else ""
+                self.text_label.grid(row=0, column=0, padx=self.apply_widget_scaling(self.corner_radius),
+                                     sticky=text_label_grid_sticky)
 
         if "text" in kwargs:
             self.text = kwargs["text"]
-            self.text_label.configure(text=self.text)
+            if self.canvas_text:
+                require_redraw = True
+            else:
+                self.text_label.configure(text=self.text)
             del kwargs["text"]
 
+        if "textvariable" in kwargs:
+            self.remove_textvariable_trace()
+            self.textvariable = kwargs.pop("textvariable")
+            self.add_textvariable_trace()
+            if self.canvas_text:
+                require_redraw = True
+            else:
+                self.text_label.configure(textvariable=self.textvariable)
+
         if "text_font" in kwargs:
             self.text_font = kwargs.pop("text_font")
-            self.text_label.configure(font=self.apply_font_scaling(self.text_font))
+            if self.canvas_text:
+                require_redraw = True
+            else:
+                self.text_label.configure(font=self.apply_font_scaling(self.text_font))
 
         if "fg_color" in kwargs:
             self.fg_color = kwargs["fg_color"]
@@ -150,10 +232,12 @@ class CTkLabel(CTkBaseClass):
         else:
             super().configure(require_redraw=require_redraw)
 
-        self.text_label.configure(**kwargs)  # pass remaining kwargs to label
+        if self.canvas_text:
+            self.configure_text_item(kwargs)  # pass remaining kwargs to text item
+        else:
+            self.text_label.configure(**kwargs)  # pass remaining kwargs to label
 
     def set_text(self, text):
         """ Will be removed in the next major release """
 
-        self.text = text
-        self.text_label.configure(text=self.text)
+        self.configure(text=text)
@@ -0,0 +1,228 @@
+import sys
+import tkinter
+from typing import Callable, Sequence
+
+from ..theme_manager import ThemeManager
+from .ctk_scrollbar import CTkScrollbar
+from .ctk_label import CTkLabel
+from .widget_base_class import CTkBaseClass
+
+
+class CTkListView(CTkBaseClass):
+    """ Virtualized scrollable list with rows of fixed height. Only the rows in the visible area plus overscan rows
+        exist as widgets, they are created by row_factory(master) and recycled while scrolling, update_row(row, index, item)
+        fills a row widget with an item. Items come from a sequence (data=...) or from row_count and data_callback(index).
+        Memory and the cost of a scroll step don't depend on the number of rows. """
+
+    def __init__(self, *args,
+                 bg_color=None,
+                 fg_color="default_theme",
+                 width=300,
+                 height=400,
+                 row_height=28,
+                 row_factory: Callable = None,
+                 update_row: Callable = None,
+                 data: Sequence = None,
+                 data_callback: Callable = None,
+                 row_count: int = 0,
+                 overscan: int = 2,
+                 **kwargs):
+
+        # transfer basic functionality (bg_color, size, _appearance_mode, scaling) to CTkBaseClass
+        super().__init__(*args, bg_color=bg_color, width=width, height=height, **kwargs)
+
+        # color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "frame_low")
+
+        # rows and data
+        self.row_height = row_height
+        self.row_factory = self.default_row_factory if row_factory is None else row_factory
+        self.update_row = self.default_update_row if update_row is None else update_row
+        self.data = data
+        self.data_callback = data_callback
+        self.row_count = row_count  # only used with data_callback, len(data) otherwise
+        self.overscan = overscan
+
+        self.scroll_offset = 0  # unscaled pixels from the top of the first row to the top of the visible area
+        self.first_index = 0  # index of the topmost row widget, rows are placed relative to it inside row_frame
+        self.visible_rows = {}  # contains item indices as keys and the row widgets showing them as values
+        self.free_rows = []  # row widgets which can be recycled
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        # clip_frame shows a part of row_frame, so scrolling inside the first row only moves row_frame
+        self.clip_frame = tkinter.Frame(self, highlightthickness=0, bd=0)
+        self.clip_frame.grid(row=0, column=0, sticky="nsew")
+        self.row_frame = tkinter.Frame(self.clip_frame, highlightthickness=0, bd=0)
+
+        self.scrollbar = CTkScrollbar(self, command=self.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        # the mouse wheel is bound to a bindtag of this list, which is added to the frames and to all row widgets
+        self.scroll_bindtag = f"CTkListView{id(self)}"
+        self.bind_class(self.scroll_bindtag, "<MouseWheel>", self.mouse_scroll_event)
+        self.bind_class(self.scroll_bindtag, "<Button-4>", self.mouse_scroll_event)
+        self.bind_class(self.scroll_bindtag, "<Button-5>", self.mouse_scroll_event)
+        self.add_scroll_bindtag(self.clip_frame)
+        self.add_scroll_bindtag(self.row_frame)
+
+        self.bind('<Configure>', self.update_dimensions_event)
+
+    def destroy(self):
+        self.unbind_class(self.scroll_bindtag, "<MouseWheel>")
+        self.unbind_class(self.scroll_bindtag, "<Button-4>")
+        self.unbind_class(self.scroll_bindtag, "<Button-5>")
+        super().destroy()
+
+    def add_scroll_bindtag(self, widget):
+        """ adds the mouse wheel bindtag to widget and its children, so that rows don't need own bindings """
+        widget.bindtags((self.scroll_bindtag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self.add_scroll_bindtag(child)
+
+    def default_row_factory(self, master):
+        return CTkLabel(master, text="", anchor="w", height=self.row_height)
+
+    @staticmethod
+    def default_update_row(row, index: int, item):
+        row.configure(text=str(item))
+
+    def get_row_count(self) -> int:
+        return len(self.data) if self.data is not None else self.row_count
+
+    def get_item(self, index: int):
+        return self.data[index] if self.data is not None else self.data_callback(index)
+
+    def set_scaling(self, *args, **kwargs):
+        super().set_scaling(*args, **kwargs)
+
+        self.first_index = -1  # place all rows again with the new row height
+        self.draw()
+
+    def draw(self, no_color_updates=False):
+        if no_color_updates is False:
+            fg_color = self.bg_color if self.fg_color is None else self.fg_color
+            self.clip_frame.configure(bg=ThemeManager.single_color(fg_color, self._appearance_mode))
+            self.row_frame.configure(bg=ThemeManager.single_color(fg_color, self._appearance_mode))  # CTk rows follow with the bg hook
+
+        self.update_rows()
+
+    def update_rows(self):
+        """ assigns row widgets to the visible indices and places them, only rows which
+            get a new index are filled with update_row() """
+
+        row_count = self.get_row_count()
+        view_height = self._current_height
+        self.scroll_offset = max(0, min(self.scroll_offset, row_count * self.row_height - view_height))
+
+        first_index = max(0, int(self.scroll_offset // self.row_height) - self.overscan)
+        last_index = min(row_count, int((self.scroll_offset + view_height) // self.row_height) + 1 + self.overscan)
+
+        # recycle rows which are out of view
+        for index in [index for index in self.visible_rows if not first_index <= index < last_index]:
+            self.free_rows.append(self.visible_rows.pop(index))
+
+        new_rows = []
+        for index in range(first_index, last_index):
+            if index not in self.visible_rows:
+                if self.free_rows:
+                    row = self.free_rows.pop()
+                else:
+                    row = self.row_factory(self.row_frame)
+                    self.add_scroll_bindtag(row)
+                self.visible_rows[index] = row
+                self.update_row(row, index, self.get_item(index))
+                new_rows.append(index)
+
+        for row in self.free_rows:
+            row.place_forget()
+
+        # rows only have to be placed again when the topmost row changes
+        row_height = round(self.apply_widget_scaling(self.row_height))
+        if first_index != self.first_index:
+            self.first_index = first_index
+            new_rows = self.visible_rows
+
+        for index in new_rows:
+            tkinter.Place.place_configure(self.visible_rows[index], x=0, y=(index - first_index) * row_height, relwidth=1, height=row_height)
+
+        tkinter.Place.place_configure(self.row_frame, x=0, relwidth=1,
+                                      y=round(self.apply_widget_scaling(first_index * self.row_height - self.scroll_offset)),
+                                      height=max(1, (last_index - first_index) * row_height))
+
+        if row_count == 0:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.scroll_offset / (row_count * self.row_height),
+                               min(1, (self.scroll_offset + view_height) / (row_count * self.row_height)))
+
+    def refresh(self, indices=None):
+        """ fills the visible rows (or the rows of indices) with update_row() again after the data changed,
+            appended items are shown without refresh(), because the row count is checked on every update """
+
+        for index in [index for index in self.visible_rows if indices is None or index in indices]:
+            self.free_rows.append(self.visible_rows.pop(index))
+        self.draw(no_color_updates=True)
+
+    def yview(self, *args):
+        if not args:
+            total_height = self.get_row_count() * self.row_height
+            if total_height == 0:
+                return 0.0, 1.0
+            return self.scroll_offset / total_height, min(1.0, (self.scroll_offset + self._current_height) / total_height)
+
+        if args[0] == "moveto":
+            self.scroll_offset = float(args[1]) * self.get_row_count() * self.row_height
+        elif args[0] == "scroll":
+            if args[2] == "pages":
+                self.scroll_offset += int(args[1]) * self._current_height
+            else:
+                self.scroll_offset += int(args[1]) * self.row_height
+
+        self.draw(no_color_updates=True)
+
+    def see(self, index: int):
+        """ scrolls until the row with index is completely visible """
+
+        if index * self.row_height < self.scroll_offset:
+            self.scroll_offset = index * self.row_height
+        elif (index + 1) * self.row_height > self.scroll_offset + self._current_height:
+            self.scroll_offset = (index + 1) * self.row_height - self._current_height
+        self.draw(no_color_updates=True)
+
+    def mouse_scroll_event(self, event):
+        if event.num == 4:
+            self.yview("scroll", -1, "units")
+        elif event.num == 5:
+            self.yview("scroll", 1, "units")
+        elif sys.platform.startswith("win"):
+            self.yview("scroll", -int(event.delta / 40), "units")
+        elif sys.platform == "darwin":
+            self.yview("scroll", -event.delta, "units")  # delta is a small number of units on macOS
+        else:
+            self.yview("scroll", -1 if event.delta > 0 else 1, "units")  # delta is a multiple of 120 on X11 with Tk 8.7
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "fg_color" in kwargs:
+            self.fg_color = kwargs.pop("fg_color")
+            require_redraw = True
+
+        if "data" in kwargs or "data_callback" in kwargs or "row_count" in kwargs:
+            self.data = kwargs.pop("data", self.data)
+            self.data_callback = kwargs.pop("data_callback", self.data_callback)
+            self.row_count = kwargs.pop("row_count", self.row_count)
+            self.refresh()
+
+        if "row_height" in kwargs:
+            self.row_height = kwargs.pop("row_height")
+            self.first_index = -1
+            self.draw(no_color_updates=True)
+
+        if "width" in kwargs:
+            self.set_dimensions(width=kwargs.pop("width"))
+
+        if "height" in kwargs:
+            self.set_dimensions(height=kwargs.pop("height"))
+
+        super().configure(require_redraw=require_redraw, **kwargs)
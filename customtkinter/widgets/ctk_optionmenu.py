@@ -38,17 +38,17 @@ class CTkOptionMenu(CTkBaseClass):
         super().__init__(*args, bg_color=bg_color, width=width, height=height, **kwargs)
 
         # color variables
-        self.fg_color = ThemeManager.theme["color"]["button"] if fg_color == "default_theme" else fg_color
-        self.button_color = ThemeManager.theme["color"]["optionmenu_button"] if button_color == "default_theme" else button_color
-        self.button_hover_color = ThemeManager.theme["color"]["optionmenu_button_hover"] if button_hover_color == "default_theme" else button_hover_color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "button")
+        self.button_color = self.bind_theme_value("button_color", button_color, "color", "optionmenu_button")
+        self.button_hover_color = self.bind_theme_value("button_hover_color", button_hover_color, "color", "optionmenu_button_hover")
 
         # shape
-        self.corner_radius = ThemeManager.theme["shape"]["button_corner_radius"] if corner_radius == "default_theme" else corner_radius
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "button_corner_radius")
 
         # text and font
-        self.text_color = ThemeManager.theme["color"]["text"] if text_color == "default_theme" else text_color
-        self.text_color_disabled = ThemeManager.theme["color"]["text_button_disabled"] if text_color_disabled == "default_theme" else text_color_disabled
-        self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
+        self.text_color_disabled = self.bind_theme_value("text_color_disabled", text_color_disabled, "color", "text_button_disabled")
+        self.text_font = self.bind_theme_value("text_font", text_font, "text", "font")
         self.dropdown_text_font = dropdown_text_font
 
         # callback and hover functionality
@@ -120,8 +120,6 @@ class CTkOptionMenu(CTkBaseClass):
 
         self.bind('<Configure>', self.update_dimensions_event)
 
-        self.draw()  # initial draw
-
         if self.variable is not None:
             self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
             self.current_value = self.variable.get()
@@ -132,7 +130,8 @@ class CTkOptionMenu(CTkBaseClass):
 
         # change label text size and grid padding
         left_section_width = self._current_width - self._current_height
-        self.text_label.configure(font=self.apply_font_scaling(self.text_font))
+        if not self.font_follows_scaling(self.text_font):
+            self.text_label.configure(font=self.apply_font_scaling(self.text_font))
         self.text_label.grid(row=0, column=0, sticky="w",
                              padx=(max(self.apply_widget_scaling(self.corner_radius), self.apply_widget_scaling(3)),
                                    max(self.apply_widget_scaling(self._current_width - left_section_width + 3), self.apply_widget_scaling(3))))
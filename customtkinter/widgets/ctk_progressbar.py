@@ -42,9 +42,9 @@ class CTkProgressBar(CTkBaseClass):
         super().__init__(*args, bg_color=bg_color, width=width, height=height, **kwargs)
 
         # color
-        self.border_color = ThemeManager.theme["color"]["progressbar_border"] if border_color == "default_theme" else border_color
-        self.fg_color = ThemeManager.theme["color"]["progressbar"] if fg_color == "default_theme" else fg_color
-        self.progress_color = ThemeManager.theme["color"]["progressbar_progress"] if progress_color == "default_theme" else progress_color
+        self.border_color = self.bind_theme_value("border_color", border_color, "color", "progressbar_border")
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "progressbar")
+        self.progress_color = self.bind_theme_value("progress_color", progress_color, "color", "progressbar_progress")
 
         # control variable
         self.variable = variable
@@ -52,8 +52,8 @@ class CTkProgressBar(CTkBaseClass):
         self.variable_callback_name = None
 
         # shape
-        self.corner_radius = ThemeManager.theme["shape"]["progressbar_corner_radius"] if corner_radius == "default_theme" else corner_radius
-        self.border_width = ThemeManager.theme["shape"]["progressbar_border_width"] if border_width == "default_theme" else border_width
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "progressbar_corner_radius")
+        self.border_width = self.bind_theme_value("border_width", border_width, "shape", "progressbar_border_width")
         self.determinate_value = 0.5  # range 0-1
         self.determinate_speed = determinate_speed  # range 0-1
         self.indeterminate_value = 0  # range 0-inf
@@ -76,8 +76,6 @@ class CTkProgressBar(CTkBaseClass):
         # Each time an item is resized due to pack position mode, the binding Configure is called on the widget
         self.bind('<Configure>', self.update_dimensions_event)
 
-        self.draw()  # initial draw
-
         if self.variable is not None:
             self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
             self.variable_callback_blocked = True
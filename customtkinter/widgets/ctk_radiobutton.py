@@ -36,22 +36,22 @@ class CTkRadioButton(CTkBaseClass):
         super().__init__(*args, bg_color=bg_color, width=width, height=height, **kwargs)
 
         # color
-        self.fg_color = ThemeManager.theme["color"]["button"] if fg_color == "default_theme" else fg_color
-        self.hover_color = ThemeManager.theme["color"]["button_hover"] if hover_color == "default_theme" else hover_color
-        self.border_color = ThemeManager.theme["color"]["checkbox_border"] if border_color == "default_theme" else border_color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "button")
+        self.hover_color = self.bind_theme_value("hover_color", hover_color, "color", "button_hover")
+        self.border_color = self.bind_theme_value("border_color", border_color, "color", "checkbox_border")
 
         # shape
-        self.corner_radius = ThemeManager.theme["shape"]["radiobutton_corner_radius"] if corner_radius == "default_theme" else corner_radius
-        self.border_width_unchecked = ThemeManager.theme["shape"]["radiobutton_border_width_unchecked"] if border_width_unchecked == "default_theme" else border_width_unchecked
-        self.border_width_checked = ThemeManager.theme["shape"]["radiobutton_border_width_checked"] if border_width_checked == "default_theme" else border_width_checked
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "radiobutton_corner_radius")
+        self.border_width_unchecked = self.bind_theme_value("border_width_unchecked", border_width_unchecked, "shape", "radiobutton_border_width_unchecked")
+        self.border_width_checked = self.bind_theme_value("border_width_checked", border_width_checked, "shape", "radiobutton_border_width_checked")
         self.border_width = self.border_width_unchecked
 
         # text
         self.text = text
         self.text_label: Union[tkinter.Label, None] = None
-        self.text_color = ThemeManager.theme["color"]["text"] if text_color == "default_theme" else text_color
-        self.text_color_disabled = ThemeManager.theme["color"]["text_disabled"] if text_color_disabled == "default_theme" else text_color_disabled
-        self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
+        self.text_color_disabled = self.bind_theme_value("text_color_disabled", text_color_disabled, "color", "text_disabled")
+        self.text_font = self.bind_theme_value("text_font", text_font, "text", "font")
 
         # callback and control variables
         self.command = command
@@ -103,14 +103,14 @@ class CTkRadioButton(CTkBaseClass):
             self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
             self.check_state = True if self.variable.get() == self.value else False
 
-        self.draw()  # initial draw
         self.set_cursor()
 
     def set_scaling(self, *args, **kwargs):
         super().set_scaling(*args, **kwargs)
 
         self.grid_columnconfigure(1, weight=0, minsize=self.apply_widget_scaling(6))
-        self.text_label.configure(font=self.apply_font_scaling(self.text_font))
+        if not self.font_follows_scaling(self.text_font):
+            self.text_label.configure(font=self.apply_font_scaling(self.text_font))
 
         self.bg_canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
@@ -38,13 +38,13 @@ class CTkScrollbar(CTkBaseClass):
         super().__init__(*args, bg_color=bg_color, width=width, height=height, **kwargs)
 
         # color
-        self.fg_color = ThemeManager.theme["color"]["frame_high"] if fg_color == "default_theme" else fg_color
-        self.scrollbar_color = ThemeManager.theme["color"]["scrollbar_button"] if scrollbar_color == "default_theme" else scrollbar_color
-        self.scrollbar_hover_color = ThemeManager.theme["color"]["scrollbar_button_hover"] if scrollbar_hover_color == "default_theme" else scrollbar_hover_color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "frame_high")
+        self.scrollbar_color = self.bind_theme_value("scrollbar_color", scrollbar_color, "color", "scrollbar_button")
+        self.scrollbar_hover_color = self.bind_theme_value("scrollbar_hover_color", scrollbar_hover_color, "color", "scrollbar_button_hover")
 
         # shape
-        self.corner_radius = ThemeManager.theme["shape"]["scrollbar_corner_radius"] if corner_radius == "default_theme" else corner_radius
-        self.border_spacing = ThemeManager.theme["shape"]["scrollbar_border_spacing"] if border_spacing == "default_theme" else border_spacing
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "scrollbar_corner_radius")
+        self.border_spacing = self.bind_theme_value("border_spacing", border_spacing, "shape", "scrollbar_border_spacing")
 
         self.hover = hover
         self.hover_state = False
@@ -68,14 +68,16 @@ class CTkScrollbar(CTkBaseClass):
         self.canvas.bind("<MouseWheel>", self.mouse_scroll_event)
         self.bind('<Configure>', self.update_dimensions_event)
 
-        self.draw()
-
     def set_scaling(self, *args, **kwargs):
         super().set_scaling(*args, **kwargs)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
         self.draw(no_color_updates=True)
 
+    def set_theme(self, *args, **kwargs):
+        super().set_theme(*args, **kwargs)
+        self.draw()  # set_scaling() draws without color updates
+
     def set_dimensions(self, width=None, height=None):
         super().set_dimensions(width, height)
 
@@ -50,16 +50,16 @@ class CTkSlider(CTkBaseClass):
 
         # color
         self.border_color = border_color
-        self.fg_color = ThemeManager.theme["color"]["slider"] if fg_color == "default_theme" else fg_color
-        self.progress_color = ThemeManager.theme["color"]["slider_progress"] if progress_color == "default_theme" else progress_color
-        self.button_color = ThemeManager.theme["color"]["slider_button"] if button_color == "default_theme" else button_color
-        self.button_hover_color = ThemeManager.theme["color"]["slider_button_hover"] if button_hover_color == "default_theme" else button_hover_color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "slider")
+        self.progress_color = self.bind_theme_value("progress_color", progress_color, "color", "slider_progress")
+        self.button_color = self.bind_theme_value("button_color", button_color, "color", "slider_button")
+        self.button_hover_color = self.bind_theme_value("button_hover_color", button_hover_color, "color", "slider_button_hover")
 
         # shape
-        self.corner_radius = ThemeManager.theme["shape"]["slider_corner_radius"] if corner_radius == "default_theme" else corner_radius
-        self.button_corner_radius = ThemeManager.theme["shape"]["slider_button_corner_radius"] if button_corner_radius == "default_theme" else button_corner_radius
-        self.border_width = ThemeManager.theme["shape"]["slider_border_width"] if border_width == "default_theme" else border_width
-        self.button_length = ThemeManager.theme["shape"]["slider_button_length"] if button_length == "default_theme" else button_length
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "slider_corner_radius")
+        self.button_corner_radius = self.bind_theme_value("button_corner_radius", button_corner_radius, "shape", "slider_button_corner_radius")
+        self.border_width = self.bind_theme_value("border_width", border_width, "shape", "slider_border_width")
+        self.button_length = self.bind_theme_value("button_length", button_length, "shape", "slider_button_length")
         self.value = 0.5  # initial value of slider in percent
         self.orientation = orient
         self.hover_state = False
@@ -97,7 +97,6 @@ class CTkSlider(CTkBaseClass):
         self.bind('<Configure>', self.update_dimensions_event)
 
         self.set_cursor()
-        self.draw()  # initial draw
 
         if self.variable is not None:
             self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
@@ -0,0 +1,388 @@
+import sys
+
+from .ctk_canvas import CTkCanvas
+from ..theme_manager import ThemeManager
+from ..settings import Settings
+from .widget_base_class import CTkBaseClass
+
+
+class CTkSurfaceCanvasView:
+    """ canvas interface for the DrawEngine of a virtual widget: tags are resolved to item ids in Python, because
+        tag searches of the Tk canvas go through all items of the shared canvas, and all coordinates are shifted
+        by the position of the virtual widget """
+
+    def __init__(self, canvas: CTkCanvas):
+        self.canvas = canvas
+        self.x = 0
+        self.y = 0
+        self.tag_items = {}  # contains tags as keys and lists of item ids as values
+        self.item_tags = {}  # contains item ids as keys and their tags as values
+
+    def shift(self, coordinates) -> list:
+        if len(coordinates) == 1 and isinstance(coordinates[0], (tuple, list)):
+            coordinates = coordinates[0]
+        return [value + (self.x if i % 2 == 0 else self.y) for i, value in enumerate(coordinates)]
+
+    def add_item(self, item_id: int, tags) -> int:
+        tags = (tags,) if isinstance(tags, str) else tuple(tags)
+        self.item_tags[item_id] = tags
+        for tag in tags:
+            self.tag_items.setdefault(tag, []).append(item_id)
+        return item_id
+
+    def forget_items(self):
+        """ called when all items of the canvas got deleted """
+        self.tag_items.clear()
+        self.item_tags.clear()
+
+    def create_aa_circle(self, x_pos, y_pos, radius, tags=(), **kwargs) -> int:
+        return self.add_item(self.canvas.create_aa_circle(x_pos + self.x, y_pos + self.y, radius, **kwargs), tags)
+
+    def create_line(self, *coordinates, tags=(), **kwargs) -> int:
+        return self.add_item(self.canvas.create_line(*self.shift(coordinates), **kwargs), tags)
+
+    def create_oval(self, *coordinates, tags=(), **kwargs) -> int:
+        return self.add_item(self.canvas.create_oval(*self.shift(coordinates), **kwargs), tags)
+
+    def create_polygon(self, *coordinates, tags=(), **kwargs) -> int:
+        return self.add_item(self.canvas.create_polygon(*self.shift(coordinates), **kwargs), tags)
+
+    def create_rectangle(self, *coordinates, tags=(), **kwargs) -> int:
+        return self.add_item(self.canvas.create_rectangle(*self.shift(coordinates), **kwargs), tags)
+
+    def create_text(self, *coordinates, tags=(), **kwargs) -> int:
+        return self.add_item(self.canvas.create_text(*self.shift(coordinates), **kwargs), tags)
+
+    def coords(self, tag: str, *coordinates):
+        if len(coordinates) == 3:  # x, y and radius of a font shape circle
+            coordinates = (coordinates[0] + self.x, coordinates[1] + self.y, coordinates[2])
+        else:
+            coordinates = self.shift(coordinates)
+
+        for item_id in self.tag_items.get(tag, ()):
+            self.canvas.coords(item_id, *coordinates)
+
+    def find_withtag(self, tag: str) -> tuple:
+        return tuple(self.tag_items.get(tag, ()))
+
+    def gettags(self, tag: str) -> tuple:
+        item_ids = self.tag_items.get(tag)
+        return self.item_tags[item_ids[0]] if item_ids else ()
+
+    def bbox(self, tag: str):
+        item_ids = self.tag_items.get(tag)
+        return self.canvas.bbox(*item_ids) if item_ids else None
+
+    def delete(self, *tags):
+        item_ids = {item_id for tag in tags for item_id in self.tag_items.get(tag, ())}
+        if not item_ids:
+            return
+
+        self.canvas.delete(*item_ids)
+        for item_id in item_ids:
+            for tag in self.item_tags.pop(item_id):
+                self.tag_items[tag].remove(item_id)
+                if not self.tag_items[tag]:
+                    del self.tag_items[tag]
+
+    def delete_all(self):
+        if self.item_tags:
+            self.canvas.delete(*self.item_tags)
+        self.forget_items()
+
+    def itemconfig(self, tag: str, **kwargs):
+        for item_id in self.tag_items.get(tag, ()):
+            self.canvas.itemconfig(item_id, **kwargs)
+
+    def tag_lower(self, tag: str, below_tag: str = None):
+        below_ids = self.tag_items.get(below_tag, ())
+        for item_id in reversed(self.tag_items.get(tag, ())):
+            if below_tag is None:
+                self.canvas.tag_lower(item_id)
+            elif below_ids:
+                self.canvas.tag_lower(item_id, below_ids[0])
+
+    def tag_raise(self, tag: str, above_tag: str = None):
+        above_ids = self.tag_items.get(above_tag, ())
+        for item_id in self.tag_items.get(tag, ()):
+            if above_tag is None:
+                self.canvas.tag_raise(item_id)
+            elif above_ids:
+                self.canvas.tag_raise(item_id, above_ids[-1])
+
+
+class SurfaceHitGrid:
+    """ grid of square cells for hit-testing in unscaled coordinates, every virtual widget is stored in all cells
+        its area touches, so a hit test only checks the virtual widgets of one cell """
+
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.cells = {}  # contains (column, row) of the cells as keys and lists of virtual widgets as values
+
+    def get_cells(self, x_1, y_1, x_2, y_2) -> list:
+        return [(column, row)
+                for column in range(int(x_1 // self.cell_size), int(x_2 // self.cell_size) + 1)
+                for row in range(int(y_1 // self.cell_size), int(y_2 // self.cell_size) + 1)]
+
+    def add(self, virtual_widget):
+        for cell in self.get_cells(virtual_widget.x, virtual_widget.y,
+                                   virtual_widget.x + virtual_widget.width, virtual_widget.y + virtual_widget.height):
+            self.cells.setdefault(cell, []).append(virtual_widget)
+
+    def remove(self, virtual_widget):
+        for cell in self.get_cells(virtual_widget.x, virtual_widget.y,
+                                   virtual_widget.x + virtual_widget.width, virtual_widget.y + virtual_widget.height):
+            self.cells[cell].remove(virtual_widget)
+            if not self.cells[cell]:
+                del self.cells[cell]
+
+    def widgets_in(self, x_1, y_1, x_2, y_2):
+        """ virtual widgets in the cells of the area, a virtual widget in several cells is returned more than once """
+        for cell in self.get_cells(x_1, y_1, x_2, y_2):
+            yield from self.cells.get(cell, ())
+
+    def widget_at(self, x, y):
+        """ returns the topmost (last added) virtual widget at x, y or None """
+
+        for virtual_widget in reversed(self.cells.get((int(x // self.cell_size), int(y // self.cell_size)), ())):
+            if virtual_widget.x <= x < virtual_widget.x + virtual_widget.width and virtual_widget.y <= y < virtual_widget.y + virtual_widget.height:
+                return virtual_widget
+        return None
+
+
+class CTkSurface(CTkBaseClass):
+    """ container for many lightweight controls (CTkVirtualButton, CTkVirtualLabel, CTkVirtualCheckBox, CTkVirtualSwitch),
+        which are groups of items on one shared canvas instead of Tk widgets. Hit-testing, hover and clicks are dispatched
+        in Python with a grid of cells, virtual widgets are drawn when they get scrolled into view for the first time.
+        Can be scrolled with the mouse wheel or with a CTkScrollbar (command=surface.yview, yscrollcommand=scrollbar.set). """
+
+    hit_grid_size = 100  # size of the cells of the hit-testing grid, unscaled
+
+    def __init__(self, *args,
+                 bg_color=None,
+                 fg_color="default_theme",
+                 width=400,
+                 height=300,
+                 xscrollcommand=None,
+                 yscrollcommand=None,
+                 **kwargs):
+
+        # transfer basic functionality (bg_color, size, _appearance_mode, scaling) to CTkBaseClass
+        super().__init__(*args, bg_color=bg_color, width=width, height=height, **kwargs)
+
+        # color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "frame_low")
+
+        # virtual widgets
+        self.virtual_widgets = []
+        self.hit_grid = SurfaceHitGrid(self.hit_grid_size)
+        self.hover_widget = None
+        self.content_width = 0  # unscaled size of the area covered by virtual widgets
+        self.content_height = 0
+        self.content_size_outdated = False  # True after virtual widgets were removed or moved, content may have shrunk
+        self.idle_update_id = None
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.canvas = CTkCanvas(master=self,
+                                highlightthickness=0,
+                                width=self.apply_widget_scaling(self._desired_width),
+                                height=self.apply_widget_scaling(self._desired_height),
+                                xscrollincrement=self.apply_widget_scaling(20),
+                                yscrollincrement=self.apply_widget_scaling(20),
+                                xscrollcommand=xscrollcommand,
+                                yscrollcommand=yscrollcommand)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+
+        self.canvas.bind("<Motion>", self.motion_event)
+        self.canvas.bind("<Leave>", self.leave_event)
+        self.canvas.bind("<Button-1>", self.click_event)
+        self.canvas.bind("<MouseWheel>", self.mouse_scroll_event)
+        self.canvas.bind("<Button-4>", self.mouse_scroll_event)
+        self.canvas.bind("<Button-5>", self.mouse_scroll_event)
+        self.bind('<Configure>', self.update_dimensions_event)
+
+    def destroy(self):
+        if self.idle_update_id is not None:
+            self.after_cancel(self.idle_update_id)
+
+        for virtual_widget in self.virtual_widgets:
+            virtual_widget.remove_callbacks()
+        self.virtual_widgets.clear()
+
+        super().destroy()
+
+    def set_scaling(self, *args, **kwargs):
+        super().set_scaling(*args, **kwargs)
+
+        self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
+                              height=self.apply_widget_scaling(self._desired_height),
+                              xscrollincrement=self.apply_widget_scaling(20),
+                              yscrollincrement=self.apply_widget_scaling(20))
+
+        # every item changes position and size, so all items get deleted and the visible virtual widgets are drawn again
+        self.canvas.delete("all")
+        for virtual_widget in self.virtual_widgets:
+            virtual_widget.canvas_view.forget_items()
+        self.update_scrollregion()
+        self.draw()
+
+    def set_dimensions(self, width=None, height=None):
+        super().set_dimensions(width, height)
+
+        self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
+                              height=self.apply_widget_scaling(self._desired_height))
+        self.draw(no_color_updates=True)
+
+    def set_theme(self, old_theme: dict):
+        for virtual_widget in self.virtual_widgets:
+            ThemeManager.update_theme_bindings(virtual_widget, virtual_widget.theme_bindings, old_theme)
+
+        super().set_theme(old_theme)  # draws the surface and marks all virtual widgets to be drawn again
+
+    def content_color(self):
+        """ background color of the virtual widgets """
+        return self.bg_color if self.fg_color is None else self.fg_color
+
+    def draw(self, no_color_updates=False):
+        if no_color_updates is False:
+            self.canvas.configure(bg=ThemeManager.single_color(self.content_color(), self._appearance_mode))
+
+            # virtual widgets outside the visible area get drawn with the new colors when they are scrolled into view
+            for virtual_widget in self.virtual_widgets:
+                virtual_widget.needs_draw = True
+
+        self.draw_visible()
+
+    def draw_visible(self):
+        """ draws the virtual widgets in the visible area which are not drawn or not up to date """
+
+        x_1, y_1 = self.canvas.canvasx(0) / self._widget_scaling, self.canvas.canvasy(0) / self._widget_scaling
+        x_2, y_2 = x_1 + self._current_width, y_1 + self._current_height
+
+        for virtual_widget in self.hit_grid.widgets_in(x_1, y_1, x_2, y_2):
+            if virtual_widget.needs_draw:
+                virtual_widget.draw()
+
+    def add_virtual_widget(self, virtual_widget):
+        """ called by the constructor of the virtual widgets """
+
+        self.virtual_widgets.append(virtual_widget)
+        self.add_to_hit_grid(virtual_widget)
+
+    def remove_virtual_widget(self, virtual_widget):
+        self.remove_from_hit_grid(virtual_widget)
+        self.virtual_widgets.remove(virtual_widget)
+        virtual_widget.canvas_view.delete_all()
+
+        if self.hover_widget is virtual_widget:
+            self.hover_widget = None
+        self.schedule_update()
+
+    def add_to_hit_grid(self, virtual_widget):
+        self.hit_grid.add(virtual_widget)
+
+        self.content_width = max(self.content_width, virtual_widget.x + virtual_widget.width)
+        self.content_height = max(self.content_height, virtual_widget.y + virtual_widget.height)
+        self.schedule_update()
+
+    def remove_from_hit_grid(self, virtual_widget):
+        self.hit_grid.remove(virtual_widget)
+        self.content_size_outdated = True
+
+    def virtual_widget_at(self, event):
+        """ returns the topmost virtual widget at the position of the mouse event or None """
+
+        return self.hit_grid.widget_at(self.canvas.canvasx(event.x) / self._widget_scaling,
+                                       self.canvas.canvasy(event.y) / self._widget_scaling)
+
+    def schedule_update(self):
+        """ scrollregion and drawing of new or changed virtual widgets are done once when Tk is idle """
+
+        if self.idle_update_id is None:
+            self.idle_update_id = self.after_idle(self.idle_update)
+
+    def idle_update(self):
+        self.idle_update_id = None
+        self.update_scrollregion()
+        self.draw(no_color_updates=True)
+
+    def update_scrollregion(self):
+        if self.content_size_outdated:
+            self.content_size_outdated = False
+            self.content_width = max((v.x + v.width for v in self.virtual_widgets), default=0)
+            self.content_height = max((v.y + v.height for v in self.virtual_widgets), default=0)
+
+        self.canvas.configure(scrollregion=(0, 0, self.apply_widget_scaling(self.content_width), self.apply_widget_scaling(self.content_height)))
+
+    def set_hover_widget(self, virtual_widget):
+        if virtual_widget is not self.hover_widget:
+            if self.hover_widget is not None:
+                self.hover_widget.on_leave()
+            self.hover_widget = virtual_widget
+            if virtual_widget is not None:
+                virtual_widget.on_enter()
+
+            if Settings.cursor_manipulation_enabled:
+                if virtual_widget is not None and virtual_widget.is_clickable():
+                    if sys.platform == "darwin":
+                        self.canvas.configure(cursor="pointinghand")
+                    elif sys.platform.startswith("win"):
+                        self.canvas.configure(cursor="hand2")
+                else:
+                    self.canvas.configure(cursor="")
+
+    def motion_event(self, event):
+        self.set_hover_widget(self.virtual_widget_at(event))
+
+    def leave_event(self, event):
+        self.set_hover_widget(None)
+
+    def click_event(self, event):
+        virtual_widget = self.virtual_widget_at(event)
+        if virtual_widget is not None:
+            virtual_widget.clicked()
+
+    def mouse_scroll_event(self, event):
+        if event.num == 4:
+            self.yview("scroll", -1, "units")
+        elif event.num == 5:
+            self.yview("scroll", 1, "units")
+        elif sys.platform.startswith("win"):
+            self.yview("scroll", -int(event.delta / 40), "units")
+        elif sys.platform == "darwin":
+            self.yview("scroll", -event.delta, "units")  # delta is a small number of units on macOS
+        else:
+            self.yview("scroll", -1 if event.delta > 0 else 1, "units")  # delta is a multiple of 120 on X11 with Tk 8.7
+
+    def xview(self, *args):
+        result = self.canvas.xview(*args)
+        if args:
+            self.draw(no_color_updates=True)  # draw virtual widgets which were scrolled into view
+        return result
+
+    def yview(self, *args):
+        result = self.canvas.yview(*args)
+        if args:
+            self.draw(no_color_updates=True)
+        return result
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "fg_color" in kwargs:
+            self.fg_color = kwargs.pop("fg_color")
+            require_redraw = True
+
+        if "xscrollcommand" in kwargs:
+            self.canvas.configure(xscrollcommand=kwargs.pop("xscrollcommand"))
+
+        if "yscrollcommand" in kwargs:
+            self.canvas.configure(yscrollcommand=kwargs.pop("yscrollcommand"))
+
+        if "width" in kwargs:
+            self.set_dimensions(width=kwargs.pop("width"))
+
+        if "height" in kwargs:
+            self.set_dimensions(height=kwargs.pop("height"))
+
+        super().configure(require_redraw=require_redraw, **kwargs)
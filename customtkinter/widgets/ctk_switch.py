@@ -39,23 +39,23 @@ class CTkSwitch(CTkBaseClass):
 
         # color
         self.border_color = border_color
-        self.fg_color = ThemeManager.theme["color"]["switch"] if fg_color == "default_theme" else fg_color
-        self.progress_color = ThemeManager.theme["color"]["switch_progress"] if progress_color == "default_theme" else progress_color
-        self.button_color = ThemeManager.theme["color"]["switch_button"] if button_color == "default_theme" else button_color
-        self.button_hover_color = ThemeManager.theme["color"]["switch_button_hover"] if button_hover_color == "default_theme" else button_hover_color
-        self.text_color = ThemeManager.theme["color"]["text"] if text_color == "default_theme" else text_color
-        self.text_color_disabled = ThemeManager.theme["color"]["text_disabled"] if text_color_disabled == "default_theme" else text_color_disabled
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "switch")
+        self.progress_color = self.bind_theme_value("progress_color", progress_color, "color", "switch_progress")
+        self.button_color = self.bind_theme_value("button_color", button_color, "color", "switch_button")
+        self.button_hover_color = self.bind_theme_value("button_hover_color", button_hover_color, "color", "switch_button_hover")
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
+        self.text_color_disabled = self.bind_theme_value("text_color_disabled", text_color_disabled, "color", "text_disabled")
 
         # text
         self.text = text
         self.text_label = None
-        self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
+        self.text_font = self.bind_theme_value("text_font", text_font, "text", "font")
 
         # shape
-        self.corner_radius = ThemeManager.theme["shape"]["switch_corner_radius"] if corner_radius == "default_theme" else corner_radius
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "switch_corner_radius")
         # self.button_corner_radius = ThemeManager.theme["shape"]["switch_button_corner_radius"] if button_corner_radius == "default_theme" else button_corner_radius
-        self.border_width = ThemeManager.theme["shape"]["switch_border_width"] if border_width == "default_theme" else border_width
-        self.button_length = ThemeManager.theme["shape"]["switch_button_length"] if button_length == "default_theme" else button_length
+        self.border_width = self.bind_theme_value("border_width", border_width, "shape", "switch_border_width")
+        self.button_length = self.bind_theme_value("button_length", button_length, "shape", "switch_button_length")
         self.hover_state = False
         self.check_state = False  # True if switch is activated
         self.state = state
@@ -108,14 +108,14 @@ class CTkSwitch(CTkBaseClass):
             self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
             self.check_state = True if self.variable.get() == self.onvalue else False
 
-        self.draw()  # initial draw
         self.set_cursor()
 
     def set_scaling(self, *args, **kwargs):
         super().set_scaling(*args, **kwargs)
 
         self.grid_columnconfigure(1, weight=0, minsize=self.apply_widget_scaling(6))
-        self.text_label.configure(font=self.apply_font_scaling(self.text_font))
+        if not self.font_follows_scaling(self.text_font):
+            self.text_label.configure(font=self.apply_font_scaling(self.text_font))
 
         self.bg_canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
@@ -151,7 +151,6 @@ class CTkSwitch(CTkBaseClass):
                         self.text_label.configure(cursor="hand2")
 
     def draw(self, no_color_updates=False):
-
         if self.check_state is True:
             requires_recoloring = self.draw_engine.draw_rounded_slider_with_border_and_button(self.apply_widget_scaling(self._current_width),
                                                                                               self.apply_widget_scaling(self._current_height),
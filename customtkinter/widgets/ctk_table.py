@@ -0,0 +1,495 @@
+import sys
+import math
+import array
+import heapq
+import itertools
+import tkinter
+import tkinter.font
+from typing import Union, Tuple, Sequence
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .ctk_canvas import CTkCanvas
+from .ctk_scrollbar import CTkScrollbar
+from ..theme_manager import ThemeManager
+from .widget_base_class import CTkBaseClass
+
+
+class TableColumnStore:
+    """ Column oriented storage for CTkTable. Columns of type int and float are numpy arrays with spare capacity
+        (array.array without numpy), all other columns are lists. Sort indexes are computed once per column
+        and merged with the new rows when rows are appended. """
+
+    def __init__(self, column_types: Sequence[type]):
+        self.column_types = list(column_types)
+        self.columns = [self.create_column(column_type) for column_type in self.column_types]
+        self.row_count = 0
+        self.sort_indexes = {}  # contains column numbers as keys and row numbers sorted by the column as values
+
+    @staticmethod
+    def create_column(column_type: type):
+        if column_type in (int, float):
+            if numpy is not None:
+                return numpy.empty(1024, dtype=numpy.int64 if column_type is int else numpy.float64)
+            return array.array("q" if column_type is int else "d")
+        return []
+
+    def is_numpy_column(self, column: int) -> bool:
+        return numpy is not None and self.column_types[column] in (int, float)
+
+    def values(self, column: int):
+        """ values of column in row order, without the spare capacity of numpy columns """
+        if self.is_numpy_column(column):
+            return self.columns[column][:self.row_count]
+        return self.columns[column]
+
+    def get(self, row: int, column: int):
+        return self.columns[column][row]
+
+    def append_rows(self, rows: Sequence[Sequence]):
+        old_row_count = self.row_count
+        new_row_count = old_row_count + len(rows)
+
+        for column, column_values in enumerate(zip(*rows)):
+            if self.is_numpy_column(column):
+                if new_row_count > len(self.columns[column]):  # grow capacity exponentially, so appending is amortized O(1)
+                    grown_column = numpy.empty(max(new_row_count, 2 * len(self.columns[column])), dtype=self.columns[column].dtype)
+                    grown_column[:old_row_count] = self.columns[column][:old_row_count]
+                    self.columns[column] = grown_column
+                self.columns[column][old_row_count:new_row_count] = column_values
+            else:
+                self.columns[column].extend(column_values)
+
+        self.row_count = new_row_count
+
+        for column in self.sort_indexes:
+            self.sort_indexes[column] = self.merge_sort_index(column, old_row_count)
+
+    def get_sort_index(self, column: int, descending: bool = False):
+        if column not in self.sort_indexes:
+            self.sort_indexes[column] = self.merge_sort_index(column, 0)
+        if descending:
+            return self.reverse_sort_index(column, self.sort_indexes[column])
+        return self.sort_indexes[column]
+
+    def merge_sort_index(self, column: int, old_row_count: int):
+        """ sorts the rows from old_row_count on and merges them into the existing sort index of column (stable) """
+
+        new_rows = numpy.arange(old_row_count, self.row_count) if self.is_numpy_column(column) else range(old_row_count, self.row_count)
+        new_rows = self.sort_rows(column, new_rows)
+        if old_row_count == 0:
+            return new_rows
+        return self.merge_rows(column, self.sort_indexes[column], new_rows)
+
+    def sort_rows(self, column: int, rows, descending: bool = False):
+        """ rows sorted by the values of column, rows with equal values keep their order (also if descending) """
+
+        values = self.values(column)
+
+        if self.is_numpy_column(column):
+            rows = numpy.asarray(rows, dtype=numpy.int64)
+            if descending:  # stable ascending sort of the reversed rows, reversed again
+                return rows[::-1][numpy.argsort(values[rows[::-1]], kind="stable")][::-1]
+            return rows[numpy.argsort(values[rows], kind="stable")]
+
+        return sorted(rows, key=values.__getitem__, reverse=descending)
+
+    def merge_rows(self, column: int, sorted_rows, new_rows, descending: bool = False):
+        """ merges new_rows into sorted_rows, both sorted by sort_rows(), new rows come after existing rows with equal values """
+
+        values = self.values(column)
+
+        if self.is_numpy_column(column):
+            sorted_rows = numpy.asarray(sorted_rows, dtype=numpy.int64)
+            new_rows = numpy.asarray(new_rows, dtype=numpy.int64)
+            sorted_values = values[sorted_rows]
+            if descending:
+                positions = len(sorted_rows) - numpy.searchsorted(sorted_values[::-1], values[new_rows], side="left")
+            else:
+                positions = numpy.searchsorted(sorted_values, values[new_rows], side="right")
+            return numpy.insert(sorted_rows, positions, new_rows)
+
+        return list(heapq.merge(sorted_rows, new_rows, key=values.__getitem__, reverse=descending))
+
+    def reverse_sort_index(self, column: int, sort_index):
+        """ descending order from an ascending sort index, rows with equal values keep their insertion order """
+
+        values = self.values(column)
+
+        if self.is_numpy_column(column):
+            # reverse the whole index, then every group of equal values again
+            rows = sort_index[::-1]
+            sorted_values = values[rows]
+            group_starts = numpy.ones(len(rows), dtype=bool)
+            group_starts[1:] = sorted_values[1:] != sorted_values[:-1]
+            starts = numpy.flatnonzero(group_starts)
+            ends = numpy.append(starts[1:], len(rows))
+            groups = numpy.cumsum(group_starts) - 1
+            reversed_rows = numpy.empty_like(rows)
+            reversed_rows[starts[groups] + ends[groups] - 1 - numpy.arange(len(rows))] = rows
+            return reversed_rows
+
+        return [row for _, group in itertools.groupby(reversed(sort_index), key=values.__getitem__) for row in reversed(list(group))]
+
+    def range_rows(self, column: int, low=None, high=None):
+        """ rows with low <= value <= high, found with binary search in the sort index """
+
+        sort_index, values = self.get_sort_index(column), self.values(column)
+
+        if self.is_numpy_column(column):
+            sorted_values = values[sort_index]
+            start = 0 if low is None else numpy.searchsorted(sorted_values, low, side="left")
+            end = len(sort_index) if high is None else numpy.searchsorted(sorted_values, high, side="right")
+            return sort_index[start:end]
+
+        def bisect(value, right: bool) -> int:
+            start, end = 0, len(sort_index)
+            while start < end:
+                middle = (start + end) // 2
+                if values[sort_index[middle]] < value or (right and values[sort_index[middle]] == value):
+                    start = middle + 1
+                else:
+                    end = middle
+            return start
+
+        return sort_index[0 if low is None else bisect(low, False):len(sort_index) if high is None else bisect(high, True)]
+
+
+class CTkTable(CTkBaseClass):
+    """ Table for large data sets: the data is kept in a TableColumnStore and only the visible cells are text items
+        on a CTkCanvas, which get new texts while scrolling. Clicking a header sorts by the column. Sorting and
+        range filters use the sort indexes of the store, appended rows are merged into them. """
+
+    def __init__(self, *args,
+                 bg_color: Union[str, Tuple[str, str], None] = None,
+                 fg_color: Union[str, Tuple[str, str], None] = "default_theme",
+                 header_color: Union[str, Tuple[str, str]] = "default_theme",
+                 text_color: Union[str, Tuple[str, str]] = "default_theme",
+                 width: int = 600,
+                 height: int = 400,
+                 columns: Sequence[Tuple[str, type]] = (),
+                 column_widths: Sequence[int] = None,
+                 row_height: int = 24,
+                 text_font: any = "default_theme",
+                 **kwargs):
+
+        # transfer basic functionality (bg_color, size, _appearance_mode, scaling) to CTkBaseClass
+        super().__init__(*args, bg_color=bg_color, width=width, height=height, **kwargs)
+
+        # color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "frame_low")
+        self.header_color = self.bind_theme_value("header_color", header_color, "color", "frame_high")
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
+
+        # text
+        self.text_font = self.bind_theme_value("text_font", text_font, "text", "font")
+
+        # data
+        self.column_names = [name for name, column_type in columns]
+        self.column_widths = [100] * len(columns) if column_widths is None else list(column_widths)
+        self.row_height = row_height
+        self.store = TableColumnStore([column_type for name, column_type in columns])
+
+        self.sort_column = None
+        self.sort_descending = False
+        self.filters = {}  # contains column numbers as keys and (low, high, contains) as values
+        self.view = None  # row numbers in display order, None if all rows are shown in insertion order
+        self.first_row = 0  # position in the view of the topmost visible row
+
+        # canvas items of the visible cells, the cells keep their last text to skip unchanged itemconfigure calls
+        self.header_items = []
+        self.cell_items = []  # one list of item ids per visible row
+        self.cell_texts = []
+        self.character_width = 1  # width of "0" in the scaled font, used to shorten texts to the column width
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.canvas = CTkCanvas(master=self,
+                                highlightthickness=0,
+                                width=self.apply_widget_scaling(self._desired_width),
+                                height=self.apply_widget_scaling(self._desired_height))
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+
+        self.scrollbar = CTkScrollbar(self, command=self.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.canvas.bind("<Button-1>", self.clicked)
+        self.canvas.bind("<MouseWheel>", self.mouse_scroll_event)
+        self.canvas.bind("<Button-4>", self.mouse_scroll_event)
+        self.canvas.bind("<Button-5>", self.mouse_scroll_event)
+        self.bind('<Configure>', self.update_dimensions_event)
+
+    def set_scaling(self, *args, **kwargs):
+        super().set_scaling(*args, **kwargs)
+
+        self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
+                              height=self.apply_widget_scaling(self._desired_height))
+        self.canvas.delete("all")  # all cells are created again with the new row height and font
+        self.header_items, self.cell_items, self.cell_texts = [], [], []
+        self.draw()
+
+    def set_dimensions(self, width=None, height=None):
+        super().set_dimensions(width, height)
+
+        self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
+                              height=self.apply_widget_scaling(self._desired_height))
+        self.draw()
+
+    def append_rows(self, rows: Sequence[Sequence]):
+        """ appends rows (sequences with one value per column), sort indexes and filters are updated incrementally """
+
+        if not rows:
+            return
+
+        old_row_count = self.store.row_count
+        self.store.append_rows(rows)
+
+        # only the new rows are filtered and merged into the view
+        if self.sort_column is not None or self.filters:
+            new_rows = self.filter_rows(old_row_count)
+            if self.sort_column is not None:
+                new_rows = self.store.sort_rows(self.sort_column, new_rows, self.sort_descending)
+                self.view = self.store.merge_rows(self.sort_column, self.view, new_rows, self.sort_descending)
+            elif numpy is not None:
+                self.view = numpy.concatenate((self.view, numpy.asarray(new_rows, dtype=numpy.int64)))
+            else:
+                self.view = self.view + list(new_rows)
+        self.draw(no_color_updates=True)
+
+    def sort(self, column: Union[int, str, None], descending: bool = False):
+        """ sorts by column (number or name), None restores the insertion order """
+
+        self.sort_column = self.column_names.index(column) if isinstance(column, str) else column
+        self.sort_descending = descending
+        self.update_view()
+        self.draw()
+
+    def filter(self, column: Union[int, str], low=None, high=None, contains: str = None):
+        """ shows only rows with low <= value <= high and with contains in the text of the value,
+            filters of different columns are combined, filter(column) removes the filter of column """
+
+        column = self.column_names.index(column) if isinstance(column, str) else column
+        if low is None and high is None and contains is None:
+            self.filters.pop(column, None)
+        else:
+            self.filters[column] = (low, high, contains)
+        self.first_row = 0
+        self.update_view()
+        self.draw(no_color_updates=True)
+
+    def update_view(self):
+        """ computes the display order from the sort index and the filters """
+
+        row_count = self.store.row_count
+
+        if self.filters:
+            if numpy is not None:
+                mask = numpy.ones(row_count, dtype=bool)
+                for column, (low, high, contains) in self.filters.items():
+                    column_mask = numpy.zeros(row_count, dtype=bool)
+                    if low is not None or high is not None:
+                        column_mask[self.store.range_rows(column, low, high)] = True
+                    else:
+                        column_mask[:] = True
+                    if contains is not None:
+                        column_mask &= numpy.fromiter((contains in str(value) for value in self.store.values(column)), dtype=bool, count=row_count)
+                    mask &= column_mask
+            else:
+                mask = bytearray(b"\x01") * row_count
+                for column, (low, high, contains) in self.filters.items():
+                    column_mask = bytearray(row_count)
+                    for row in (self.store.range_rows(column, low, high) if low is not None or high is not None else range(row_count)):
+                        column_mask[row] = 1
+                    if contains is not None:
+                        values = self.store.values(column)
+                        for row in range(row_count):
+                            if column_mask[row] and contains not in str(values[row]):
+                                column_mask[row] = 0
+                    mask = bytearray(a & b for a, b in zip(mask, column_mask))
+        else:
+            mask = None
+
+        if self.sort_column is None:
+            order = numpy.arange(row_count) if numpy is not None else range(row_count)
+        else:
+            order = self.store.get_sort_index(self.sort_column, self.sort_descending)
+
+        if mask is None:
+            self.view = None if self.sort_column is None else order
+        elif numpy is not None:
+            order = numpy.asarray(order)
+            self.view = order[mask[order]]
+        else:
+            self.view = [row for row in order if mask[row]]
+
+    def filter_rows(self, start: int):
+        """ rows from start on which pass all filters, in insertion order """
+
+        rows = range(start, self.store.row_count)
+        for column, (low, high, contains) in self.filters.items():
+            values = self.store.values(column)
+            if self.store.is_numpy_column(column) and contains is None:
+                rows = numpy.asarray(rows, dtype=numpy.int64)
+                mask = numpy.ones(len(rows), dtype=bool)
+                if low is not None:
+                    mask &= values[rows] >= low
+                if high is not None:
+                    mask &= values[rows] <= high
+                rows = rows[mask]
+            else:
+                rows = [row for row in rows if (low is None or values[row] >= low) and (high is None or values[row] <= high)
+                        and (contains is None or contains in str(values[row]))]
+        return rows
+
+    def get_view_length(self) -> int:
+        return self.store.row_count if self.view is None else len(self.view)
+
+    def get_visible_row_count(self) -> int:
+        return max(0, math.ceil(self._current_height / self.row_height) - 1)  # first row is the header
+
+    def format_value(self, value, column: int, max_characters: int) -> str:
+        text = str(value)
+        return text if len(text) <= max_characters else text[:max(0, max_characters - 1)] + "…"
+
+    def draw(self, no_color_updates=False):
+        row_height = self.apply_widget_scaling(self.row_height)
+        column_x = [0]
+        for column_width in self.column_widths:
+            column_x.append(column_x[-1] + self.apply_widget_scaling(column_width))
+
+        # header with background rectangle
+        if not self.header_items:
+            self.canvas.create_rectangle(0, 0, 0, 0, width=0, tags="header_background")
+            self.header_items = [self.canvas.create_text(0, 0, anchor=tkinter.W) for _ in self.column_names]
+            self.character_width = max(1, tkinter.font.Font(root=self, font=self.apply_font_scaling(self.text_font)).measure("0"))
+            no_color_updates = False
+
+        self.canvas.coords("header_background", 0, 0, self.apply_widget_scaling(self._current_width), row_height)
+        font = self.apply_font_scaling(self.text_font)
+        for column, item in enumerate(self.header_items):
+            sort_marker = "" if column != self.sort_column else " ▼" if self.sort_descending else " ▲"
+            self.canvas.itemconfigure(item, text=self.column_names[column] + sort_marker, font=font)
+            self.canvas.coords(item, column_x[column] + self.apply_widget_scaling(6), row_height / 2)
+
+        # create or delete text items when the number of visible rows changed
+        visible_row_count = self.get_visible_row_count()
+        while len(self.cell_items) < visible_row_count:
+            y = (len(self.cell_items) + 1.5) * row_height
+            self.cell_items.append([self.canvas.create_text(column_x[column] + self.apply_widget_scaling(6), y, anchor=tkinter.W, font=font)
+                                    for column in range(len(self.column_names))])
+            self.cell_texts.append([""] * len(self.column_names))
+            no_color_updates = False
+        while len(self.cell_items) > visible_row_count:
+            self.canvas.delete(*self.cell_items.pop())
+            self.cell_texts.pop()
+
+        if no_color_updates is False:
+            self.canvas.configure(bg=ThemeManager.single_color(self.bg_color if self.fg_color is None else self.fg_color, self._appearance_mode))
+            self.canvas.itemconfigure("header_background", fill=ThemeManager.single_color(self.header_color, self._appearance_mode))
+            text_color = ThemeManager.single_color(self.text_color, self._appearance_mode)
+            for item in self.header_items:
+                self.canvas.itemconfigure(item, fill=text_color)
+            for row_items in self.cell_items:
+                for item in row_items:
+                    self.canvas.itemconfigure(item, fill=text_color)
+
+        self.update_cells()
+
+    def update_cells(self):
+        """ sets the texts of the visible cells, only for cells with a changed text """
+
+        view_length = self.get_view_length()
+        self.first_row = max(0, min(self.first_row, view_length - len(self.cell_items)))
+
+        max_characters = [int((self.apply_widget_scaling(width) - self.apply_widget_scaling(12)) / self.character_width)
+                          for width in self.column_widths]
+
+        for visible_row, (row_items, row_texts) in enumerate(zip(self.cell_items, self.cell_texts)):
+            position = self.first_row + visible_row
+            if position < view_length:
+                row = position if self.view is None else int(self.view[position])
+                texts = [self.format_value(self.store.get(row, column), column, max_characters[column]) for column in range(len(row_items))]
+            else:
+                texts = [""] * len(row_items)
+
+            for column, text in enumerate(texts):
+                if text != row_texts[column]:
+                    row_texts[column] = text
+                    self.canvas.itemconfigure(row_items[column], text=text)
+
+        if view_length == 0:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.first_row / view_length, min(1, (self.first_row + len(self.cell_items)) / view_length))
+
+    def yview(self, *args):
+        view_length = self.get_view_length()
+
+        if not args:
+            if view_length == 0:
+                return 0.0, 1.0
+            return self.first_row / view_length, min(1.0, (self.first_row + len(self.cell_items)) / view_length)
+
+        if args[0] == "moveto":
+            self.first_row = int(float(args[1]) * view_length)
+        elif args[0] == "scroll":
+            if args[2] == "pages":
+                self.first_row += int(args[1]) * len(self.cell_items)
+            else:
+                self.first_row += int(args[1])
+
+        self.draw(no_color_updates=True)
+
+    def mouse_scroll_event(self, event):
+        if event.num == 4:
+            self.yview("scroll", -3, "units")
+        elif event.num == 5:
+            self.yview("scroll", 3, "units")
+        elif sys.platform.startswith("win"):
+            self.yview("scroll", -int(event.delta / 40), "units")
+        elif sys.platform == "darwin":
+            self.yview("scroll", -event.delta, "units")  # delta is a small number of units on macOS
+        else:
+            self.yview("scroll", -3 if event.delta > 0 else 3, "units")  # delta is a multiple of 120 on X11 with Tk 8.7
+
+    def clicked(self, event):
+        # click on the header sorts by the column, a second click reverses the order
+        if event.y < self.apply_widget_scaling(self.row_height):
+            x = 0
+            for column, column_width in enumerate(self.column_widths):
+                x += self.apply_widget_scaling(column_width)
+                if event.x < x:
+                    self.sort(column, descending=not self.sort_descending if self.sort_column == column else False)
+                    break
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "fg_color" in kwargs:
+            self.fg_color = kwargs.pop("fg_color")
+            require_redraw = True
+
+        if "header_color" in kwargs:
+            self.header_color = kwargs.pop("header_color")
+            require_redraw = True
+
+        if "text_color" in kwargs:
+            self.text_color = kwargs.pop("text_color")
+            require_redraw = True
+
+        if "text_font" in kwargs or "column_widths" in kwargs:
+            self.text_font = kwargs.pop("text_font", self.text_font)
+            self.column_widths = list(kwargs.pop("column_widths", self.column_widths))
+            self.canvas.delete("all")  # all cells are created again with the new font and positions
+            self.header_items, self.cell_items, self.cell_texts = [], [], []
+            require_redraw = True
+
+        if "width" in kwargs:
+            self.set_dimensions(width=kwargs.pop("width"))
+
+        if "height" in kwargs:
+            self.set_dimensions(height=kwargs.pop("height"))
+
+        super().configure(require_redraw=require_redraw, **kwargs)
@@ -1,12 +1,60 @@
+import os
+import time
+import mmap
+import array
 import tkinter
+import tkinter.font
+import threading
+import collections
+from typing import Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from .ctk_canvas import CTkCanvas
 from ..theme_manager import ThemeManager
 from ..draw_engine import DrawEngine
 from .widget_base_class import CTkBaseClass
+from .ctk_highlighter import CTkHighlighter
+
+
+class HighlightLineQueue:
+    """ line numbers waiting for lexing, overlapping line ranges are merged, so every line is queued once.
+        Visible lines are returned by pop() before the other lines. """
+
+    def __init__(self):
+        self.visible_lines = set()
+        self.lines = set()
+
+    def __bool__(self) -> bool:
+        return bool(self.visible_lines or self.lines)
+
+    def add(self, first_line: int, last_line: int, visible: bool = False):
+        (self.visible_lines if visible else self.lines).update(range(max(1, first_line), last_line + 1))
+
+    def pop(self) -> int:
+        if self.visible_lines:
+            line = self.visible_lines.pop()
+            self.lines.discard(line)
+            return line
+        return self.lines.pop()
+
+    def clear(self):
+        self.visible_lines.clear()
+        self.lines.clear()
 
 
 class CTkTextbox(CTkBaseClass):
+    """ tkinter.Text with rounded corners and border, with a log mode (log_mode=True and append()),
+        a file viewer mode (open_file()) and incremental syntax highlighting (highlighter, see set_highlighter()) """
+
+    append_interval = 16  # ms from the first append to the batched insert of the log mode, about one frame
+    file_index_chunk_size = 4 * 1024 * 1024  # bytes the index thread searches for line ends at once
+    file_index_poll_interval = 100  # ms between two updates of the scrollbar while the file is indexed
+    highlight_time_slice = 10  # ms of lexing in one idle callback
+
     def __init__(self, *args,
                  bg_color=None,
                  fg_color="default_theme",
@@ -17,6 +65,10 @@ class CTkTextbox(CTkBaseClass):
                  text_color="default_theme",
                  width=200,
                  height=200,
+                 log_mode: bool = False,
+                 max_lines: int = None,
+                 file_overscan: int = 200,
+                 highlighter: CTkHighlighter = None,
                  **kwargs):
 
         # transfer basic functionality (bg_color, size, _appearance_mode, scaling) to CTkBaseClass
@@ -26,16 +78,47 @@ class CTkTextbox(CTkBaseClass):
             super().__init__(*args, bg_color=bg_color, width=width, height=height)
 
         # color
-        self.fg_color = ThemeManager.theme["color"]["entry"] if fg_color == "default_theme" else fg_color
-        self.border_color = ThemeManager.theme["color"]["frame_border"] if border_color == "default_theme" else border_color
-        self.text_color = ThemeManager.theme["color"]["text"] if text_color == "default_theme" else text_color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "entry")
+        self.border_color = self.bind_theme_value("border_color", border_color, "color", "frame_border")
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
 
         # shape
-        self.corner_radius = ThemeManager.theme["shape"]["frame_corner_radius"] if corner_radius == "default_theme" else corner_radius
-        self.border_width = ThemeManager.theme["shape"]["frame_border_width"] if border_width == "default_theme" else border_width
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "frame_corner_radius")
+        self.border_width = self.bind_theme_value("border_width", border_width, "shape", "frame_border_width")
 
         # text
-        self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
+        self.text_font = self.bind_theme_value("text_font", text_font, "text", "font")
+
+        # log mode
+        self.log_mode = log_mode
+        self.max_lines = max_lines
+        self.append_queue = collections.deque()  # append and popleft of a deque are thread-safe
+        self.append_lock = threading.Lock()
+        self.append_scheduled = False  # True from the first append until the queue is drained, protected by append_lock
+        self.append_after_id = None
+
+        # file viewer mode
+        self.file = None
+        self.file_mmap = None
+        self.file_size = 0
+        self.file_encoding = "utf-8"
+        self.file_line_offsets = None  # start offset of every line, extended by the index thread
+        self.file_index_complete = False
+        self.file_index_thread = None
+        self.file_index_stop_event = None
+        self.file_index_after_id = None
+        self.file_overscan = file_overscan
+        self.file_page_start = 0  # first line of the file which is inserted in the tkinter.Text
+        self.file_page_end = 0
+        self.file_top_line = 0
+        self.file_textbox_state = None
+        self.file_line_height = None  # linespace of the scaled font, measured when it's needed
+        self.yscrollcommand = kwargs.pop("yscrollcommand", None)
+
+        # syntax highlighting
+        self.highlighter = None
+        self.highlight_queue = HighlightLineQueue()  # lines waiting for lexing
+        self.highlight_after_id = None
 
         # configure 1x1 grid
         self.grid_rowconfigure(0, weight=1)
@@ -60,16 +143,36 @@ class CTkTextbox(CTkBaseClass):
                                     relief="flat",
                                     insertbackground=ThemeManager.single_color(("black", "white"), self._appearance_mode),
                                     bg=ThemeManager.single_color(self.fg_color, self._appearance_mode),
+                                    yscrollcommand=self.textbox_yscroll_event,
                                     **kwargs)
         self.textbox.grid(row=0, column=0, padx=self.corner_radius, pady=self.corner_radius, rowspan=1, columnspan=1, sticky="nsew")
 
         self.bind('<Configure>', self.update_dimensions_event)
-        self.draw()
+
+        for sequence in ("<KeyPress>", "<<Paste>>", "<<Cut>>", "<<Clear>>", "<<Undo>>", "<<Redo>>"):
+            self.textbox.bind(sequence, self.edit_event, add="+")
+        self.set_highlighter(highlighter)
+
+        self.bind("<<CTkAppend>>", self.append_event)
+
+    def destroy(self):
+        self.close_file()
+        if self.highlight_after_id is not None:
+            self.after_cancel(self.highlight_after_id)
+            self.highlight_after_id = None
+        with self.append_lock:
+            self.append_scheduled = True  # append() from other threads doesn't generate events for the destroyed widget
+        if self.append_after_id is not None:
+            self.after_cancel(self.append_after_id)
+            self.append_after_id = None
+        super().destroy()
 
     def set_scaling(self, *args, **kwargs):
         super().set_scaling(*args, **kwargs)
 
-        self.textbox.configure(font=self.apply_font_scaling(self.text_font))
+        if not self.font_follows_scaling(self.text_font):
+            self.textbox.configure(font=self.apply_font_scaling(self.text_font))
+        self.file_line_height = None
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
         self.draw()
 
@@ -81,7 +184,6 @@ class CTkTextbox(CTkBaseClass):
         self.draw()
 
     def draw(self, no_color_updates=False):
-
         requires_recoloring = self.draw_engine.draw_rounded_rect_with_border(self.apply_widget_scaling(self._current_width),
                                                                              self.apply_widget_scaling(self._current_height),
                                                                              self.apply_widget_scaling(self.corner_radius),
@@ -105,18 +207,326 @@ class CTkTextbox(CTkBaseClass):
             self.textbox.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode),
                                    bg=ThemeManager.single_color(self.fg_color, self._appearance_mode),
                                    insertbackground=ThemeManager.single_color(("black", "white"), self._appearance_mode))
+            self.configure_highlight_tags()
 
         self.canvas.tag_lower("inner_parts")
         self.canvas.tag_lower("border_parts")
 
     def yview(self, *args):
-        return self.textbox.yview(*args)
+        if self.file_line_offsets is None:
+            return self.textbox.yview(*args)
+
+        # file viewer mode: moveto positions are lines of the whole file, scroll steps move inside the loaded
+        # lines and textbox_yscroll_event() loads the next lines when the view comes close to their end
+        if not args:
+            return self.get_file_view_fractions()
+        if args[0] == "moveto":
+            self.load_file_page(int(float(args[1]) * self.get_file_line_count()))
+        else:
+            self.textbox.yview(*args)
+
+    def textbox_yscroll_event(self, *args):
+        if self.file_line_offsets is not None:
+            self.file_top_line = self.file_page_start + int(self.textbox.index("@0,0").split(".")[0]) - 1
+
+            if (self.file_top_line - self.file_page_start < self.file_overscan // 2 and self.file_page_start > 0) or \
+                    (self.file_page_end - self.file_top_line < self.get_visible_line_count() + self.file_overscan // 2 and
+                     self.file_page_end < self.get_file_line_count()):
+                self.after_idle(self.load_file_page, self.file_top_line)
+
+            args = self.get_file_view_fractions()
+
+        if self.highlighter is not None:
+            self.highlight_visible_lines()
+
+        if self.yscrollcommand is not None:
+            self.yscrollcommand(*args)
 
     def xview(self, *args):
         return self.textbox.xview(*args)
 
-    def insert(self, *args, **kwargs):
-        return self.textbox.insert(*args, **kwargs)
+    def insert(self, index, chars, *args):
+        # args can contain more chars and tags pairs after the tags of chars
+        if self.highlighter is not None:
+            first_line = int(self.textbox.index(index).split(".")[0])
+            self.highlight_later(first_line, first_line + chars.count("\n") + sum(text.count("\n") for text in args[1::2]))
+        return self.textbox.insert(index, chars, *args)
+
+    def delete(self, index1, index2=None):
+        # the rest of the first line and the rest of the last line are joined to one line
+        if self.highlighter is not None:
+            line = int(self.textbox.index(index1).split(".")[0])
+            self.highlight_later(line, line)
+        return self.textbox.delete(index1, index2)
+
+    def set_highlighter(self, highlighter: CTkHighlighter = None):
+        """ sets the highlighter, the visible lines are highlighted at once and other lines when they become visible.
+            Only edited lines and lines which become visible are lexed, in slices of highlight_time_slice ms
+            with after_idle(), so the textbox stays responsive for long texts. """
+
+        if self.highlighter is not None and self.highlighter.tag_colors:
+            self.textbox.tag_delete(*self.highlighter.tag_colors)
+        self.highlight_queue.clear()
+
+        self.highlighter = highlighter
+        if self.highlighter is not None:
+            self.configure_highlight_tags()
+            self.highlight_visible_lines()
+
+    def configure_highlight_tags(self):
+        if self.highlighter is not None:
+            for tag, color in self.highlighter.tag_colors.items():
+                self.textbox.tag_configure(tag, foreground=ThemeManager.single_color(color, self._appearance_mode))
+
+    def edit_event(self, event=None):
+        # the edit happens in the class binding after this event, so the line is read when the lexing starts
+        if self.highlighter is not None:
+            self.after_idle(self.highlight_insert_line)
+
+    def highlight_insert_line(self):
+        line = int(self.textbox.index(tkinter.INSERT).split(".")[0])
+        self.highlight_later(line - 1, line + 1, visible=True)  # Return and BackSpace change the lines next to the cursor
+
+    def highlight_visible_lines(self):
+        first_line = int(self.textbox.index("@0,0").split(".")[0])
+        last_line = int(self.textbox.index(f"@0,{self.textbox.winfo_height()}").split(".")[0])
+        self.highlight_later(first_line, last_line, visible=True)
+
+    def highlight_later(self, first_line: int, last_line: int, visible: bool = False):
+        """ queues the lines from first_line to last_line for lexing in the next idle callbacks,
+            visible lines are lexed before the other queued lines """
+
+        self.highlight_queue.add(first_line, last_line, visible)
+        if self.highlight_after_id is None:
+            self.highlight_after_id = self.after_idle(self.highlight_next_lines)
+
+    def highlight_next_lines(self):
+        """ lexes queued lines for highlight_time_slice ms and continues in the next idle callback """
+
+        self.highlight_after_id = None
+        if self.highlighter is None:
+            return
+
+        end_time = time.perf_counter() + self.highlight_time_slice / 1000
+        last_line = int(self.textbox.index("end-1c").split(".")[0])
+        line_ranges = []
+        tag_ranges = {tag: [] for tag in self.highlighter.tag_colors}
+
+        while self.highlight_queue and time.perf_counter() < end_time:
+            line = self.highlight_queue.pop()
+            if line > last_line:
+                continue
+
+            line_ranges.extend((f"{line}.0", f"{line}.end"))
+            for tag, start, end in self.highlighter.highlight_line(self.textbox.get(f"{line}.0", f"{line}.end")):
+                tag_ranges.setdefault(tag, []).extend((f"{line}.{start}", f"{line}.{end}"))
+
+        # one tag remove and one tag add call per tag for all lexed lines
+        if line_ranges:
+            for tag, ranges in tag_ranges.items():
+                self.textbox.tk.call(self.textbox._w, "tag", "remove", tag, *line_ranges)
+                if ranges:
+                    self.textbox.tag_add(tag, *ranges)
+
+        if self.highlight_queue:
+            self.highlight_after_id = self.after_idle(self.highlight_next_lines)
+
+    def append(self, text: str):
+        """ queues text for insertion at the end, can be called from any thread (log mode). The queued texts
+            are inserted in one batched insert per frame after the first append, the view only follows the end
+            if it was scrolled to the bottom. """
+
+        if not self.log_mode:
+            raise ValueError("append() is only available with log_mode=True, use insert() otherwise")
+
+        self.append_queue.append(text)
+
+        # only the first append after a drain schedules the next one, event_generate is thread-safe unlike after()
+        with self.append_lock:
+            if self.append_scheduled:
+                return
+            self.append_scheduled = True
+        self.event_generate("<<CTkAppend>>", when="tail")
+
+    def append_event(self, event=None):
+        if self.append_after_id is None:
+            self.append_after_id = self.after(self.append_interval, self.drain_append_queue)
+
+    def drain_append_queue(self):
+        self.append_after_id = None
+
+        # texts appended after the flag is cleared schedule the next drain
+        with self.append_lock:
+            self.append_scheduled = False
+
+        if self.append_queue:
+            texts = []
+            while self.append_queue:
+                texts.append(self.append_queue.popleft())
+
+            follow_end = self.textbox.yview()[1] >= 1.0  # only scroll if the user didn't scroll up
+
+            # inserts into a disabled Text are ignored, so the state is changed for the insert
+            state = self.textbox.cget("state")
+            if state == tkinter.DISABLED:
+                self.textbox.configure(state=tkinter.NORMAL)
+
+            self.textbox.insert(tkinter.END, "".join(texts))
+            self.trim_lines()
+
+            if state == tkinter.DISABLED:
+                self.textbox.configure(state=tkinter.DISABLED)
+
+            if follow_end:
+                self.textbox.see(tkinter.END)
+
+    def trim_lines(self):
+        """ deletes the oldest lines down to max_lines, in bulk when max_lines is exceeded by more than 10% """
+        if self.max_lines is not None:
+            trim_line_count = self.get_trim_line_count(int(self.textbox.index("end-1c").split(".")[0]), self.max_lines)
+            if trim_line_count > 0:
+                self.textbox.delete("1.0", f"{trim_line_count + 1}.0")
+
+    @staticmethod
+    def get_trim_line_count(line_count: int, max_lines: Union[int, None]) -> int:
+        if max_lines is None or line_count <= max_lines + max_lines // 10:
+            return 0
+        return line_count - max_lines
+
+    def open_file(self, path: str, encoding: str = "utf-8"):
+        """ shows the file at path read-only in file viewer mode without loading it: the file is memory-mapped,
+            a background thread builds the index of line offsets and only the visible lines plus file_overscan lines
+            above and below are inserted into the tkinter.Text. The scrollbar connected with yscrollcommand scrolls
+            through the whole file. """
+
+        self.close_file()
+
+        self.file = open(path, "rb")
+        self.file_size = os.fstat(self.file.fileno()).st_size
+        self.file_mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.file_size > 0 else b""
+        self.file_encoding = encoding
+        self.file_line_offsets = array.array("q", [0])
+        self.file_index_complete = False
+        self.file_page_start, self.file_page_end, self.file_top_line = 0, 0, 0
+
+        self.file_textbox_state = self.textbox.cget("state")
+        self.textbox.configure(state=tkinter.DISABLED)
+
+        self.file_index_stop_event = threading.Event()
+        self.file_index_thread = threading.Thread(target=self.index_file_lines,
+                                                  args=(self.file_mmap, self.file_line_offsets, self.file_index_stop_event),
+                                                  daemon=True)
+        self.file_index_thread.start()
+        self.file_index_after_id = self.after(self.file_index_poll_interval, self.poll_file_index)
+
+    def close_file(self):
+        """ leaves file viewer mode and closes the file """
+
+        if self.file_line_offsets is None:
+            return
+
+        self.file_index_stop_event.set()
+        self.file_index_thread.join()  # the thread has to finish before the mmap is closed
+        if self.file_index_after_id is not None:
+            self.after_cancel(self.file_index_after_id)
+            self.file_index_after_id = None
+
+        if isinstance(self.file_mmap, mmap.mmap):
+            self.file_mmap.close()
+        self.file.close()
+        self.file, self.file_mmap, self.file_line_offsets, self.file_index_thread = None, None, None, None
+
+        self.textbox.configure(state=tkinter.NORMAL)
+        self.textbox.delete("1.0", tkinter.END)
+        self.textbox.configure(state=self.file_textbox_state)
+
+    def index_file_lines(self, file_mmap, line_offsets: array.array, stop_event: threading.Event):
+        """ runs in the index thread """
+        self.file_index_complete = self.index_line_offsets(file_mmap, line_offsets, stop_event, self.file_index_chunk_size)
+
+    @staticmethod
+    def index_line_offsets(file_mmap, line_offsets: array.array, stop_event: threading.Event, chunk_size: int) -> bool:
+        """ appends the start offset of every line after a line end to line_offsets, which starts with the offset 0
+            of the first line. Returns False if it was stopped by stop_event before the end of the file. """
+
+        position = 0
+        while position < len(file_mmap) and not stop_event.is_set():
+            chunk = file_mmap[position:position + chunk_size]
+
+            if numpy is not None:
+                new_offsets = array.array("q", (numpy.flatnonzero(numpy.frombuffer(chunk, dtype=numpy.uint8) == 10) + (position + 1)).tolist())
+            else:
+                new_offsets = array.array("q")
+                line_end = chunk.find(b"\n")
+                while line_end != -1:
+                    new_offsets.append(position + line_end + 1)
+                    line_end = chunk.find(b"\n", line_end + 1)
+
+            line_offsets.extend(new_offsets)  # a single extend, so the Tk thread never sees a partial chunk
+            position += len(chunk)
+
+        return not stop_event.is_set()
+
+    def poll_file_index(self):
+        self.file_index_after_id = None
+
+        # load the first lines as soon as they are indexed and extend the page if it's shorter than the view
+        if self.file_page_end - self.file_page_start < self.get_visible_line_count() + self.file_overscan:
+            self.load_file_page(self.file_top_line)
+        elif self.yscrollcommand is not None:
+            self.yscrollcommand(*self.get_file_view_fractions())
+
+        if not self.file_index_complete:
+            self.file_index_after_id = self.after(self.file_index_poll_interval, self.poll_file_index)
+
+    def get_file_line_count(self) -> int:
+        """ number of indexed lines, the last line only counts when the file is completely indexed """
+        line_count = len(self.file_line_offsets) - 1
+        if self.file_index_complete and self.file_line_offsets[line_count] < self.file_size:
+            line_count += 1  # last line without line end
+        return line_count
+
+    def get_visible_line_count(self) -> int:
+        if self.file_line_height is None:
+            self.file_line_height = tkinter.font.Font(root=self, font=self.apply_font_scaling(self.text_font)).metrics("linespace")
+        return max(1, int(self.apply_widget_scaling(self._current_height) / self.file_line_height))
+
+    def get_file_view_fractions(self):
+        line_count = self.get_file_line_count()
+        if line_count == 0:
+            return 0.0, 1.0
+        return self.file_top_line / line_count, min(1.0, (self.file_top_line + self.get_visible_line_count()) / line_count)
+
+    def load_file_page(self, top_line: int):
+        """ inserts the lines around top_line into the tkinter.Text and scrolls top_line to the top """
+
+        if self.file_line_offsets is None:
+            return
+
+        line_count = self.get_file_line_count()
+        visible_line_count = self.get_visible_line_count()
+        top_line = max(0, min(top_line, line_count - visible_line_count))
+
+        self.file_page_start = max(0, top_line - self.file_overscan)
+        self.file_page_end = min(line_count, top_line + visible_line_count + self.file_overscan)
+        self.file_top_line = top_line
+
+        start_offset = self.file_line_offsets[self.file_page_start]
+        end_offset = self.file_line_offsets[self.file_page_end] if self.file_page_end < len(self.file_line_offsets) else self.file_size
+        text = self.decode_file_lines(self.file_mmap[start_offset:end_offset], self.file_encoding)
+
+        self.textbox.configure(state=tkinter.NORMAL)
+        self.textbox.delete("1.0", tkinter.END)
+        self.textbox.insert("1.0", text)
+        self.textbox.configure(state=tkinter.DISABLED)
+        self.textbox.yview(f"{top_line - self.file_page_start + 1}.0")
+
+    @staticmethod
+    def decode_file_lines(data: bytes, encoding: str) -> str:
+        """ text of whole lines of the file for the tkinter.Text, with LF line ends and without the last line end """
+
+        text = data.decode(encoding, errors="replace").replace("\r\n", "\n")
+        return text[:-1] if text.endswith("\n") else text
 
     def focus(self):
         return self.textbox.focus()
@@ -138,10 +548,8 @@ class CTkTextbox(CTkBaseClass):
             self.fg_color = kwargs.pop("fg_color")
             require_redraw = True
 
-            # check if CTk widgets are children of the frame and change their bg_color to new frame fg_color
-            for child in self.winfo_children():
-                if isinstance(child, CTkBaseClass):
-                    child.configure(bg_color=self.fg_color)
+            # change bg_color of the CTk widgets inside the frame which take their bg_color from it
+            CTkBaseClass.propagate_master_color(self)
 
         if "border_color" in kwargs:
             self.border_color = kwargs.pop("border_color")
@@ -164,6 +572,22 @@ class CTkTextbox(CTkBaseClass):
         if "text_font" in kwargs:
             self.text_font = kwargs.pop("text_font")
             self.textbox.configure(font=self.apply_font_scaling(self.text_font))
+            self.file_line_height = None
+
+        if "highlighter" in kwargs:
+            self.set_highlighter(kwargs.pop("highlighter"))
+
+        if "yscrollcommand" in kwargs:
+            self.yscrollcommand = kwargs.pop("yscrollcommand")
+
+        if "file_overscan" in kwargs:
+            self.file_overscan = kwargs.pop("file_overscan")
+
+        if "max_lines" in kwargs:
+            self.max_lines = kwargs.pop("max_lines")
+
+        if "log_mode" in kwargs:
+            self.log_mode = kwargs.pop("log_mode")
 
         if "font" in kwargs:
             raise ValueError("No attribute named font. Use text_font instead of font for CTk widgets")
@@ -0,0 +1,411 @@
+import tkinter
+
+from ..theme_manager import ThemeManager
+from ..draw_engine import DrawEngine
+from .ctk_surface import CTkSurface, CTkSurfaceCanvasView
+
+
+class CTkVirtualWidget:
+    """ base class of the controls of a CTkSurface, a virtual widget is a group of items on the canvas
+        of the surface and not a Tk widget. Position and size are unscaled, like the dimensions of CTk widgets. """
+
+    def __init__(self,
+                 surface: CTkSurface,
+                 x: int = 0,
+                 y: int = 0,
+                 width: int = 140,
+                 height: int = 28,
+                 text: str = "",
+                 text_font: any = "default_theme",
+                 state: str = tkinter.NORMAL,
+                 command=None):
+
+        self.surface = surface
+        self.x, self.y = x, y
+        self.width, self.height = width, height
+        self.theme_bindings = {}  # contains attribute names as keys and (section, key) of the theme as values
+
+        self.text = text
+        self.text_font = self.bind_theme_value("text_font", text_font, "text", "font")
+        self.state = state
+        self.command = command
+        self.hover_state = False
+        self.needs_draw = True  # the surface draws the virtual widget the next time it is visible
+
+        self.canvas_view = CTkSurfaceCanvasView(surface.canvas)
+        self.draw_engine = DrawEngine(self.canvas_view)
+        surface.add_virtual_widget(self)
+
+    def destroy(self):
+        self.remove_callbacks()
+        self.surface.remove_virtual_widget(self)
+
+    def remove_callbacks(self):
+        """ to be overridden, removes variable traces """
+        pass
+
+    def bind_theme_value(self, attribute_name: str, value, section: str, key: str):
+        return ThemeManager.bind_theme_value(self.theme_bindings, attribute_name, value, section, key)
+
+    def apply_widget_scaling(self, value):
+        return value * self.surface._widget_scaling
+
+    def single_color(self, color):
+        return ThemeManager.single_color(color, self.surface._appearance_mode)
+
+    def request_draw(self):
+        self.needs_draw = True
+        self.surface.schedule_update()
+
+    def draw(self):
+        """ called by the surface when the virtual widget is visible """
+
+        self.needs_draw = False
+        self.canvas_view.x = self.apply_widget_scaling(self.x)
+        self.canvas_view.y = self.apply_widget_scaling(self.y)
+        self.draw_items()
+
+    def draw_items(self):
+        """ abstract of draw_items method to be overridden, coordinates are relative to the position of the virtual widget """
+        pass
+
+    def draw_text(self, x, y, anchor: str, color):
+        if self.text is None or self.text == "":
+            self.canvas_view.delete("text_parts")
+            return
+
+        if not self.canvas_view.find_withtag("text_parts"):
+            self.canvas_view.create_text(0, 0, tags="text_parts")
+
+        self.canvas_view.itemconfig("text_parts", text=self.text, anchor=anchor, fill=self.single_color(color),
+                                    font=self.surface.apply_font_scaling(self.text_font))
+        self.canvas_view.coords("text_parts", x, y)
+        self.canvas_view.tag_raise("text_parts")
+
+    def is_clickable(self) -> bool:
+        return self.state == tkinter.NORMAL and self.command is not None
+
+    def on_enter(self):
+        self.hover_state = True
+        if self.state == tkinter.NORMAL:
+            self.draw()
+
+    def on_leave(self):
+        self.hover_state = False
+        self.draw()
+
+    def clicked(self):
+        if self.is_clickable():
+            self.command()
+
+    def configure(self, **kwargs):
+        if "x" in kwargs or "y" in kwargs or "width" in kwargs or "height" in kwargs:
+            self.surface.remove_from_hit_grid(self)
+            self.x, self.y = kwargs.pop("x", self.x), kwargs.pop("y", self.y)
+            self.width, self.height = kwargs.pop("width", self.width), kwargs.pop("height", self.height)
+            self.surface.add_to_hit_grid(self)
+
+        for attribute_name, value in kwargs.items():
+            if not hasattr(self, attribute_name) or attribute_name in ("surface", "canvas_view", "draw_engine"):
+                raise ValueError(f"{type(self).__name__} has no option '{attribute_name}'")
+            setattr(self, attribute_name, value)
+
+        self.request_draw()
+
+    def cget(self, attribute_name: str):
+        return getattr(self, attribute_name)
+
+
+class CTkVirtualButton(CTkVirtualWidget):
+    """ button of a CTkSurface with border, rounded corners and hover effect """
+
+    def __init__(self, surface: CTkSurface,
+                 x: int = 0,
+                 y: int = 0,
+                 width: int = 140,
+                 height: int = 28,
+                 fg_color="default_theme",
+                 hover_color="default_theme",
+                 border_color="default_theme",
+                 text_color="default_theme",
+                 text_color_disabled="default_theme",
+                 corner_radius="default_theme",
+                 border_width="default_theme",
+                 text: str = "CTkButton",
+                 text_font: any = "default_theme",
+                 hover: bool = True,
+                 state: str = tkinter.NORMAL,
+                 command=None):
+
+        super().__init__(surface, x=x, y=y, width=width, height=height, text=text, text_font=text_font, state=state, command=command)
+
+        # color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "button")
+        self.hover_color = self.bind_theme_value("hover_color", hover_color, "color", "button_hover")
+        self.border_color = self.bind_theme_value("border_color", border_color, "color", "button_border")
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
+        self.text_color_disabled = self.bind_theme_value("text_color_disabled", text_color_disabled, "color", "text_button_disabled")
+
+        # shape
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "button_corner_radius")
+        self.border_width = self.bind_theme_value("border_width", border_width, "shape", "button_border_width")
+        self.hover = hover
+
+    def draw_items(self):
+        width, height = self.apply_widget_scaling(self.width), self.apply_widget_scaling(self.height)
+        self.draw_engine.draw_rounded_rect_with_border(width, height,
+                                                       self.apply_widget_scaling(self.corner_radius),
+                                                       self.apply_widget_scaling(self.border_width))
+
+        if self.hover_state and self.hover and self.state == tkinter.NORMAL and self.hover_color is not None:
+            inner_parts_color = self.hover_color
+        elif self.fg_color is None:
+            inner_parts_color = self.surface.content_color()
+        else:
+            inner_parts_color = self.fg_color
+
+        self.canvas_view.itemconfig("border_parts", outline=self.single_color(self.border_color), fill=self.single_color(self.border_color))
+        self.canvas_view.itemconfig("inner_parts", outline=self.single_color(inner_parts_color), fill=self.single_color(inner_parts_color))
+
+        text_color = self.text_color_disabled if self.state == tkinter.DISABLED else self.text_color
+        self.draw_text(width / 2, height / 2, tkinter.CENTER, text_color)
+
+
+class CTkVirtualLabel(CTkVirtualWidget):
+    """ label of a CTkSurface with optional rounded background """
+
+    def __init__(self, surface: CTkSurface,
+                 x: int = 0,
+                 y: int = 0,
+                 width: int = 140,
+                 height: int = 28,
+                 fg_color="default_theme",
+                 text_color="default_theme",
+                 corner_radius="default_theme",
+                 text: str = "CTkLabel",
+                 text_font: any = "default_theme",
+                 anchor: str = tkinter.CENTER):
+
+        super().__init__(surface, x=x, y=y, width=width, height=height, text=text, text_font=text_font)
+
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "label")
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "label_corner_radius")
+        self.anchor = anchor
+
+    def on_enter(self):
+        self.hover_state = True  # labels have no hover effect
+
+    def on_leave(self):
+        self.hover_state = False
+
+    def draw_items(self):
+        width, height = self.apply_widget_scaling(self.width), self.apply_widget_scaling(self.height)
+        self.draw_engine.draw_rounded_rect_with_border(width, height, self.apply_widget_scaling(self.corner_radius), 0)
+
+        fg_color = self.surface.content_color() if self.single_color(self.fg_color) is None else self.fg_color
+        self.canvas_view.itemconfig("inner_parts", outline=self.single_color(fg_color), fill=self.single_color(fg_color))
+
+        padding = self.apply_widget_scaling(self.corner_radius)
+        anchor = "" if self.anchor == tkinter.CENTER else self.anchor
+        x = padding if "w" in anchor else width - padding if "e" in anchor else width / 2
+        y = 0 if "n" in anchor else height if "s" in anchor else height / 2
+        self.draw_text(x, y, self.anchor, self.text_color)
+
+
+class CTkVirtualToggle(CTkVirtualWidget):
+    """ base class of CTkVirtualCheckBox and CTkVirtualSwitch with onvalue, offvalue and variable support """
+
+    def __init__(self, surface: CTkSurface, onvalue=1, offvalue=0, variable: tkinter.Variable = None, **kwargs):
+        super().__init__(surface, **kwargs)
+
+        self.check_state = False
+        self.onvalue = onvalue
+        self.offvalue = offvalue
+        self.variable = variable
+        self.variable_callback_blocked = False
+        self.variable_callback_name = None
+
+        if self.variable is not None and self.variable != "":
+            self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
+            self.check_state = True if self.variable.get() == self.onvalue else False
+
+    def remove_callbacks(self):
+        if self.variable_callback_name is not None:
+            self.variable.trace_remove("write", self.variable_callback_name)
+            self.variable_callback_name = None
+
+    def is_clickable(self) -> bool:
+        return self.state == tkinter.NORMAL
+
+    def clicked(self):
+        self.toggle()
+
+    def toggle(self):
+        if self.state == tkinter.NORMAL:
+            self.check_state = not self.check_state
+            self.draw()
+            self.set_variable()
+
+            if self.command is not None:
+                self.command()
+
+    def select(self, from_variable_callback=False):
+        if self.state == tkinter.NORMAL or from_variable_callback:
+            self.check_state = True
+            self.request_draw()
+            if not from_variable_callback:
+                self.set_variable()
+
+    def deselect(self, from_variable_callback=False):
+        if self.state == tkinter.NORMAL or from_variable_callback:
+            self.check_state = False
+            self.request_draw()
+            if not from_variable_callback:
+                self.set_variable()
+
+    def get(self):
+        return self.onvalue if self.check_state is True else self.offvalue
+
+    def set_variable(self):
+        if self.variable is not None:
+            self.variable_callback_blocked = True
+            self.variable.set(self.onvalue if self.check_state is True else self.offvalue)
+            self.variable_callback_blocked = False
+
+    def variable_callback(self, var_name, index, mode):
+        if not self.variable_callback_blocked:
+            if self.variable.get() == self.onvalue:
+                self.select(from_variable_callback=True)
+            elif self.variable.get() == self.offvalue:
+                self.deselect(from_variable_callback=True)
+
+
+class CTkVirtualCheckBox(CTkVirtualToggle):
+    """ checkbox of a CTkSurface, the box is a square with the height of the virtual widget and the text is right of it """
+
+    def __init__(self, surface: CTkSurface,
+                 x: int = 0,
+                 y: int = 0,
+                 width: int = 140,
+                 height: int = 24,
+                 fg_color="default_theme",
+                 hover_color="default_theme",
+                 border_color="default_theme",
+                 checkmark_color="default_theme",
+                 text_color="default_theme",
+                 text_color_disabled="default_theme",
+                 corner_radius="default_theme",
+                 border_width="default_theme",
+                 text: str = "CTkCheckBox",
+                 text_font: any = "default_theme",
+                 hover: bool = True,
+                 state: str = tkinter.NORMAL,
+                 command=None,
+                 onvalue=1,
+                 offvalue=0,
+                 variable: tkinter.Variable = None):
+
+        super().__init__(surface, onvalue=onvalue, offvalue=offvalue, variable=variable, x=x, y=y, width=width, height=height,
+                         text=text, text_font=text_font, state=state, command=command)
+
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "button")
+        self.hover_color = self.bind_theme_value("hover_color", hover_color, "color", "button_hover")
+        self.border_color = self.bind_theme_value("border_color", border_color, "color", "checkbox_border")
+        self.checkmark_color = self.bind_theme_value("checkmark_color", checkmark_color, "color", "checkmark")
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
+        self.text_color_disabled = self.bind_theme_value("text_color_disabled", text_color_disabled, "color", "text_disabled")
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "checkbox_corner_radius")
+        self.border_width = self.bind_theme_value("border_width", border_width, "shape", "checkbox_border_width")
+        self.hover = hover
+
+    def draw_items(self):
+        box_size = self.apply_widget_scaling(self.height)
+        self.draw_engine.draw_rounded_rect_with_border(box_size, box_size,
+                                                       self.apply_widget_scaling(self.corner_radius),
+                                                       self.apply_widget_scaling(self.border_width))
+
+        if self.check_state is True:
+            self.draw_engine.draw_checkmark(box_size, box_size, box_size * 0.58)
+            self.canvas_view.itemconfig("checkmark", fill=self.single_color(self.checkmark_color))
+        else:
+            self.canvas_view.delete("checkmark")
+
+        hover = self.hover_state and self.hover and self.state == tkinter.NORMAL
+        inner_parts_color = self.hover_color if hover else self.fg_color if self.check_state else self.surface.content_color()
+        border_parts_color = (self.hover_color if hover else self.fg_color) if self.check_state else self.border_color
+
+        self.canvas_view.itemconfig("inner_parts", outline=self.single_color(inner_parts_color), fill=self.single_color(inner_parts_color))
+        self.canvas_view.itemconfig("border_parts", outline=self.single_color(border_parts_color), fill=self.single_color(border_parts_color))
+
+        text_color = self.text_color_disabled if self.state == tkinter.DISABLED else self.text_color
+        self.draw_text(box_size + self.apply_widget_scaling(6), box_size / 2, tkinter.W, text_color)
+
+
+class CTkVirtualSwitch(CTkVirtualToggle):
+    """ switch of a CTkSurface, the switch has the size switch_width x switch_height and the text is right of it """
+
+    def __init__(self, surface: CTkSurface,
+                 x: int = 0,
+                 y: int = 0,
+                 width: int = 140,
+                 height: int = 24,
+                 switch_width: int = 36,
+                 switch_height: int = 18,
+                 border_color=None,
+                 fg_color="default_theme",
+                 progress_color="default_theme",
+                 button_color="default_theme",
+                 button_hover_color="default_theme",
+                 text_color="default_theme",
+                 text_color_disabled="default_theme",
+                 corner_radius="default_theme",
+                 border_width="default_theme",
+                 button_length="default_theme",
+                 text: str = "CTkSwitch",
+                 text_font: any = "default_theme",
+                 state: str = tkinter.NORMAL,
+                 command=None,
+                 onvalue=1,
+                 offvalue=0,
+                 variable: tkinter.Variable = None):
+
+        super().__init__(surface, onvalue=onvalue, offvalue=offvalue, variable=variable, x=x, y=y, width=width, height=height,
+                         text=text, text_font=text_font, state=state, command=command)
+
+        self.switch_width = switch_width
+        self.switch_height = switch_height
+        self.border_color = border_color
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "switch")
+        self.progress_color = self.bind_theme_value("progress_color", progress_color, "color", "switch_progress")
+        self.button_color = self.bind_theme_value("button_color", button_color, "color", "switch_button")
+        self.button_hover_color = self.bind_theme_value("button_hover_color", button_hover_color, "color", "switch_button_hover")
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
+        self.text_color_disabled = self.bind_theme_value("text_color_disabled", text_color_disabled, "color", "text_disabled")
+        self.corner_radius = self.bind_theme_value("corner_radius", corner_radius, "shape", "switch_corner_radius")
+        self.border_width = self.bind_theme_value("border_width", border_width, "shape", "switch_border_width")
+        self.button_length = self.bind_theme_value("button_length", button_length, "shape", "switch_button_length")
+
+    def draw_items(self):
+        # the switch is centered vertically, coordinates of the canvas view start at the top left corner of the switch
+        self.canvas_view.y = self.apply_widget_scaling(self.y + (self.height - self.switch_height) / 2)
+        switch_width, switch_height = self.apply_widget_scaling(self.switch_width), self.apply_widget_scaling(self.switch_height)
+
+        self.draw_engine.draw_rounded_slider_with_border_and_button(switch_width, switch_height,
+                                                                    self.apply_widget_scaling(self.corner_radius),
+                                                                    self.apply_widget_scaling(self.border_width),
+                                                                    self.apply_widget_scaling(self.button_length),
+                                                                    self.apply_widget_scaling(self.corner_radius),
+                                                                    1 if self.check_state else 0, "w")
+
+        border_color = self.surface.content_color() if self.border_color is None else self.border_color
+        progress_color = self.fg_color if self.progress_color is None else self.progress_color
+        button_color = self.button_hover_color if self.hover_state and self.state == tkinter.NORMAL else self.button_color
+
+        self.canvas_view.itemconfig("border_parts", fill=self.single_color(border_color), outline=self.single_color(border_color))
+        self.canvas_view.itemconfig("inner_parts", fill=self.single_color(self.fg_color), outline=self.single_color(self.fg_color))
+        self.canvas_view.itemconfig("progress_parts", fill=self.single_color(progress_color), outline=self.single_color(progress_color))
+        self.canvas_view.itemconfig("slider_parts", fill=self.single_color(button_color), outline=self.single_color(button_color))
+
+        text_color = self.text_color_disabled if self.state == tkinter.DISABLED else self.text_color
+        self.draw_text(switch_width + self.apply_widget_scaling(6), switch_height / 2, tkinter.W, text_color)
@@ -1,10 +1,9 @@
 import tkinter
 import sys
-import copy
-import re
 from typing import Union
 
 from ..theme_manager import ThemeManager
+from ..font_manager import FontManager
 from ..appearance_mode_tracker import AppearanceModeTracker
 from ..scaling_tracker import ScalingTracker
 
@@ -28,11 +27,14 @@ class DropdownMenu(tkinter.Menu):
         AppearanceModeTracker.add(self.set_appearance_mode, self)
         self._appearance_mode = AppearanceModeTracker.get_mode()  # 0: "Light" 1: "Dark"
 
+        ThemeManager.add(self.set_theme)
+        self._theme_bindings = {}
+
         self.min_character_width = min_character_width
-        self.fg_color = ThemeManager.theme["color"]["dropdown_color"] if fg_color == "default_theme" else fg_color
-        self.hover_color = ThemeManager.theme["color"]["dropdown_hover"] if hover_color == "default_theme" else hover_color
-        self.text_color = ThemeManager.theme["color"]["text"] if text_color == "default_theme" else text_color
-        self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
+        self.fg_color = self.bind_theme_value("fg_color", fg_color, "color", "dropdown_color")
+        self.hover_color = self.bind_theme_value("hover_color", hover_color, "color", "dropdown_hover")
+        self.text_color = self.bind_theme_value("text_color", text_color, "color", "text")
+        self.text_font = self.bind_theme_value("text_font", text_font, "text", "font")
 
         self.configure_menu_for_platforms()
 
@@ -122,6 +124,14 @@ class DropdownMenu(tkinter.Menu):
 
         super().configure(**kwargs)
 
+    def bind_theme_value(self, attribute_name: str, value, section: str, key: str):
+        return ThemeManager.bind_theme_value(self._theme_bindings, attribute_name, value, section, key)
+
+    def destroy(self):
+        AppearanceModeTracker.remove(self.set_appearance_mode)
+        ThemeManager.remove(self.set_theme)
+        super().destroy()
+
     def apply_widget_scaling(self, value: Union[int, float, str]) -> Union[float, str]:
         if isinstance(value, (int, float)):
             return value * self._widget_scaling
@@ -129,32 +139,14 @@ class DropdownMenu(tkinter.Menu):
             return value
 
     def apply_font_scaling(self, font):
-        if type(font) == tuple or type(font) == list:
-            font_list = list(font)
-            for i in range(len(font_list)):
-                if (type(font_list[i]) == int or type(font_list[i]) == float) and font_list[i] < 0:
-                    font_list[i] = int(font_list[i] * self._widget_scaling)
-            return tuple(font_list)
-
-        elif type(font) == str:
-            for negative_number in re.findall(r" -\d* ", font):
-                font = font.replace(negative_number, f" {int(int(negative_number) * self._widget_scaling)} ")
-            return font
-
-        elif isinstance(font, tkinter.font.Font):
-            new_font_object = copy.copy(font)
-            if font.cget("size") < 0:
-                new_font_object.config(size=int(font.cget("size") * self._widget_scaling))
-            return new_font_object
-
-        else:
-            return font
+        return FontManager.get_scaled_font(self, font, self._widget_scaling)
 
     def set_scaling(self, new_widget_scaling, new_spacing_scaling, new_window_scaling):
         self._widget_scaling = new_widget_scaling
         self._spacing_scaling = new_spacing_scaling
 
-        self.configure(font=self.apply_font_scaling(self.text_font))
+        if not FontManager.is_shared_font(self, self.text_font):
+            self.configure(font=self.apply_font_scaling(self.text_font))
 
         if sys.platform.startswith("win"):
             self.configure(activeborderwidth=self.apply_widget_scaling(4))
@@ -168,3 +160,7 @@ class DropdownMenu(tkinter.Menu):
             self._appearance_mode = 0
 
         self.configure_menu_for_platforms()
+
+    def set_theme(self, old_theme: dict):
+        if ThemeManager.update_theme_bindings(self, self._theme_bindings, old_theme):
+            self.configure_menu_for_platforms()
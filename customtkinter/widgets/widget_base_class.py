@@ -1,7 +1,9 @@
 import tkinter
 import tkinter.ttk as ttk
 import copy
-import re
+import weakref
+import contextlib
+import functools
 from typing import Callable, Union
 
 try:
@@ -14,12 +16,42 @@ from ..windows.ctk_toplevel import CTkToplevel
 from ..appearance_mode_tracker import AppearanceModeTracker
 from ..scaling_tracker import ScalingTracker
 from ..theme_manager import ThemeManager
+from ..initialization import initialize
+from ..font_manager import FontManager
 
 
 class CTkBaseClass(tkinter.Frame):
     """ Base class of every CTk widget, handles the dimensions, bg_color,
         appearance_mode changes, scaling, bg changes of master if master is not a CTk widget """
 
+    batched_master_paths = {}  # paths of masters in a customtkinter.batch() block and their nesting depth
+    batch_pending_widgets = {}  # widgets with suppressed draws as keys and no_color_updates of the draw at the end as values
+
+    # plain tkinter masters as keys and weak sets of their CTk children as values, every master gets only one configure hook
+    master_bg_children = weakref.WeakKeyDictionary()
+
+    # CTk masters with fg_color None as keys and the color resolved from their own masters as values,
+    # cleared by clear_master_color_cache() when the fg_color of a container or window changes
+    master_color_cache = weakref.WeakKeyDictionary()
+    ttk_background_cache = {}  # contains (tk interpreter, ttk class name, ttk theme name) as keys and the background color as values
+    ttk_theme_names = {}  # contains the tk interpreter as keys and the current ttk theme name as values, None after a theme change
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # the draw() of every subclass is skipped while suppress_draw() returns True
+        if "draw" in cls.__dict__:
+            cls.draw = CTkBaseClass.suppressible_draw(cls.__dict__["draw"])
+
+    @staticmethod
+    def suppressible_draw(draw: Callable) -> Callable:
+        @functools.wraps(draw)
+        def suppressible_draw(self, no_color_updates=False):
+            if not self.suppress_draw(no_color_updates):
+                draw(self, no_color_updates)
+
+        return suppressible_draw
+
     def __init__(self,
                  *args,
                  bg_color: Union[str, tuple] = None,
@@ -27,6 +59,8 @@ class CTkBaseClass(tkinter.Frame):
                  height: int,
                  **kwargs):
 
+        initialize()  # appearance mode detection and font loading, if no CTk window was created before
+
         super().__init__(*args, width=width, height=height, **kwargs)  # set desired size of underlying tkinter.Frame
 
         # dimensions
@@ -50,39 +84,103 @@ class CTkBaseClass(tkinter.Frame):
 
         self._last_geometry_manager_call: Union[GeometryCallDict, None] = None
 
+        # the first draw happens on the first <Map> or <Configure> event, so the constructor does no drawing
+        # and widgets that are never shown never draw, draw() of every widget returns while _draw_deferred is True
+        self._draw_deferred = True
+        super().bind("<Map>", self.first_draw_event, add="+")
+        self._batch_depth = 0  # nesting depth of widget.batch() blocks
+
+        self.textvariable_trace_name = None  # trace of the textvariable in canvas text mode, see add_textvariable_trace()
+
         # add set_appearance_mode method to callback list of AppearanceModeTracker for appearance mode changes
         AppearanceModeTracker.add(self.set_appearance_mode, self)
         self._appearance_mode = AppearanceModeTracker.get_mode()  # 0: "Light" 1: "Dark"
 
+        # add set_theme method to callback list of ThemeManager, attributes bound with bind_theme_value() follow theme changes
+        ThemeManager.add(self.set_theme)
+        self._theme_bindings = {}  # contains attribute names as keys and (section, key) of the theme as values
+
         # background color
         self.bg_color = self.detect_color_of_master() if bg_color is None else bg_color
+        self._bg_color_from_master = bg_color is None
 
         super().configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
 
-        # overwrite configure methods of master when master is tkinter widget, so that bg changes get applied on child CTk widget as well
+        # register at the configure hook of the master when master is tkinter widget, so that bg changes get applied on child CTk widget as well
         if isinstance(self.master, (tkinter.Tk, tkinter.Toplevel, tkinter.Frame)) and not isinstance(self.master, (CTkBaseClass, CTk, CTkToplevel)):
-            master_old_configure = self.master.config
+            CTkBaseClass.add_master_bg_hook(self.master, self)
 
-            def new_configure(*args, **kwargs):
+    def destroy(self):
+        self.remove_textvariable_trace()
+        AppearanceModeTracker.remove(self.set_appearance_mode)
+        ThemeManager.remove(self.set_theme)
+        CTkBaseClass.batch_pending_widgets.pop(self, None)
+
+        if self.master in CTkBaseClass.master_bg_children:
+            CTkBaseClass.master_bg_children[self.master].discard(self)
+
+        super().destroy()
+
+    @classmethod
+    def add_master_bg_hook(cls, master: tkinter.Misc, widget):
+        """ replaces configure and config of master once with a hook, which passes bg changes of the master
+            to all registered CTk children in one pass, children are only referenced weakly """
+
+        children = cls.master_bg_children.get(master)
+        if children is None:
+            children = weakref.WeakSet()
+            cls.master_bg_children[master] = children
+            master_configure = master.configure
+
+            def configure_hook(*args, **kwargs):
+                new_bg = None
                 if "bg" in kwargs:
-                    self.configure(bg_color=kwargs["bg"])
+                    new_bg = kwargs["bg"]
                 elif "background" in kwargs:
-                    self.configure(bg_color=kwargs["background"])
+                    new_bg = kwargs["background"]
 
                 # args[0] is dict when attribute gets changed by widget[<attribute>] syntax
                 elif len(args) > 0 and type(args[0]) == dict:
                     if "bg" in args[0]:
-                        self.configure(bg_color=args[0]["bg"])
+                        new_bg = args[0]["bg"]
                     elif "background" in args[0]:
-                        self.configure(bg_color=args[0]["background"])
-                master_old_configure(*args, **kwargs)
+                        new_bg = args[0]["background"]
 
-            self.master.config = new_configure
-            self.master.configure = new_configure
+                if new_bg is not None:
+                    cls.propagate_master_color(master, new_bg, list(children))
 
-    def destroy(self):
-        AppearanceModeTracker.remove(self.set_appearance_mode)
-        super().destroy()
+                return master_configure(*args, **kwargs)
+
+            master.config = configure_hook
+            master.configure = configure_hook
+
+        children.add(widget)
+
+    @classmethod
+    def propagate_master_color(cls, master: tkinter.Misc, color: Union[str, tuple] = None, widgets: list = None):
+        """ called after the color of master changed: sets bg_color of all CTk widgets (children of master if widgets
+            is None) which take their bg_color from master in one tree walk, transparent widgets (fg_color None) pass
+            the color on to their own children, every changed widget is drawn once at the end """
+
+        cls.clear_master_color_cache()
+
+        if color is None:
+            color = master.fg_color if master.fg_color is not None else master.detect_color_of_master()
+
+        stack = list(master.winfo_children() if widgets is None else widgets)
+        changed_widgets = []
+
+        while stack:
+            widget = stack.pop()
+            if isinstance(widget, CTkBaseClass) and widget._bg_color_from_master:
+                widget.bg_color = color
+                changed_widgets.append(widget)
+
+                if getattr(widget, "fg_color", "") is None:
+                    stack.extend(widget.winfo_children())
+
+        for widget in changed_widgets:
+            widget.draw()  # skipped for widgets which are not drawn yet, collected if inside a batch() block
 
     def place(self, **kwargs):
         self._last_geometry_manager_call = {"function": super().place, "kwargs": kwargs}
@@ -126,6 +224,7 @@ class CTkBaseClass(tkinter.Frame):
                 self.bg_color = self.detect_color_of_master()
             else:
                 self.bg_color = new_bg_color
+            self._bg_color_from_master = new_bg_color is None
             require_redraw = True
 
         super().configure(**kwargs)
@@ -133,7 +232,91 @@ class CTkBaseClass(tkinter.Frame):
         if require_redraw:
             self.draw()
 
+    def add_textvariable_trace(self):
+        """ for widgets with canvas_text and textvariable attributes (CTkButton, CTkLabel): in canvas text mode
+            the text item has to be updated when the textvariable changes """
+        if self.canvas_text and self.textvariable is not None:
+            self.textvariable_trace_name = self.textvariable.trace_add("write", lambda *args: self.draw(no_color_updates=True))
+
+    def remove_textvariable_trace(self):
+        if self.textvariable_trace_name is not None:
+            self.textvariable.trace_remove("write", self.textvariable_trace_name)
+            self.textvariable_trace_name = None
+
+    @contextlib.contextmanager
+    def batch(self):
+        """ with widget.batch(): all draws of the widget inside the block, for example from several
+            configure() calls, are collected and done once when the block is left """
+
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                CTkBaseClass.flush_batch(self)
+
+    @classmethod
+    @contextlib.contextmanager
+    def batch_master(cls, master: tkinter.Misc):
+        """ like widget.batch(), but for all CTk widgets inside master, used by customtkinter.batch() """
+
+        master_path = str(master)
+        cls.batched_master_paths[master_path] = cls.batched_master_paths.get(master_path, 0) + 1
+        try:
+            yield master
+        finally:
+            cls.batched_master_paths[master_path] -= 1
+            if cls.batched_master_paths[master_path] == 0:
+                del cls.batched_master_paths[master_path]
+                cls.flush_batch()
+
+    def is_batched(self) -> bool:
+        if self._batch_depth > 0:
+            return True
+
+        if CTkBaseClass.batched_master_paths:
+            path = str(self)
+            for master_path in CTkBaseClass.batched_master_paths:
+                if master_path == "." or path == master_path or path.startswith(master_path + "."):
+                    return True
+        return False
+
+    def suppress_draw(self, no_color_updates: bool = False) -> bool:
+        """ called before the draw() of every subclass, returns True if the draw has to be skipped because the first
+            draw is deferred or the widget is in a batch block, which then draws the widget once at its end """
+
+        if self._draw_deferred:
+            return True
+
+        if self.is_batched():
+            # one suppressed draw with color updates makes the final draw a draw with color updates
+            CTkBaseClass.batch_pending_widgets[self] = CTkBaseClass.batch_pending_widgets.get(self, True) and no_color_updates
+            return True
+        return False
+
+    @classmethod
+    def flush_batch(cls, widget=None):
+        """ draws the pending widgets which are not in a batch block anymore, only widget if it's given """
+
+        pending_widgets = [widget] if widget is not None else list(cls.batch_pending_widgets)
+
+        for pending_widget in pending_widgets:
+            if pending_widget in cls.batch_pending_widgets and not pending_widget.is_batched():
+                pending_widget.draw(no_color_updates=cls.batch_pending_widgets.pop(pending_widget))
+
+    def first_draw_event(self, event=None):
+        if self._draw_deferred:
+            self._draw_deferred = False
+            self.draw()
+
     def update_dimensions_event(self, event):
+        if self._draw_deferred:
+            self._current_width = (event.width / self._widget_scaling)
+            self._current_height = (event.height / self._widget_scaling)
+            self.first_draw_event()
+            return
+
         # only redraw if dimensions changed (for performance), independent of scaling
         if round(self._current_width) != round(event.width / self._widget_scaling) or round(self._current_height) != round(event.height / self._widget_scaling):
             self._current_width = (event.width / self._widget_scaling)  # adjust current size according to new size given by event
@@ -151,14 +334,18 @@ class CTkBaseClass(tkinter.Frame):
             if master_widget.fg_color is not None:
                 return master_widget.fg_color
 
-            # if fg_color of master is None, try to retrieve fg_color from master of master
+            # if fg_color of master is None, try to retrieve fg_color from master of master, the result is cached
+            elif master_widget in CTkBaseClass.master_color_cache:
+                return CTkBaseClass.master_color_cache[master_widget]
+
             elif hasattr(master_widget.master, "master"):
-                return self.detect_color_of_master(master_widget.master)
+                master_color = self.detect_color_of_master(master_widget.master)
+                CTkBaseClass.master_color_cache[master_widget] = master_color
+                return master_color
 
         elif isinstance(master_widget, (ttk.Frame, ttk.LabelFrame, ttk.Notebook, ttk.Label)):  # master is ttk widget
             try:
-                ttk_style = ttk.Style()
-                return ttk_style.lookup(master_widget.winfo_class(), 'background')
+                return CTkBaseClass.lookup_ttk_background(master_widget)
             except Exception:
                 return "#FFFFFF", "#000000"
 
@@ -168,6 +355,39 @@ class CTkBaseClass(tkinter.Frame):
             except Exception:
                 return "#FFFFFF", "#000000"
 
+    @classmethod
+    def clear_master_color_cache(cls):
+        """ called when the fg_color of a container or window changes, so that it's not used for transparent masters anymore """
+        cls.master_color_cache.clear()
+
+    @classmethod
+    def lookup_ttk_background(cls, ttk_widget: tkinter.Misc):
+        """ ttk style lookup of the background color, memoised per (interpreter, class, theme) """
+
+        tk = ttk_widget.tk
+        theme_name = cls.ttk_theme_names.get(tk)
+        if theme_name is None:
+            if tk not in cls.ttk_theme_names:
+                # bound only once per interpreter, the first time one of its ttk widgets is looked up: the "all" tag belongs to
+                # the interpreter and not to ttk_widget, so the binding stays when ttk_widget is destroyed. <<ThemeChanged>> is
+                # sent when the ttk theme changes and after ttk.Style().configure(), then the cached colors are looked up again
+                ttk_widget.bind_all("<<ThemeChanged>>", lambda event: cls.ttk_theme_changed(tk), add="+")
+
+            theme_name = ttk.Style(ttk_widget).theme_use()
+            cls.ttk_theme_names[tk] = theme_name
+
+        key = (tk, ttk_widget.winfo_class(), theme_name)
+        if key not in cls.ttk_background_cache:
+            cls.ttk_background_cache[key] = ttk.Style(ttk_widget).lookup(key[1], "background")
+        return cls.ttk_background_cache[key]
+
+    @classmethod
+    def ttk_theme_changed(cls, tk):
+        if cls.ttk_theme_names.get(tk) is not None:  # the event is sent to every widget, but the cache is only cleared once
+            cls.ttk_theme_names[tk] = None
+            for key in [key for key in cls.ttk_background_cache if key[0] is tk]:
+                del cls.ttk_background_cache[key]
+
     def set_appearance_mode(self, mode_string):
         if mode_string.lower() == "dark":
             self._appearance_mode = 1
@@ -176,6 +396,27 @@ class CTkBaseClass(tkinter.Frame):
 
         self.draw()
 
+    def bind_theme_value(self, attribute_name: str, value, section: str, key: str):
+        """ returns the theme value if value is "default_theme", attribute then follows theme changes """
+        return ThemeManager.bind_theme_value(self._theme_bindings, attribute_name, value, section, key)
+
+    def set_theme(self, old_theme: dict):
+        """ called by ThemeManager.load_theme(), masters are created before their children,
+            so the fg_color of the master is already updated when bg_color gets detected again """
+
+        changed_attributes = ThemeManager.update_theme_bindings(self, self._theme_bindings, old_theme)
+        if "fg_color" in changed_attributes:
+            CTkBaseClass.clear_master_color_cache()
+
+        if self._bg_color_from_master:
+            self.bg_color = self.detect_color_of_master()
+
+        if "shape" in changed_attributes.values() or "text" in changed_attributes.values():
+            # fonts, corner radius and border width affect the layout, set_scaling re-applies them and redraws
+            self.set_scaling(self._widget_scaling, self._spacing_scaling, None)
+        else:
+            self.draw()
+
     def set_scaling(self, new_widget_scaling, new_spacing_scaling, new_window_scaling):
         self._widget_scaling = new_widget_scaling
         self._spacing_scaling = new_spacing_scaling
@@ -208,26 +449,12 @@ class CTkBaseClass(tkinter.Frame):
             return value
 
     def apply_font_scaling(self, font):
-        if type(font) == tuple or type(font) == list:
-            font_list = list(font)
-            for i in range(len(font_list)):
-                if (type(font_list[i]) == int or type(font_list[i]) == float) and font_list[i] < 0:
-                    font_list[i] = int(font_list[i] * self._widget_scaling)
-            return tuple(font_list)
-
-        elif type(font) == str:
-            for negative_number in re.findall(r" -\d* ", font):
-                font = font.replace(negative_number, f" {int(int(negative_number) * self._widget_scaling)} ")
-            return font
-
-        elif isinstance(font, tkinter.font.Font):
-            new_font_object = copy.copy(font)
-            if font.cget("size") < 0:
-                new_font_object.config(size=int(font.cget("size") * self._widget_scaling))
-            return new_font_object
+        return FontManager.get_scaled_font(self, font, self._widget_scaling)
 
-        else:
-            return font
+    def font_follows_scaling(self, font) -> bool:
+        """ True if font is a named font shared by the widgets of the window, which gets its new size from the
+            ScalingTracker, so widgets using it don't need to be configured again in set_scaling """
+        return FontManager.is_shared_font(self, font)
 
     def draw(self, no_color_updates: bool = False):
         """ abstract of draw method to be overridden """
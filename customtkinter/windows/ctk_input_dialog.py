@@ -28,10 +28,10 @@ class CTkInputDialog:
         self.height = len(text.split("\n"))*20 + 150
 
         self.text = text
-        self.window_bg_color = ThemeManager.theme["color"]["window_bg_color"]
-        self.fg_color = ThemeManager.theme["color"]["button"] if fg_color == "default_theme" else fg_color
-        self.hover_color = ThemeManager.theme["color"]["button_hover"] if hover_color == "default_theme" else hover_color
-        self.border_color = ThemeManager.theme["color"]["button_hover"] if border_color == "default_theme" else border_color
+        self.window_bg_color = ThemeManager.get_theme_value("color", "window_bg_color")
+        self.fg_color = ThemeManager.get_theme_value("color", "button") if fg_color == "default_theme" else fg_color
+        self.hover_color = ThemeManager.get_theme_value("color", "button_hover") if hover_color == "default_theme" else hover_color
+        self.border_color = ThemeManager.get_theme_value("color", "button_hover") if border_color == "default_theme" else border_color
 
         self.top = CTkToplevel()
         self.top.geometry(f"{280}x{self.height}")
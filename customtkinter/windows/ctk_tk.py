@@ -1,8 +1,6 @@
 import tkinter
-from distutils.version import StrictVersion as Version
 import sys
 import os
-import platform
 import ctypes
 import re
 from typing import Union, Tuple
@@ -11,6 +9,8 @@ from ..appearance_mode_tracker import AppearanceModeTracker
 from ..theme_manager import ThemeManager
 from ..scaling_tracker import ScalingTracker
 from ..settings import Settings
+from ..initialization import initialize
+from ..version_utils import tk_version_at_least
 
 
 class CTk(tkinter.Tk):
@@ -18,11 +18,16 @@ class CTk(tkinter.Tk):
                  fg_color="default_theme",
                  **kwargs):
 
+        initialize()  # appearance mode detection and font loading, only on the first call
+
         ScalingTracker.activate_high_dpi_awareness()  # make process DPI aware
-        self.enable_macos_dark_title_bar()
+        macos_title_bar_checked = self.enable_macos_dark_title_bar()
 
         super().__init__(*args, **kwargs)
 
+        if macos_title_bar_checked is None:  # Tk 8.6 and no interpreter before the first window, check the patchlevel now
+            self.enable_macos_dark_title_bar(self)
+
         # add set_appearance_mode method to callback list of AppearanceModeTracker for appearance mode changes
         AppearanceModeTracker.add(self.set_appearance_mode, self)
         self.appearance_mode = AppearanceModeTracker.get_mode()  # 0: "Light" 1: "Dark"
@@ -39,7 +44,11 @@ class CTk(tkinter.Tk):
         self.max_height: int = 1_000_000
         self.last_resizable_args: Union[Tuple[list, dict], None] = None  # (args, kwargs)
 
-        self.fg_color = ThemeManager.theme["color"]["window_bg_color"] if fg_color == "default_theme" else fg_color
+        # add set_theme method to callback list of ThemeManager for runtime theme changes
+        ThemeManager.add(self.set_theme)
+        self._theme_bindings = {}
+
+        self.fg_color = ThemeManager.bind_theme_value(self._theme_bindings, "fg_color", fg_color, "color", "window_bg_color")
 
         if "bg" in kwargs:
             self.fg_color = kwargs["bg"]
@@ -103,6 +112,7 @@ class CTk(tkinter.Tk):
 
     def destroy(self):
         AppearanceModeTracker.remove(self.set_appearance_mode)
+        ThemeManager.remove(self.set_theme)
         ScalingTracker.remove_window(self.set_scaling, self)
         self.disable_macos_dark_title_bar()
         super().destroy()
@@ -251,25 +261,28 @@ class CTk(tkinter.Tk):
         if bg_changed:
             from ..widgets.widget_base_class import CTkBaseClass
 
-            for child in self.winfo_children():
-                if isinstance(child, CTkBaseClass):
-                    child.configure(bg_color=self.fg_color)
+            CTkBaseClass.propagate_master_color(self)
 
         super().configure(*args, **kwargs)
 
     @staticmethod
-    def enable_macos_dark_title_bar():
+    def enable_macos_dark_title_bar(tk_app=None) -> Union[bool, None]:
+        """ returns None if the Tk patchlevel can't be read yet, because no interpreter exists """
+
         if sys.platform == "darwin" and not Settings.deactivate_macos_window_header_manipulation:  # macOS
-            if Version(platform.python_version()) < Version("3.10"):
-                if Version(tkinter.Tcl().call("info", "patchlevel")) >= Version("8.6.9"):  # Tcl/Tk >= 8.6.9
+            if sys.version_info < (3, 10):
+                supported = tk_version_at_least("8.6.9", tk_app)  # Tcl/Tk >= 8.6.9
+                if supported:
                     os.system("defaults write -g NSRequiresAquaSystemAppearance -bool No")
                     # This command allows dark-mode for all programs
+                return supported
+        return False
 
     @staticmethod
     def disable_macos_dark_title_bar():
         if sys.platform == "darwin" and not Settings.deactivate_macos_window_header_manipulation:  # macOS
-            if Version(platform.python_version()) < Version("3.10"):
-                if Version(tkinter.Tcl().call("info", "patchlevel")) >= Version("8.6.9"):  # Tcl/Tk >= 8.6.9
+            if sys.version_info < (3, 10):
+                if tk_version_at_least("8.6.9"):  # Tcl/Tk >= 8.6.9
                     os.system("defaults delete -g NSRequiresAquaSystemAppearance")
                     # This command reverts the dark-mode setting for all programs.
 
@@ -348,3 +361,12 @@ class CTk(tkinter.Tk):
                 self.windows_set_titlebar_color("light")
 
         super().configure(bg=ThemeManager.single_color(self.fg_color, self.appearance_mode))
+
+    def set_theme(self, old_theme: dict):
+        """ child widgets detect the new fg_color themselves in their own set_theme call """
+
+        if ThemeManager.update_theme_bindings(self, self._theme_bindings, old_theme):
+            from ..widgets.widget_base_class import CTkBaseClass
+
+            CTkBaseClass.clear_master_color_cache()
+            super().configure(bg=ThemeManager.single_color(self.fg_color, self.appearance_mode))
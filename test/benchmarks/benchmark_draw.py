@@ -0,0 +1,69 @@
+""" Measures the time of a full draw() call (with color updates) for every widget class, once with the
+    compiled theme colors (interned tuples and the isinstance check in ThemeManager.single_color) and once
+    with the previous behaviour (color lists from json and the old type() == dispatch in single_color).
+    The difference is small, single_color still checks the type of the color on every call.
+
+    Usage: python benchmark_draw.py [draw_calls_per_widget] """
+
+import sys
+import time
+import customtkinter
+
+WIDGET_CLASSES = [customtkinter.CTkButton, customtkinter.CTkCheckBox, customtkinter.CTkComboBox, customtkinter.CTkEntry,
+                  customtkinter.CTkFrame, customtkinter.CTkLabel, customtkinter.CTkOptionMenu, customtkinter.CTkProgressBar,
+                  customtkinter.CTkRadioButton, customtkinter.CTkScrollbar, customtkinter.CTkSlider, customtkinter.CTkSwitch,
+                  customtkinter.CTkTextbox]
+
+
+def legacy_single_color(color, appearance_mode: int) -> str:
+    if type(color) == tuple or type(color) == list:
+        return color[appearance_mode]
+    else:
+        return color
+
+
+def benchmark_draw(root, draw_calls: int) -> dict:
+    results = {}
+
+    for widget_class in WIDGET_CLASSES:
+        widget = widget_class(root)
+        widget.pack()
+        root.update()
+
+        start_time = time.perf_counter()
+        for _ in range(draw_calls):
+            widget.draw(no_color_updates=False)
+        results[widget_class.__name__] = (time.perf_counter() - start_time) / draw_calls
+
+        widget.destroy()
+
+    return results
+
+
+def main():
+    draw_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    root = customtkinter.CTk()
+
+    # restore behaviour before the colors got compiled: lists from json and type dispatch with ==
+    compiled_single_color = customtkinter.ThemeManager.single_color
+    customtkinter.ThemeManager.single_color = staticmethod(legacy_single_color)
+    for key, color in customtkinter.ThemeManager.theme["color"].items():
+        if type(color) is tuple:
+            customtkinter.ThemeManager.theme["color"][key] = list(color)
+
+    legacy_results = benchmark_draw(root, draw_calls)
+
+    customtkinter.ThemeManager.single_color = compiled_single_color
+    customtkinter.ThemeManager.load_theme(customtkinter.ThemeManager.theme_name_or_path)
+
+    compiled_results = benchmark_draw(root, draw_calls)
+    root.destroy()
+
+    print(f"{'widget class':<20}{'before (us)':>14}{'after (us)':>14}{'change':>10}")
+    for class_name in compiled_results:
+        before, after = legacy_results[class_name] * 1e6, compiled_results[class_name] * 1e6
+        print(f"{class_name:<20}{before:>14.1f}{after:>14.1f}{(after - before) / before * 100:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+""" Breaks down the time of 'import customtkinter' by module (python -X importtime in a fresh
+    interpreter for every run) and measures the font loading paths of the FontManager:
+    private loading through fontconfig, install check with unchanged ~/.fonts and a full copy.
+
+    Usage: python benchmark_startup.py [runs] """
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+
+PACKAGE_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, PACKAGE_DIRECTORY)  # measure the working copy, like the import subprocesses do
+
+
+def measure_import(runs: int, code: str = "import customtkinter") -> dict:
+    """ returns the median of the cumulative import time in seconds for every customtkinter module imported by code """
+
+    samples = {}
+    for _ in range(runs):
+        result = subprocess.run((sys.executable, "-X", "importtime", "-c", code),
+                                cwd=PACKAGE_DIRECTORY, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+        # lines have the format: "import time: <self us> | <cumulative us> | <indented module name>"
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            self_time, cumulative_time, module_name = (part.strip() for part in line[len("import time:"):].split("|"))
+            if module_name.startswith("customtkinter") or module_name in ("tkinter", "darkdetect"):
+                samples.setdefault(module_name, []).append(int(cumulative_time) / 1e6)
+
+    return {name: sorted(times)[len(times) // 2] for name, times in samples.items()}
+
+
+def measure_font_loading(repetitions: int = 20) -> dict:
+    import customtkinter
+    font_manager = customtkinter.FontManager
+    font_path = os.path.join(PACKAGE_DIRECTORY, "customtkinter", "assets", "fonts", "Roboto", "Roboto-Regular.ttf")
+
+    results = {}
+    original_font_path, original_private_loading = font_manager.linux_font_path, font_manager.linux_private_loading
+    temporary_directory = tempfile.mkdtemp()
+
+    try:
+        start_time = time.perf_counter()
+        for _ in range(repetitions):
+            font_manager.linux_load_font_private(font_path)
+        results["private_loading"] = (time.perf_counter() - start_time) / repetitions
+
+        font_manager.linux_font_path = os.path.join(temporary_directory, "fonts")
+        start_time = time.perf_counter()
+        for _ in range(repetitions):
+            shutil.rmtree(font_manager.linux_font_path, ignore_errors=True)
+            font_manager.linux_install_font(font_path)
+        results["install_copy"] = (time.perf_counter() - start_time) / repetitions
+
+        start_time = time.perf_counter()
+        for _ in range(repetitions):
+            font_manager.linux_install_font(font_path)
+        results["install_unchanged"] = (time.perf_counter() - start_time) / repetitions
+
+    finally:
+        font_manager.linux_font_path, font_manager.linux_private_loading = original_font_path, original_private_loading
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+
+    return results
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(f"import time breakdown (median of {runs} runs, cumulative):")
+    for module_name, duration in sorted(measure_import(runs).items(), key=lambda item: -item[1]):
+        print(f"{module_name:<50} {duration * 1000:8.2f} ms")
+
+    if sys.platform.startswith("linux"):
+        print("\nfont loading (Roboto-Regular.ttf):")
+        for name, duration in measure_font_loading().items():
+            print(f"{name:<50} {duration * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
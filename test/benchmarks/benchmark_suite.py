@@ -0,0 +1,160 @@
+""" Startup and first frame benchmark suite. Measures in fresh interpreters:
+     - import time of customtkinter with a per-module breakdown (python -X importtime)
+     - construction time of CTk() and of N widgets of every widget class
+     - time from mainloop() to the first <Map> of the window and to the first idle after it
+     - peak RSS of the process
+    The medians over all runs are written as JSON, so results can be compared across releases.
+    Without a display, the suite starts Xvfb if it is installed.
+
+    Usage: python benchmark_suite.py [--widgets N] [--runs R] [--output results.json] """
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import subprocess
+
+from benchmark_startup import measure_import, PACKAGE_DIRECTORY
+
+WIDGET_CLASS_NAMES = ["CTkButton", "CTkCheckBox", "CTkComboBox", "CTkEntry", "CTkFrame", "CTkLabel", "CTkOptionMenu",
+                      "CTkProgressBar", "CTkRadioButton", "CTkScrollbar", "CTkSlider", "CTkSwitch", "CTkTextbox"]
+
+
+def get_peak_rss_kb():
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss // 1024 if sys.platform == "darwin" else peak_rss  # bytes on macOS, kilobytes on Linux
+
+
+def run_child(widgets_per_class: int):
+    """ one benchmark run in a fresh interpreter, prints the results as json """
+
+    start_time = time.perf_counter()
+    import customtkinter
+    results = {"import": time.perf_counter() - start_time}
+
+    start_time = time.perf_counter()
+    root = customtkinter.CTk()
+    results["ctk_construction"] = time.perf_counter() - start_time
+
+    results["construction"] = {}
+    for class_name in WIDGET_CLASS_NAMES:
+        widget_class = getattr(customtkinter, class_name)
+        frame = customtkinter.CTkFrame(root)
+        frame.pack(side="left")
+
+        start_time = time.perf_counter()
+        widgets = [widget_class(frame) for _ in range(widgets_per_class)]
+        results["construction"][class_name] = time.perf_counter() - start_time
+
+        for widget in widgets:
+            widget.pack()
+
+    def map_event(event):
+        if event.widget is root and "first_map" not in results:
+            results["first_map"] = time.perf_counter() - mainloop_start_time
+            root.after_idle(first_idle)
+
+    def first_idle():
+        results["first_idle"] = time.perf_counter() - mainloop_start_time
+        root.quit()
+
+    root.bind("<Map>", map_event, add="+")
+    mainloop_start_time = time.perf_counter()
+    root.mainloop()
+
+    results["peak_rss_kb"] = get_peak_rss_kb()
+    root.destroy()
+    print(json.dumps(results))
+
+
+def start_xvfb():
+    """ starts Xvfb on a free display number if there is no display, returns the process or None """
+
+    if os.environ.get("DISPLAY") or sys.platform == "darwin" or sys.platform.startswith("win"):
+        return None
+
+    if shutil.which("Xvfb") is None:
+        sys.exit("benchmark_suite: no display and Xvfb is not installed")
+
+    for display_number in range(99, 120):
+        if not os.path.exists(f"/tmp/.X11-unix/X{display_number}"):
+            process = subprocess.Popen(("Xvfb", f":{display_number}", "-screen", "0", "1920x1080x24", "-nolisten", "tcp"),
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            os.environ["DISPLAY"] = f":{display_number}"
+
+            for _ in range(50):  # wait until the server accepts connections
+                if os.path.exists(f"/tmp/.X11-unix/X{display_number}"):
+                    return process
+                time.sleep(0.1)
+
+            process.terminate()
+            sys.exit("benchmark_suite: Xvfb did not start")
+
+    sys.exit("benchmark_suite: no free display number for Xvfb")
+
+
+def median(values: list):
+    values = sorted(value for value in values if value is not None)
+    return values[len(values) // 2] if values else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="customtkinter startup and first frame benchmarks")
+    parser.add_argument("--widgets", type=int, default=100, help="widgets constructed per widget class")
+    parser.add_argument("--runs", type=int, default=3, help="number of fresh interpreters, the median is reported")
+    parser.add_argument("--output", help="json output file, printed to stdout if not given")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.widgets)
+        return
+
+    xvfb_process = start_xvfb()
+    try:
+        child_results = []
+        for _ in range(args.runs):
+            output = subprocess.run((sys.executable, os.path.abspath(__file__), "--child", "--widgets", str(args.widgets)),
+                                    cwd=PACKAGE_DIRECTORY, stdout=subprocess.PIPE, universal_newlines=True, check=True).stdout
+            child_results.append(json.loads(output.strip().splitlines()[-1]))
+
+        # widget modules are imported lazily on first access, so they are accessed here as well
+        import_modules = measure_import(args.runs, "import customtkinter; " +
+                                        "; ".join(f"customtkinter.{class_name}" for class_name in WIDGET_CLASS_NAMES))
+    finally:
+        if xvfb_process is not None:
+            xvfb_process.terminate()
+
+    import customtkinter  # working copy, benchmark_startup puts PACKAGE_DIRECTORY on sys.path
+
+    results = {"customtkinter_version": customtkinter.__version__,
+               "python_version": platform.python_version(),
+               "platform": sys.platform,
+               "widgets_per_class": args.widgets,
+               "runs": args.runs,
+               "import": {"total": median([result["import"] for result in child_results]),
+                          "modules": import_modules},
+               "ctk_construction": median([result["ctk_construction"] for result in child_results]),
+               "construction": {class_name: median([result["construction"][class_name] for result in child_results])
+                                for class_name in WIDGET_CLASS_NAMES},
+               "first_map": median([result.get("first_map") for result in child_results]),
+               "first_idle": median([result.get("first_idle") for result in child_results]),
+               "peak_rss_kb": median([result["peak_rss_kb"] for result in child_results])}
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
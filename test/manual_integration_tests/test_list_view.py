@@ -0,0 +1,48 @@
+import time
+import customtkinter
+
+customtkinter.set_appearance_mode("dark")
+
+app = customtkinter.CTk()
+app.title("test_list_view.py")
+app.grid_rowconfigure(0, weight=1)
+app.grid_columnconfigure((0, 1), weight=1)
+
+# 100000 rows from a sequence with the default rows (CTkLabel)
+data = [f"log line {i}" for i in range(100000)]
+list_view_1 = customtkinter.CTkListView(app, data=data)
+list_view_1.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+
+
+# 1000000 rows from a callback with custom rows
+def create_row(master):
+    return customtkinter.CTkCheckBox(master, text="")
+
+
+def update_row(row, index, item):
+    row.configure(text=item)
+    row.select() if index % 3 == 0 else row.deselect()
+
+
+list_view_2 = customtkinter.CTkListView(app, row_height=32, row_factory=create_row, update_row=update_row,
+                                        data_callback=lambda index: f"item {index}", row_count=1000000)
+list_view_2.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+
+
+def append_lines():
+    data.extend(f"appended line {len(data) + i}" for i in range(100))
+    list_view_1.see(len(data) - 1)
+    app.after(500, append_lines)
+
+
+def measure_scrolling():
+    start_time = time.perf_counter()
+    for i in range(1000):
+        list_view_2.yview("scroll", 1, "units")
+    print(f"1000 scroll steps: {time.perf_counter() - start_time:.3f}s, "
+          f"row widgets: {len(list_view_2.visible_rows) + len(list_view_2.free_rows)}")
+
+
+app.after(1000, measure_scrolling)
+app.after(2000, append_lines)
+app.mainloop()
@@ -0,0 +1,36 @@
+import time
+import customtkinter
+
+# test with scaling
+# customtkinter.set_widget_scaling(2)
+
+customtkinter.set_appearance_mode("dark")
+
+app = customtkinter.CTk()
+app.title("test_surface.py")
+app.grid_rowconfigure(1, weight=1)
+app.grid_columnconfigure(0, weight=1)
+
+clicked_label = customtkinter.CTkLabel(app, text="click a button")
+clicked_label.grid(row=0, column=0, columnspan=2, pady=10)
+
+surface = customtkinter.CTkSurface(app, width=800, height=500)
+surface.grid(row=1, column=0, padx=(10, 0), pady=10, sticky="nsew")
+scrollbar = customtkinter.CTkScrollbar(app, command=surface.yview)
+scrollbar.grid(row=1, column=1, padx=(0, 10), pady=10, sticky="ns")
+surface.configure(yscrollcommand=scrollbar.set)
+
+# 10000 virtual widgets: 100 rows with a label, a switch, a checkbox and 97 buttons
+start_time = time.perf_counter()
+for row in range(100):
+    customtkinter.CTkVirtualLabel(surface, x=10, y=10 + row * 36, width=60, text=f"row {row}", anchor="w")
+    customtkinter.CTkVirtualSwitch(surface, x=80, y=12 + row * 36, width=100, text="switch")
+    customtkinter.CTkVirtualCheckBox(surface, x=190, y=12 + row * 36, width=100, text="check")
+    for column in range(97):
+        customtkinter.CTkVirtualButton(surface, x=300 + column * 60, y=10 + row * 36, width=50, text=f"{column}",
+                                       command=lambda r=row, c=column: clicked_label.configure(text=f"clicked {r}, {c}"))
+print(f"creation of {len(surface.virtual_widgets)} virtual widgets: {time.perf_counter() - start_time:.3f}s")
+
+app.after(2000, lambda: customtkinter.set_appearance_mode("light"))
+app.after(3000, lambda: customtkinter.set_appearance_mode("dark"))
+app.mainloop()
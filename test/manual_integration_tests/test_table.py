@@ -0,0 +1,49 @@
+import time
+import random
+import customtkinter
+
+# test with scaling
+# customtkinter.set_widget_scaling(2)
+
+customtkinter.set_appearance_mode("dark")
+
+app = customtkinter.CTk()
+app.title("test_table.py")
+app.grid_rowconfigure(0, weight=1)
+app.grid_columnconfigure(0, weight=1)
+
+table = customtkinter.CTkTable(app, width=600, height=500,
+                               columns=[("id", int), ("name", str), ("value", float)],
+                               column_widths=[80, 300, 150])
+table.grid(row=0, column=0, columnspan=3, padx=10, pady=10, sticky="nsew")
+
+# 50000 rows, click a header to sort by the column
+start_time = time.perf_counter()
+table.append_rows([(i, f"name {random.randrange(100000)}", random.random() * 1000) for i in range(50000)])
+print(f"append of 50000 rows: {time.perf_counter() - start_time:.3f}s")
+
+
+def append_rows():
+    start = table.store.row_count
+    table.append_rows([(i, f"name {random.randrange(100000)}", random.random() * 1000) for i in range(start, start + 1000)])
+
+
+def filter_rows():
+    start_time = time.perf_counter()
+    table.filter("value", low=100, high=200)
+    table.filter("name", contains="7")
+    print(f"filter: {time.perf_counter() - start_time:.3f}s, {table.get_view_length()} rows")
+
+
+def clear_filter():
+    table.filter("value")
+    table.filter("name")
+
+
+customtkinter.CTkButton(app, text="append 1000 rows", command=append_rows).grid(row=1, column=0, pady=10)
+customtkinter.CTkButton(app, text="filter", command=filter_rows).grid(row=1, column=1, pady=10)
+customtkinter.CTkButton(app, text="clear filter", command=clear_filter).grid(row=1, column=2, pady=10)
+
+app.after(2000, lambda: customtkinter.set_appearance_mode("light"))
+app.after(3000, lambda: customtkinter.set_appearance_mode("dark"))
+app.mainloop()
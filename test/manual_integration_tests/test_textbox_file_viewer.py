@@ -0,0 +1,45 @@
+import os
+import sys
+import time
+import tempfile
+import customtkinter
+
+# test with scaling
+# customtkinter.set_widget_scaling(2)
+
+customtkinter.set_appearance_mode("dark")
+
+# open the file given as argument or a generated file with 5 million lines
+if len(sys.argv) > 1:
+    path = sys.argv[1]
+else:
+    path = os.path.join(tempfile.gettempdir(), "test_textbox_file_viewer.log")
+    if not os.path.exists(path):
+        with open(path, "w") as file:
+            for i in range(5_000_000):
+                file.write(f"{i:>8} INFO worker-{i % 16} processed request {i * 7919 % 100000}\n")
+
+app = customtkinter.CTk()
+app.title("test_textbox_file_viewer.py")
+app.grid_rowconfigure(0, weight=1)
+app.grid_columnconfigure(0, weight=1)
+
+textbox = customtkinter.CTkTextbox(app, width=800, height=500, wrap="none")
+textbox.grid(row=0, column=0, padx=(10, 0), pady=10, sticky="nsew")
+scrollbar = customtkinter.CTkScrollbar(app, command=textbox.yview)
+scrollbar.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="ns")
+textbox.configure(yscrollcommand=scrollbar.set)
+
+start_time = time.perf_counter()
+textbox.open_file(path)
+print(f"open_file: {time.perf_counter() - start_time:.3f}s")
+
+
+def print_index_progress():
+    print(f"indexed lines: {textbox.get_file_line_count()}, complete: {textbox.file_index_complete}")
+    if not textbox.file_index_complete:
+        app.after(500, print_index_progress)
+
+
+print_index_progress()
+app.mainloop()
@@ -0,0 +1,43 @@
+import time
+import customtkinter
+
+# test with scaling
+# customtkinter.set_widget_scaling(2)
+
+customtkinter.set_appearance_mode("dark")
+
+app = customtkinter.CTk()
+app.title("test_textbox_highlighter.py")
+app.grid_rowconfigure(0, weight=1)
+app.grid_columnconfigure(0, weight=1)
+
+# highlighting of a config file with 20000 lines, typing should not be delayed
+highlighter = customtkinter.CTkRegexHighlighter({"section": r"^\[.*\]",
+                                                 "comment": r"#.*",
+                                                 "key": r"^\s*[\w.]+(?=\s*=)",
+                                                 "string": r'"[^"]*"',
+                                                 "number": r"\b\d+(\.\d+)?\b"},
+                                                {"section": ("#1F6AA5", "#3B8ED0"),
+                                                 "comment": ("gray50", "gray55"),
+                                                 "key": ("#8E44AD", "#C39BD3"),
+                                                 "string": ("#1E8449", "#7DCEA0"),
+                                                 "number": ("#B9770E", "#F5B041")})
+
+textbox = customtkinter.CTkTextbox(app, width=700, height=500, wrap="none", highlighter=highlighter)
+textbox.grid(row=0, column=0, padx=(10, 0), pady=10, sticky="nsew")
+scrollbar = customtkinter.CTkScrollbar(app, command=textbox.yview)
+scrollbar.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="ns")
+textbox.configure(yscrollcommand=scrollbar.set)
+
+lines = []
+for i in range(2000):
+    lines += [f"[section_{i}]", f"# settings of section {i}", f"name = \"service {i}\"", f"port = {8000 + i}",
+              f"timeout = {i / 10}", "enabled = true", "retries = 3", "path = \"/var/lib/app\"", "", ""]
+
+start_time = time.perf_counter()
+textbox.insert("1.0", "\n".join(lines))
+print(f"insert of {len(lines)} lines: {time.perf_counter() - start_time:.3f}s")
+
+app.after(3000, lambda: customtkinter.set_appearance_mode("light"))
+app.after(5000, lambda: customtkinter.set_appearance_mode("dark"))
+app.mainloop()
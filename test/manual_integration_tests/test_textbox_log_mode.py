@@ -0,0 +1,42 @@
+import time
+import threading
+import customtkinter
+
+# test with scaling
+# customtkinter.set_widget_scaling(2)
+
+customtkinter.set_appearance_mode("dark")
+
+app = customtkinter.CTk()
+app.title("test_textbox_log_mode.py")
+app.grid_rowconfigure(0, weight=1)
+app.grid_columnconfigure(0, weight=1)
+
+# scroll up while the worker is logging, the view should stay in place until it's scrolled to the bottom again
+textbox = customtkinter.CTkTextbox(app, width=600, height=400, log_mode=True, max_lines=10000, state="disabled")
+textbox.grid(row=0, column=0, padx=(10, 0), pady=10, sticky="nsew")
+scrollbar = customtkinter.CTkScrollbar(app, command=textbox.yview)
+scrollbar.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="ns")
+textbox.configure(yscrollcommand=scrollbar.set)
+
+label = customtkinter.CTkLabel(app, text="")
+label.grid(row=1, column=0, columnspan=2, pady=10)
+
+
+def worker():
+    line = 0
+    while True:
+        for _ in range(100):  # about 10000 lines per second
+            textbox.append(f"{time.time():.4f} build step {line}\n")
+            line += 1
+        time.sleep(0.01)
+
+
+def update_label():
+    label.configure(text=f"lines: {textbox.textbox.index('end-1c').split('.')[0]}")
+    app.after(200, update_label)
+
+
+threading.Thread(target=worker, daemon=True).start()
+update_label()
+app.mainloop()
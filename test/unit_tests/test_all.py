@@ -1,7 +1,23 @@
 from test_ctk import TestCTk
 from test_ctk_toplevel import TestCTkToplevel
 from test_ctk_button import TestCTkButton
+from test_appearance_mode_tracker import TestAppearanceModeTracker
+from test_draw_scheduling import TestDrawScheduling
+from test_tracker_statistics import TestTrackerStatistics
+from test_color_manager import TestColorManager
+from test_table_column_store import TestTableColumnStore
+from test_surface_hit_grid import TestSurfaceHitGrid
+from test_stale_callbacks import TestStaleCallbacks
+from test_textbox_helpers import TestTextboxHelpers
 
 TestCTk().main()
 TestCTkToplevel().main()
 TestCTkButton().main()
+TestAppearanceModeTracker().main()
+TestDrawScheduling().main()
+TestTrackerStatistics().main()
+TestColorManager().main()
+TestTableColumnStore().main()
+TestSurfaceHitGrid().main()
+TestStaleCallbacks().main()
+TestTextboxHelpers().main()
@@ -0,0 +1,65 @@
+import customtkinter
+
+
+class TestAppearanceModeTracker():
+    def __init__(self):
+        self.listener = customtkinter.ManualAppearanceModeListener()
+        customtkinter.AppearanceModeTracker.set_listener(self.listener)
+        customtkinter.set_appearance_mode("system")
+
+        self.root_ctk = customtkinter.CTk()
+        self.ctk_button = customtkinter.CTkButton(self.root_ctk)
+        self.ctk_button.pack(padx=20, pady=20)
+        self.root_ctk.title(self.__class__.__name__)
+
+    def clean(self):
+        customtkinter.AppearanceModeTracker.set_listener(None)
+        self.root_ctk.quit()
+        self.root_ctk.withdraw()
+
+    def main(self):
+        self.execute_tests()
+        self.root_ctk.mainloop()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+        start_time = 0
+
+        self.root_ctk.after(start_time, self.test_listener_dark)
+        start_time += 300
+
+        self.root_ctk.after(start_time, self.test_listener_dark_result)
+        start_time += 100
+
+        self.root_ctk.after(start_time, self.test_listener_ignored_when_set_by_user)
+        start_time += 300
+
+        self.root_ctk.after(start_time, self.test_listener_ignored_when_set_by_user_result)
+        start_time += 100
+
+        self.root_ctk.after(start_time, self.clean)
+
+    def test_listener_dark(self):
+        print(" -> test_listener_dark: ", end="")
+        assert customtkinter.AppearanceModeTracker.listener_is_active()
+        self.listener.report("Dark")
+
+    def test_listener_dark_result(self):
+        assert customtkinter.get_appearance_mode() == "Dark"
+        assert self.ctk_button._appearance_mode == 1
+        print("successful")
+
+    def test_listener_ignored_when_set_by_user(self):
+        print(" -> test_listener_ignored_when_set_by_user: ", end="")
+        customtkinter.set_appearance_mode("dark")
+        self.listener.report("Light")
+
+    def test_listener_ignored_when_set_by_user_result(self):
+        assert customtkinter.get_appearance_mode() == "Dark"
+        customtkinter.set_appearance_mode("system")
+        assert customtkinter.get_appearance_mode() == "Light"
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestAppearanceModeTracker().main()
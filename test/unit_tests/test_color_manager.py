@@ -0,0 +1,71 @@
+import customtkinter
+
+
+class TestColorManager():
+    def __init__(self):
+        self.color_manager = customtkinter.ColorManager
+
+    def clean(self):
+        self.color_manager.clear_cache()
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+        self.test_hex_colors()
+        self.test_color_names()
+        self.test_transparent()
+        self.test_blend_and_multiply()
+        self.clean()
+
+    def test_hex_colors(self):
+        print(" -> test_hex_colors: ", end="")
+        assert self.color_manager.to_rgb("#1f6aa5") == (31, 106, 165)
+        assert self.color_manager.to_rgb("#fff") == (255, 255, 255)
+        assert self.color_manager.to_rgb("#ffff00000000") == (255, 0, 0)
+        assert self.color_manager.to_rgb("1f6aa5") == (31, 106, 165)
+        assert self.color_manager.to_hex("#FFF") == "#ffffff"
+
+        for invalid_color in ("#12345", "#gggggg", "123"):
+            try:
+                self.color_manager.to_rgb(invalid_color)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"{invalid_color} was accepted")
+        print("successful")
+
+    def test_color_names(self):
+        print(" -> test_color_names: ", end="")
+        assert self.color_manager.to_rgb("gray10") == (26, 26, 26)
+        assert self.color_manager.to_rgb("Navy Blue") == (0, 0, 128)  # names are case and space insensitive
+        assert self.color_manager.to_hex("white") == "#ffffff"
+        assert customtkinter.ThemeManager.hex2rgb("gray10") == (26, 26, 26)
+        print("successful")
+
+    def test_transparent(self):
+        print(" -> test_transparent: ", end="")
+        try:
+            self.color_manager.to_rgb("transparent")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("transparent was resolved to a color")
+
+        assert customtkinter.ThemeManager.get_minimal_darker("transparent") is None
+        assert customtkinter.ThemeManager.get_minimal_darker(None) is None
+        assert customtkinter.ThemeManager.get_minimal_darker("#101010") == "#0f1010"
+        assert customtkinter.ThemeManager.linear_blend(None, "#ffffff", 0.5) is None
+        print("successful")
+
+    def test_blend_and_multiply(self):
+        print(" -> test_blend_and_multiply: ", end="")
+        assert self.color_manager.linear_blend("black", "#ffffff", 0.5) == "#808080"
+        assert self.color_manager.multiply("#808080", 0.5) == "#404040"
+        assert self.color_manager.multiply("#808080", 3) == "#ffffff"
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestColorManager().main()
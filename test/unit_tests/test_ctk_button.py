@@ -25,6 +25,12 @@ class TestCTkButton():
         self.root_ctk.after(start_time, self.test_iconify)
         start_time += 1500
 
+        self.root_ctk.after(start_time, self.test_canvas_text)
+        start_time += 500
+
+        self.root_ctk.after(start_time, self.test_canvas_text_label)
+        start_time += 500
+
         self.root_ctk.after(start_time, self.clean)
 
     def test_iconify(self):
@@ -33,6 +39,44 @@ class TestCTkButton():
         self.root_ctk.after(100, self.root_ctk.deiconify)
         print("successful")
 
+    def test_canvas_text(self):
+        print(" -> test_canvas_text: ", end="")
+        text_var = customtkinter.StringVar(value="text")
+        button = customtkinter.CTkButton(self.root_ctk, textvariable=text_var, canvas_text=True)
+        button.pack()
+        self.root_ctk.update()
+
+        assert button.winfo_children() == [button.canvas]
+        assert button.canvas.itemcget("text_parts", "text") == "text"
+
+        text_var.set("new text")
+        assert button.canvas.itemcget("text_parts", "text") == "new text"
+
+        button.configure(text="")
+        button.configure(textvariable=None)
+        assert button.canvas.find_withtag("text_parts") == ()
+        button.destroy()
+        print("successful")
+
+    def test_canvas_text_label(self):
+        print(" -> test_canvas_text_label: ", end="")
+        text_var = customtkinter.StringVar(value="text")
+        label = customtkinter.CTkLabel(self.root_ctk, textvariable=text_var, canvas_text=True, cursor="hand2", padx=5,
+                                       wraplength=80)
+        label.pack()
+        self.root_ctk.update()
+
+        assert label.canvas.cget("cursor") == "hand2"
+        assert label.canvas.itemcget("text_parts", "text") == "text"
+        assert label.canvas.itemcget("text_parts", "width") == "80"
+
+        text_var.set("new text")
+        assert label.canvas.itemcget("text_parts", "text") == "new text"
+
+        label.destroy()
+        assert text_var.trace_info() == []
+        print("successful")
+
 
 if __name__ == "__main__":
     TestCTkButton().main()
@@ -0,0 +1,116 @@
+import customtkinter
+
+
+class TestDrawScheduling():
+    def __init__(self):
+        self.root_ctk = customtkinter.CTk()
+        self.root_ctk.title(self.__class__.__name__)
+
+    def clean(self):
+        self.root_ctk.quit()
+        self.root_ctk.withdraw()
+
+    def main(self):
+        self.execute_tests()
+        self.root_ctk.mainloop()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+        start_time = 0
+
+        self.root_ctk.after(start_time, self.test_deferred_first_draw)
+        start_time += 500
+
+        self.root_ctk.after(start_time, self.test_widget_batch)
+        start_time += 500
+
+        self.root_ctk.after(start_time, self.test_master_batch)
+        start_time += 500
+
+        self.root_ctk.after(start_time, self.clean)
+
+    @staticmethod
+    def count_draws(widget) -> list:
+        """ returns a list which gets the no_color_updates argument of every draw that is not suppressed """
+
+        draws = []
+        suppress_draw = widget.suppress_draw
+
+        def counting_suppress_draw(no_color_updates=False):
+            suppressed = suppress_draw(no_color_updates)
+            if not suppressed:
+                draws.append(no_color_updates)
+            return suppressed
+
+        widget.suppress_draw = counting_suppress_draw
+        return draws
+
+    def test_deferred_first_draw(self):
+        print(" -> test_deferred_first_draw: ", end="")
+        button = customtkinter.CTkButton(self.root_ctk, width=120, height=32)
+        draws = self.count_draws(button)
+
+        button.configure(text="not mapped")  # configure of an unmapped widget doesn't draw either
+        self.root_ctk.update()
+        assert draws == [] and button._draw_deferred
+
+        button.pack()
+        self.root_ctk.update()
+        assert draws == [False], draws  # exactly one draw with color updates when the widget gets mapped
+        assert not button._draw_deferred
+
+        button.destroy()
+        print("successful")
+
+    def test_widget_batch(self):
+        print(" -> test_widget_batch: ", end="")
+        button = customtkinter.CTkButton(self.root_ctk, width=120, height=32)
+        button.pack()
+        self.root_ctk.update()
+        draws = self.count_draws(button)
+
+        with button.batch():
+            button.draw(no_color_updates=True)
+            button.configure(fg_color="red")  # suppressed draw with color updates
+            button.draw(no_color_updates=True)
+            with button.batch():
+                button.configure(corner_radius=4)
+            assert draws == []  # nested block doesn't draw at its end
+
+        assert draws == [False], draws  # one draw at the end, with the color updates of the suppressed draws
+        assert button.canvas.itemcget("inner_parts", "fill") == "red"
+
+        button.destroy()
+        print("successful")
+
+    def test_master_batch(self):
+        print(" -> test_master_batch: ", end="")
+        frame = customtkinter.CTkFrame(self.root_ctk)
+        frame.pack()
+        buttons = [customtkinter.CTkButton(frame, width=120, height=32) for _ in range(3)]
+        for button in buttons:
+            button.pack()
+        outside_button = customtkinter.CTkButton(self.root_ctk, width=120, height=32)
+        outside_button.pack()
+        self.root_ctk.update()
+
+        draws = [self.count_draws(button) for button in buttons]
+        outside_draws = self.count_draws(outside_button)
+
+        with customtkinter.batch(frame):
+            for button in buttons:
+                button.draw(no_color_updates=True)
+                button.draw(no_color_updates=True)
+            outside_button.draw(no_color_updates=True)
+            assert draws == [[], [], []]
+            assert outside_draws == [True]  # widgets outside of master are not batched
+
+        assert draws == [[True], [True], [True]], draws  # one draw per widget, without color updates as requested
+
+        frame.destroy()
+        outside_button.destroy()
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestDrawScheduling().main()
@@ -0,0 +1,95 @@
+import customtkinter
+
+
+class PathWidget:
+    """ has the path, master and winfo_viewable() of a tkinter widget """
+
+    def __init__(self, path: str, master=None):
+        self.path = path
+        self.master = master
+        self.calls = []
+
+    def __str__(self):
+        return self.path
+
+    def winfo_viewable(self):
+        return 1
+
+    def set_appearance_mode(self, mode_string):
+        self.calls.append(mode_string)
+
+
+class TestStaleCallbacks():
+    def __init__(self):
+        self.tracker = customtkinter.AppearanceModeTracker
+        self.root = PathWidget(".")
+        self.frame = PathWidget(".!frame", self.root)
+        self.frame_2 = PathWidget(".!frame2", self.root)
+        self.button = PathWidget(".!frame.!ctkbutton", self.frame)
+        self.button_2 = PathWidget(".!frame2.!ctkbutton", self.frame_2)
+
+    def clean(self):
+        self.tracker.stale_callbacks.clear()
+        self.tracker.stale_widgets.clear()
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        self.test_path_is_inside()
+        self.test_update_stale_callbacks()
+        self.test_remove()
+        self.clean()
+
+    def add_stale(self, *widgets):
+        for widget in widgets:
+            self.tracker.index_stale_callback(widget, widget.set_appearance_mode)
+
+    def test_path_is_inside(self):
+        print(" -> test_path_is_inside: ", end="")
+        path_is_inside = self.tracker.path_is_inside
+        assert path_is_inside(".!frame.!ctkbutton", {"."})
+        assert path_is_inside(".", {"."})
+        assert not path_is_inside(".", {".!frame"})
+        assert path_is_inside(".!frame", {".!frame"})
+        assert not path_is_inside(".!frame2", {".!frame"})  # no prefix match of the name
+        assert not path_is_inside(".!frame2.!ctkbutton", {".!frame"})
+        assert path_is_inside(".!frame.!ctkframe.!ctkbutton", {".!frame"})  # nested ancestor
+        assert path_is_inside(".!frame.!ctkframe.!ctkbutton", {".!toplevel", ".!frame.!ctkframe"})
+        print("successful")
+
+    def test_update_stale_callbacks(self):
+        print(" -> test_update_stale_callbacks: ", end="")
+        self.add_stale(self.frame, self.button, self.button_2)
+        assert set(self.tracker.stale_widgets) == {".", ".!frame", ".!frame2"}
+
+        self.tracker.mapped_widget_paths = {".!frame"}
+        self.tracker.update_stale_callbacks()
+        assert len(self.frame.calls) == 1 and len(self.button.calls) == 1
+        assert self.button_2.calls == []
+        assert list(self.tracker.stale_callbacks) == [self.button_2]
+
+        self.tracker.mapped_widget_paths = {".!frame2.!ctkbutton"}  # the widget itself got mapped
+        self.tracker.update_stale_callbacks()
+        assert len(self.button_2.calls) == 1
+        assert self.tracker.stale_callbacks == {} and self.tracker.stale_widgets == {}
+        print("successful")
+
+    def test_remove(self):
+        print(" -> test_remove: ", end="")
+        self.add_stale(self.button, self.button_2)
+        self.tracker.remove(self.button.set_appearance_mode)
+
+        assert list(self.tracker.stale_callbacks) == [self.button_2]
+        assert list(self.tracker.stale_widgets) == [".!frame2"]
+
+        self.tracker.mapped_widget_paths = {"."}
+        self.tracker.update_stale_callbacks()
+        assert len(self.button.calls) == 1  # only the call of test_update_stale_callbacks
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestStaleCallbacks().main()
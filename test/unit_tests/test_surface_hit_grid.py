@@ -0,0 +1,113 @@
+from customtkinter.widgets.ctk_surface import SurfaceHitGrid, CTkSurfaceCanvasView
+
+
+class Area:
+    """ position and size like a virtual widget """
+
+    def __init__(self, x, y, width, height):
+        self.x, self.y, self.width, self.height = x, y, width, height
+
+
+class RecordingCanvas:
+    """ records the calls the canvas view makes to the shared canvas """
+
+    def __init__(self):
+        self.next_item_id = 0
+        self.calls = []
+
+    def create_rectangle(self, *coordinates, **kwargs):
+        self.next_item_id += 1
+        self.calls.append(("create_rectangle", self.next_item_id, coordinates))
+        return self.next_item_id
+
+    def coords(self, item_id, *coordinates):
+        self.calls.append(("coords", item_id, coordinates))
+
+    def delete(self, *item_ids):
+        self.calls.append(("delete", item_ids))
+
+
+class TestSurfaceHitGrid():
+    def __init__(self):
+        self.hit_grid = SurfaceHitGrid(100)
+
+    def clean(self):
+        self.hit_grid = SurfaceHitGrid(100)
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        self.test_cell_boundaries()
+        self.test_overlapping_widgets()
+        self.test_remove()
+        self.test_canvas_view_tags()
+        self.clean()
+
+    def test_cell_boundaries(self):
+        print(" -> test_cell_boundaries: ", end="")
+        area = Area(90, 190, 20, 20)  # in the four cells around (100, 200)
+        self.hit_grid.add(area)
+
+        assert sorted(self.hit_grid.cells) == [(0, 1), (0, 2), (1, 1), (1, 2)]
+        assert self.hit_grid.widget_at(90, 190) is area
+        assert self.hit_grid.widget_at(99.5, 199.5) is area
+        assert self.hit_grid.widget_at(100, 200) is area
+        assert self.hit_grid.widget_at(109.9, 209.9) is area
+        assert self.hit_grid.widget_at(110, 200) is None  # right edge is outside
+        assert self.hit_grid.widget_at(89.9, 200) is None
+        print("successful")
+
+    def test_overlapping_widgets(self):
+        print(" -> test_overlapping_widgets: ", end="")
+        lower, upper = Area(0, 0, 60, 60), Area(40, 40, 60, 60)
+        self.hit_grid.add(lower)
+        self.hit_grid.add(upper)
+
+        assert self.hit_grid.widget_at(50, 50) is upper  # the last added widget is on top
+        assert self.hit_grid.widget_at(30, 30) is lower
+        assert self.hit_grid.widget_at(70, 70) is upper
+        assert set(self.hit_grid.widgets_in(0, 0, 99, 99)) == {lower, upper}
+        print("successful")
+
+    def test_remove(self):
+        print(" -> test_remove: ", end="")
+        self.clean()
+        lower, upper = Area(0, 0, 60, 60), Area(40, 40, 120, 20)
+        self.hit_grid.add(lower)
+        self.hit_grid.add(upper)
+
+        self.hit_grid.remove(upper)
+        assert self.hit_grid.widget_at(50, 50) is lower
+        assert self.hit_grid.widget_at(150, 50) is None
+        assert list(self.hit_grid.cells) == [(0, 0)]  # empty cells are deleted
+
+        self.hit_grid.remove(lower)
+        assert self.hit_grid.cells == {}
+        print("successful")
+
+    def test_canvas_view_tags(self):
+        print(" -> test_canvas_view_tags: ", end="")
+        canvas = RecordingCanvas()
+        canvas_view = CTkSurfaceCanvasView(canvas)
+        canvas_view.x, canvas_view.y = 100, 200
+
+        border = canvas_view.create_rectangle(0, 0, 10, 10, tags=("border_parts", "frame"))
+        inner = canvas_view.create_rectangle(1, 1, 9, 9, tags="inner_parts")
+        assert canvas.calls[0] == ("create_rectangle", border, (100, 200, 110, 210))  # shifted by the position
+        assert canvas_view.find_withtag("frame") == (border,)
+        assert canvas_view.gettags("border_parts") == ("border_parts", "frame")
+
+        canvas_view.coords("inner_parts", 2, 2, 8, 8)
+        assert canvas.calls[-1] == ("coords", inner, (102, 202, 108, 208))
+
+        canvas_view.delete("frame")
+        assert canvas.calls[-1] == ("delete", (border,))
+        assert canvas_view.find_withtag("border_parts") == () and canvas_view.find_withtag("inner_parts") == (inner,)
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestSurfaceHitGrid().main()
@@ -0,0 +1,48 @@
+from customtkinter.widgets.ctk_table import TableColumnStore
+
+
+class TestTableColumnStore():
+    def __init__(self):
+        self.store = TableColumnStore([str, int])
+
+    def clean(self):
+        self.store = TableColumnStore([str, int])
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+        self.store.append_rows([("b", 1), ("a", 2), ("b", 3), ("a", 4)])
+
+        self.test_sort_index()
+        self.test_descending_ties()
+        self.test_merge_appended_rows()
+        self.clean()
+
+    def test_sort_index(self):
+        print(" -> test_sort_index: ", end="")
+        assert list(self.store.get_sort_index(0)) == [1, 3, 0, 2]
+        assert list(self.store.range_rows(1, 2, 3)) == [1, 2]
+        print("successful")
+
+    def test_descending_ties(self):
+        print(" -> test_descending_ties: ", end="")
+        assert list(self.store.get_sort_index(0, descending=True)) == [0, 2, 1, 3]  # equal values keep insertion order
+        assert list(self.store.sort_rows(0, [3, 2, 1, 0], descending=True)) == [2, 0, 3, 1]
+        print("successful")
+
+    def test_merge_appended_rows(self):
+        print(" -> test_merge_appended_rows: ", end="")
+        descending_view = self.store.get_sort_index(0, descending=True)
+        self.store.append_rows([("a", 5), ("c", 6), ("b", 7)])
+
+        assert list(self.store.get_sort_index(0)) == [1, 3, 4, 0, 2, 6, 5]
+        new_rows = self.store.sort_rows(0, range(4, 7), descending=True)
+        merged_view = self.store.merge_rows(0, descending_view, new_rows, descending=True)
+        assert list(merged_view) == list(self.store.get_sort_index(0, descending=True)) == [5, 0, 2, 6, 1, 3, 4]
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestTableColumnStore().main()
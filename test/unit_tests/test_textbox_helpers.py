@@ -0,0 +1,92 @@
+import os
+import mmap
+import array
+import tempfile
+import threading
+
+from customtkinter.widgets.ctk_textbox import CTkTextbox, HighlightLineQueue
+
+
+class TestTextboxHelpers():
+    def __init__(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+
+    def clean(self):
+        self.temporary_directory.cleanup()
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        self.test_trim_line_count()
+        self.test_line_index()
+        self.test_line_index_stopped()
+        self.test_highlight_queue()
+        self.clean()
+
+    def test_trim_line_count(self):
+        print(" -> test_trim_line_count: ", end="")
+        assert CTkTextbox.get_trim_line_count(5000, None) == 0
+        assert CTkTextbox.get_trim_line_count(1000, 1000) == 0
+        assert CTkTextbox.get_trim_line_count(1100, 1000) == 0  # up to 10% more lines are kept
+        assert CTkTextbox.get_trim_line_count(1101, 1000) == 101  # then trimmed back to max_lines at once
+        assert CTkTextbox.get_trim_line_count(10, 5) == 5
+        print("successful")
+
+    def index_file(self, content: bytes, chunk_size: int):
+        path = os.path.join(self.temporary_directory.name, "lines.txt")
+        with open(path, "wb") as f:
+            f.write(content)
+
+        line_offsets = array.array("q", [0])
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as file_mmap:
+            complete = CTkTextbox.index_line_offsets(file_mmap, line_offsets, threading.Event(), chunk_size)
+            lines = [CTkTextbox.decode_file_lines(file_mmap[start:end], "utf-8")
+                     for start, end in zip(line_offsets, list(line_offsets[1:]) + [len(content)])]
+        return complete, list(line_offsets), lines
+
+    def test_line_index(self):
+        print(" -> test_line_index: ", end="")
+        content = b"first\r\nsecond\r\n\r\nlast without line end"
+
+        for chunk_size in (3, 7, 1024):  # line ends at and across chunk borders
+            complete, line_offsets, lines = self.index_file(content, chunk_size)
+            assert complete
+            assert line_offsets == [0, 7, 15, 17], line_offsets
+            assert lines == ["first", "second", "", "last without line end"], lines
+
+        complete, line_offsets, lines = self.index_file(b"a\nb\n", 1024)
+        assert line_offsets == [0, 2, 4]  # the offset after the final line end is the end of the file
+        assert lines[:2] == ["a", "b"]
+        print("successful")
+
+    def test_line_index_stopped(self):
+        print(" -> test_line_index_stopped: ", end="")
+        stop_event = threading.Event()
+        stop_event.set()
+        line_offsets = array.array("q", [0])
+        assert not CTkTextbox.index_line_offsets(b"a\nb\n", line_offsets, stop_event, 1024)
+        assert list(line_offsets) == [0]
+        print("successful")
+
+    def test_highlight_queue(self):
+        print(" -> test_highlight_queue: ", end="")
+        highlight_queue = HighlightLineQueue()
+        highlight_queue.add(1, 100)
+        highlight_queue.add(50, 150)  # overlapping ranges queue every line once
+        highlight_queue.add(-3, 2)
+        highlight_queue.add(120, 121, visible=True)
+        assert len(highlight_queue.lines) == 150
+
+        assert {highlight_queue.pop(), highlight_queue.pop()} == {120, 121}  # visible lines first
+        popped_lines = []
+        while highlight_queue:
+            popped_lines.append(highlight_queue.pop())
+        assert sorted(popped_lines) == [line for line in range(1, 151) if line not in (120, 121)]
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestTextboxHelpers().main()
@@ -0,0 +1,75 @@
+import customtkinter
+
+
+class TestTrackerStatistics():
+    def __init__(self):
+        self.statistics = customtkinter.TrackerStatistics
+        self.log_entries = []
+
+    def clean(self):
+        self.statistics.log_hook = None
+        self.statistics.reset()
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+        self.statistics.reset()
+        self.statistics.log_hook = self.log_entries.append
+
+        self.test_dispatch_pass()
+        self.test_failure()
+        self.test_slowest_callbacks()
+        self.clean()
+
+    def callback(self, value):
+        self.last_value = value
+
+    def failing_callback(self, value):
+        raise ValueError(value)
+
+    def test_dispatch_pass(self):
+        print(" -> test_dispatch_pass: ", end="")
+        self.statistics.begin_pass("test")
+        self.statistics.dispatch("test", self.callback, 1)
+        self.statistics.dispatch("test", self.callback, 2)
+        self.statistics.end_pass("test")
+
+        assert self.last_value == 2
+        statistics = customtkinter.get_tracker_stats()["test"]
+        assert statistics["passes"] == 1
+        assert statistics["classes"]["TestTrackerStatistics"]["count"] == 2
+        assert self.log_entries[-1]["event"] == "pass" and self.log_entries[-1]["callbacks"] == 2
+        print("successful")
+
+    def test_failure(self):
+        print(" -> test_failure: ", end="")
+        self.statistics.dispatch("test", self.failing_callback, "error")
+
+        class_statistics = customtkinter.get_tracker_stats()["test"]["classes"]["TestTrackerStatistics"]
+        assert class_statistics["failures"] == 1
+        assert class_statistics["last_exception"] == repr(ValueError("error"))  # no exception object with traceback
+        assert self.log_entries[-1]["event"] == "failure"
+
+        try:
+            self.statistics.dispatch("test", self.failing_callback, "error", raise_exceptions=True)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("exception was not raised again")
+        print("successful")
+
+    def test_slowest_callbacks(self):
+        print(" -> test_slowest_callbacks: ", end="")
+        for i in range(self.statistics.slowest_callbacks_count + 5):
+            self.statistics.record("test", self.callback, duration=i)
+
+        slowest_callbacks = customtkinter.get_tracker_stats()["slowest_callbacks"]
+        assert len(slowest_callbacks) == self.statistics.slowest_callbacks_count
+        assert slowest_callbacks[0]["duration"] == self.statistics.slowest_callbacks_count + 4
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestTrackerStatistics().main()